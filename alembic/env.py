@@ -21,10 +21,15 @@ if config.config_file_name is not None:
 from app.models.animal import Animal
 from app.models.user import User
 from app.models.moneyTransaction import MoneyTransaction
-from app.models.attendance import AttendanceLog
+from app.models.attendance import AttendanceLog, AttendanceSummary
 from app.models.birthday import BirthdayReward
 from app.models.minigameattempts import MinigameAttempt
 from app.models.userminigameplays import UserMinigamePlay
+from app.models.care_daily_count import CareDailyCount
+from app.models.ledger_snapshot import LedgerSnapshot
+from app.models.minigame_leaderboard import MinigameLeaderboard
+from app.models.idempotency_key import IdempotencyKey
+from app.models.batch_job_run import BatchJobRun
 
 # add your model's MetaData object here
 # for 'autogenerate' support
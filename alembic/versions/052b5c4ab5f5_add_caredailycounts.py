@@ -0,0 +1,53 @@
+"""Add CareDailyCounts
+
+Revision ID: 052b5c4ab5f5
+Revises: d67c73a6e48d
+Create Date: 2026-10-18 10:12:41.218304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import TIMEZONE
+
+# revision identifiers, used by Alembic.
+revision: str = '052b5c4ab5f5'
+down_revision: Union[str, Sequence[str], None] = 'd67c73a6e48d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'CareDailyCounts',
+        sa.Column('userId', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('animalId', sa.Integer(), nullable=False),
+        sa.Column('categoryId', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.ForeignKeyConstraint(['categoryId'], ['Categories.categoryId'], ),
+        sa.ForeignKeyConstraint(['userId'], ['Users.userId'], ),
+        sa.PrimaryKeyConstraint('userId', 'animalId', 'categoryId', 'date', name='pk_care_daily_count')
+    )
+
+    # 오늘 케어 기록만 집계해서 채움 (케어 특성값은 오늘 횟수만 사용)
+    # 날짜는 서비스가 집계 행을 쌓는 기준과 같이 설정된 TIMEZONE 기준
+    op.execute(
+        f"""
+        INSERT INTO "CareDailyCounts" ("userId", "animalId", "categoryId", "date", "count")
+        SELECT l."userId", l."animalId", a."categoryId", CAST(l."performedAt" AT TIME ZONE '{TIMEZONE}' AS DATE), COUNT(*)
+        FROM "CareLogs" l
+        JOIN "Actions" a ON a."actionId" = l."actionId"
+        WHERE l."performedAt" >= CAST((now() AT TIME ZONE '{TIMEZONE}')::date AS TIMESTAMP) AT TIME ZONE '{TIMEZONE}'
+        GROUP BY l."userId", l."animalId", a."categoryId", CAST(l."performedAt" AT TIME ZONE '{TIMEZONE}' AS DATE)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('CareDailyCounts')
@@ -0,0 +1,42 @@
+"""Add lastCaredAt to Animal
+
+Revision ID: 122595a60c7c
+Revises: 052b5c4ab5f5
+Create Date: 2026-10-18 10:41:07.533912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '122595a60c7c'
+down_revision: Union[str, Sequence[str], None] = '052b5c4ab5f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('Animals', sa.Column('lastCaredAt', sa.DateTime(timezone=True), nullable=True))
+
+    # 기존 케어 로그의 마지막 수행 시각으로 채움
+    op.execute(
+        """
+        UPDATE "Animals" AS a
+        SET "lastCaredAt" = l."lastCaredAt"
+        FROM (
+            SELECT "userId", "animalId", MAX("performedAt") AS "lastCaredAt"
+            FROM "CareLogs"
+            GROUP BY "userId", "animalId"
+        ) AS l
+        WHERE a."userId" = l."userId" AND a."animalId" = l."animalId"
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('Animals', 'lastCaredAt')
@@ -0,0 +1,64 @@
+"""Add AttendanceSummaries
+
+Revision ID: 3f8a1c6d2b74
+Revises: b91d5e3f0a27
+Create Date: 2026-10-18 17:41:52.206318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a1c6d2b74'
+down_revision: Union[str, Sequence[str], None] = 'b91d5e3f0a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'AttendanceSummaries',
+        sa.Column('userId', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('totalCount', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('attendanceDays', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('lastDate', sa.Date(), nullable=True),
+        sa.Column('currentStreak', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('rewardMask', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('updatedAt', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['userId'], ['Users.userId'], ),
+        sa.PrimaryKeyConstraint('userId')
+    )
+
+    # 기존 AttendanceLogs로 요약 채우기 (app.api.event.repository.rebuild_attendance_summaries와 같은 계산)
+    # AttendanceLogs에는 FK가 없으므로 Users에 없는 사용자의 로그는 제외
+    op.execute("""
+        INSERT INTO "AttendanceSummaries"
+            ("userId", "totalCount", "attendanceDays", "lastDate", "rewardMask", "currentStreak")
+        SELECT "userId", sum(n), count(*), max(date), bit_or(mask), count(*) FILTER (WHERE grp = last_grp)
+        FROM (
+            SELECT *, first_value(grp) OVER (PARTITION BY "userId" ORDER BY date DESC) AS last_grp
+            FROM (
+                SELECT *, date - CAST(row_number() OVER (PARTITION BY "userId" ORDER BY date) AS INTEGER) AS grp
+                FROM (
+                    SELECT "userId", date, count(*) AS n,
+                           bit_or(CASE WHEN "attendanceRewardId" BETWEEN 1 AND 63
+                                       THEN CAST(1 AS BIGINT) << ("attendanceRewardId" - 1)
+                                       ELSE CAST(0 AS BIGINT) END) AS mask
+                    FROM "AttendanceLogs"
+                    WHERE "userId" IN (SELECT "userId" FROM "Users")
+                    GROUP BY "userId", date
+                ) days
+            ) grouped
+        ) ranked
+        GROUP BY "userId"
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('AttendanceSummaries')
@@ -0,0 +1,42 @@
+"""Add composite indexes for repository query shapes
+
+Revision ID: 5f1c3e9a7b20
+Revises: 122595a60c7c
+Create Date: 2026-10-18 11:05:52.604113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f1c3e9a7b20'
+down_revision: Union[str, Sequence[str], None] = '122595a60c7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스명, 테이블명, 컬럼 목록)
+INDEXES = [
+    ('ix_care_logs_user_animal_performed_at', 'CareLogs', ['userId', 'animalId', 'performedAt']),
+    ('ix_user_minigame_plays_user_game_date', 'UserMinigamePlays', ['userId', 'minigameId', 'playDate']),
+    ('ix_birthday_rewards_user_animal_date', 'BirthdayRewards', ['userId', 'animalId', 'date']),
+    ('ix_attendance_logs_user_date', 'AttendanceLogs', ['userId', 'date']),
+    ('ix_money_transactions_user_direction', 'MoneyTransactions', ['userId', 'direction']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 운영 중인 로그 테이블에 쓰기 잠금이 걸리지 않도록 CONCURRENTLY로 생성
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
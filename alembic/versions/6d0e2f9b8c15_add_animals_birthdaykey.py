@@ -0,0 +1,39 @@
+"""Add Animals.birthdayKey
+
+Revision ID: 6d0e2f9b8c15
+Revises: 3f8a1c6d2b74
+Create Date: 2026-10-18 18:05:27.731940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6d0e2f9b8c15'
+down_revision: Union[str, Sequence[str], None] = '3f8a1c6d2b74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.models.animal.BIRTHDAY_KEY_SQL과 같은 식
+BIRTHDAY_KEY_SQL = 'CAST(EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday) AS SMALLINT)'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 생성 컬럼 (기존 행은 추가 시 계산됨)
+    op.add_column('Animals', sa.Column('birthdayKey', sa.SmallInteger(), sa.Computed(BIRTHDAY_KEY_SQL, persisted=True), nullable=False))
+
+    # 운영 중 쓰기 잠금이 걸리지 않도록 CONCURRENTLY로 생성
+    with op.get_context().autocommit_block():
+        op.create_index('ix_animals_birthday_key_user', 'Animals', ['birthdayKey', 'userId'],
+                        unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_animals_birthday_key_user', table_name='Animals', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('Animals', 'birthdayKey')
@@ -0,0 +1,61 @@
+"""Make UserMinigamePlays unique per user, game and date
+
+Revision ID: 8c2f4b6d1e93
+Revises: a3d9e1f7c482
+Create Date: 2026-10-18 15:42:10.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2f4b6d1e93'
+down_revision: Union[str, Sequence[str], None] = 'a3d9e1f7c482'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ['userId', 'minigameId', 'playDate']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 동시 요청으로 생긴 중복 행을 가장 오래된 행 하나로 합침 (playCount 합산)
+    op.execute("""
+        WITH merged AS (
+            SELECT min("userMinigamePlayId") AS keep_id, sum("playCount") AS total
+            FROM "UserMinigamePlays"
+            GROUP BY "userId", "minigameId", "playDate"
+            HAVING count(*) > 1
+        )
+        UPDATE "UserMinigamePlays" p
+        SET "playCount" = merged.total
+        FROM merged
+        WHERE p."userMinigamePlayId" = merged.keep_id
+    """)
+    op.execute("""
+        DELETE FROM "UserMinigamePlays" p
+        USING "UserMinigamePlays" keep
+        WHERE keep."userId" = p."userId"
+          AND keep."minigameId" = p."minigameId"
+          AND keep."playDate" = p."playDate"
+          AND keep."userMinigamePlayId" < p."userMinigamePlayId"
+    """)
+
+    # 운영 중 쓰기 잠금이 걸리지 않도록 CONCURRENTLY로 생성 후 기존 일반 인덱스 삭제
+    with op.get_context().autocommit_block():
+        op.create_index('uq_user_minigame_plays_user_game_date', 'UserMinigamePlays', COLUMNS,
+                        unique=True, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_user_minigame_plays_user_game_date', table_name='UserMinigamePlays',
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_user_minigame_plays_user_game_date', 'UserMinigamePlays', COLUMNS,
+                        unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('uq_user_minigame_plays_user_game_date', table_name='UserMinigamePlays',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,61 @@
+"""Add LedgerSnapshots and transaction history index
+
+Revision ID: a3d9e1f7c482
+Revises: 5f1c3e9a7b20
+Create Date: 2026-10-18 13:20:07.418822
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d9e1f7c482'
+down_revision: Union[str, Sequence[str], None] = '5f1c3e9a7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'LedgerSnapshots',
+        sa.Column('userId', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('source', sa.String(length=20), nullable=False),
+        sa.Column('direction', postgresql.ENUM('IN', 'OUT', name='transactiondirection', create_type=False), nullable=False),
+        sa.Column('totalAmount', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('txCount', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('lastTxAt', sa.TIMESTAMP(), nullable=True),
+        sa.Column('updatedAt', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['userId'], ['Users.userId'], ),
+        sa.PrimaryKeyConstraint('userId', 'source', 'direction', name='pk_ledger_snapshot')
+    )
+
+    # 기존 거래 내역으로 누적 합계 채움
+    op.execute(
+        """
+        INSERT INTO "LedgerSnapshots" ("userId", "source", "direction", "totalAmount", "txCount", "lastTxAt")
+        SELECT "userId", "source", "direction", SUM("amount"), COUNT(*), MAX("createdAt")
+        FROM "MoneyTransactions"
+        GROUP BY "userId", "source", "direction"
+        """
+    )
+
+    # 거래 내역 keyset 페이지네이션용 인덱스 (쓰기 잠금 없이 생성)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_money_transactions_user_created_tx', 'MoneyTransactions', ['userId', 'createdAt', 'txId'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_money_transactions_user_created_tx', table_name='MoneyTransactions',
+            postgresql_concurrently=True, if_exists=True
+        )
+    op.drop_table('LedgerSnapshots')
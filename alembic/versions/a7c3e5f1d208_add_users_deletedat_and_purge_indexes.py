@@ -0,0 +1,44 @@
+"""Add Users.deletedAt and purge indexes
+
+Revision ID: a7c3e5f1d208
+Revises: 6d0e2f9b8c15
+Create Date: 2026-10-18 18:34:10.118254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f1d208'
+down_revision: Union[str, Sequence[str], None] = '6d0e2f9b8c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼, postgresql_where)
+INDEXES = [
+    ('ix_users_deleted_at', 'Users', ['deletedAt'], sa.text('"deletedAt" IS NOT NULL')),
+    ('ix_minigame_attempts_user_attempt', 'MinigameAttempts', ['userId', 'minigameAttemptId'], None),
+    ('ix_minigame_leaderboards_user', 'MinigameLeaderboards', ['userId', 'minigameId', 'period', 'periodStart'], None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('Users', sa.Column('deletedAt', sa.TIMESTAMP(), nullable=True))
+
+    # 운영 중 쓰기 잠금이 걸리지 않도록 CONCURRENTLY로 생성
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_where=where,
+                            postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    op.drop_column('Users', 'deletedAt')
@@ -0,0 +1,42 @@
+"""Add IdempotencyKeys
+
+Revision ID: b91d5e3f0a27
+Revises: e4b7c2a9d615
+Create Date: 2026-10-18 17:03:14.582960
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91d5e3f0a27'
+down_revision: Union[str, Sequence[str], None] = 'e4b7c2a9d615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'IdempotencyKeys',
+        sa.Column('userId', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('idempotencyKey', sa.String(length=255), nullable=False),
+        sa.Column('requestHash', sa.String(length=64), nullable=False),
+        sa.Column('responseStatus', sa.Integer(), nullable=True),
+        sa.Column('responseBody', sa.LargeBinary(), nullable=True),
+        sa.Column('contentType', sa.String(length=100), nullable=True),
+        sa.Column('createdAt', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('expiresAt', sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint('userId', 'idempotencyKey', name='pk_idempotency_key')
+    )
+    op.create_index('ix_idempotency_keys_expires_at', 'IdempotencyKeys', ['expiresAt'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_idempotency_keys_expires_at', table_name='IdempotencyKeys')
+    op.drop_table('IdempotencyKeys')
@@ -0,0 +1,41 @@
+"""Add BatchJobRuns
+
+Revision ID: c2e9d4a7f310
+Revises: a7c3e5f1d208
+Create Date: 2026-10-18 20:12:47.503918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e9d4a7f310'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e5f1d208'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'BatchJobRuns',
+        sa.Column('jobName', sa.String(length=50), nullable=False),
+        sa.Column('runDate', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(length=20), server_default=sa.text("'running'"), nullable=False),
+        sa.Column('cursor', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('rowsProcessed', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('chunkCount', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('startedAt', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updatedAt', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('finishedAt', sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint('jobName', 'runDate', name='pk_batch_job_run')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('BatchJobRuns')
@@ -0,0 +1,82 @@
+"""Add MinigameLeaderboards
+
+Revision ID: e4b7c2a9d615
+Revises: 8c2f4b6d1e93
+Create Date: 2026-10-18 16:20:37.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import TIMEZONE
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7c2a9d615'
+down_revision: Union[str, Sequence[str], None] = '8c2f4b6d1e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 달성 시각을 설정된 TIMEZONE 기준 시각으로 변환 (app.api.minigame.repository._period_start_sql과 같은 기준)
+LOCAL_ACHIEVED_AT = f"(CAST(achieved_at AS TIMESTAMPTZ) AT TIME ZONE '{TIMEZONE}')"
+
+# period -> 달성 시각으로 기간 시작일을 구하는 SQL (app.api.minigame.leaderboard.period_start와 같은 규칙)
+PERIOD_STARTS = {
+    'daily': f'CAST({LOCAL_ACHIEVED_AT} AS DATE)',
+    'weekly': f"CAST(date_trunc('week', {LOCAL_ACHIEVED_AT}) AS DATE)",
+    'all': "DATE '1970-01-01'",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'MinigameLeaderboards',
+        sa.Column('minigameId', sa.Integer(), nullable=False),
+        sa.Column('period', sa.String(length=10), nullable=False),
+        sa.Column('periodStart', sa.Date(), nullable=False),
+        sa.Column('userId', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('bestScore', sa.Integer(), nullable=False),
+        sa.Column('timeSpent', sa.Integer(), nullable=True),
+        sa.Column('achievedAt', sa.TIMESTAMP(), nullable=False),
+        sa.Column('attemptCount', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('updatedAt', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['minigameId'], ['Minigames.minigameId']),
+        sa.ForeignKeyConstraint(['userId'], ['Users.userId']),
+        sa.PrimaryKeyConstraint('minigameId', 'period', 'periodStart', 'userId', name='pk_minigame_leaderboard')
+    )
+    op.create_index(
+        'ix_minigame_leaderboards_board_score',
+        'MinigameLeaderboards',
+        ['minigameId', 'period', 'periodStart', sa.text('"bestScore" DESC'), 'achievedAt'],
+        unique=False
+    )
+
+    # 기존 MinigameAttempts로 기간별 최고 점수 채우기 (완료되고 점수가 있는 기록만)
+    for period, period_start in PERIOD_STARTS.items():
+        op.execute(f"""
+            INSERT INTO "MinigameLeaderboards"
+                ("minigameId", period, "periodStart", "userId", "bestScore", "timeSpent", "achievedAt", "attemptCount")
+            SELECT DISTINCT ON ("minigameId", period_start, "userId")
+                   "minigameId", '{period}', period_start, "userId", score, "timeSpent", achieved_at,
+                   count(*) OVER (PARTITION BY "minigameId", period_start, "userId")
+            FROM (
+                SELECT *, {period_start} AS period_start
+                FROM (
+                    SELECT "minigameId", "userId", score, "timeSpent",
+                           coalesce("completionAt", "startedAt") AS achieved_at
+                    FROM "MinigameAttempts"
+                    WHERE "completionAt" IS NOT NULL AND score IS NOT NULL
+                ) a
+            ) b
+            ORDER BY "minigameId", period_start, "userId", score DESC, achieved_at
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_minigame_leaderboards_board_score', table_name='MinigameLeaderboards')
+    op.drop_table('MinigameLeaderboards')
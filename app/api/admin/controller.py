@@ -0,0 +1,121 @@
+# app/api/admin/controller.py
+from fastapi import APIRouter, Depends, Header, Query
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from uuid import UUID
+import hmac
+from typing import Optional
+from app.core.catalog import catalog
+from app.core.database import engine, async_engine, get_db
+from app.api.user.repository import rebuild_ledger_snapshots
+from app.api.event.repository import rebuild_attendance_summaries
+from app.api.care.repository import rebalance_user_pattern_biases
+from app.api.admin.schema import PatternBiasRebalanceRequest
+from app.core.pool import pool_status
+from app.core.exception import CustomException
+from app.core.cache import clear_user_caches
+from app.core.scheduler import scheduler
+from app.core.config import ADMIN_TOKEN
+
+# 관리자 토큰 확인 (ADMIN_TOKEN이 설정되지 않았으면 모든 관리자 요청 거절)
+def verify_admin_token(admin_token: Optional[str] = Header(None, alias="X-Admin-Token")):
+    if not ADMIN_TOKEN:
+        raise CustomException(message="관리자 API가 비활성화되어 있습니다. ADMIN_TOKEN을 설정하세요.", status=403)
+    if not hmac.compare_digest((admin_token or "").encode(), ADMIN_TOKEN.encode()):
+        raise CustomException(message="관리자 인증에 실패했습니다.", status=401)
+
+router = APIRouter(prefix="/api/v1/admin", tags=["Admin"], dependencies=[Depends(verify_admin_token)])
+
+# 기준 테이블 캐시 새로고침 (Actions, Categories, EmotionMessages, AttendanceRewards, Minigames 변경 후 호출)
+@router.post("/catalog/refresh", summary="기준 테이블 캐시 새로고침")
+def refresh_catalog():
+    try:
+        version = catalog.refresh()
+        return {
+            "message": "기준 테이블 캐시를 새로 불러왔습니다.",
+            "version": version,
+            "status": 200
+        }
+    except Exception:
+        raise CustomException(message="기준 테이블 캐시를 불러오는 중 오류가 발생했습니다.", status=500)
+
+# DB 커넥션 풀 상태 조회 (사용 중 커넥션 수, 오버플로 수, 체크아웃 대기 시간)
+@router.get("/db/pool", summary="DB 커넥션 풀 상태 조회")
+def get_db_pool_status():
+    return {
+        "sync": pool_status(engine),
+        "async": pool_status(async_engine),
+        "status": 200
+    }
+
+# 거래 누적 합계 재계산 (MoneyTransactions 기준, userId가 없으면 전체 사용자)
+@router.post("/ledger/rebuild", summary="거래 누적 합계 재계산")
+def rebuild_ledger(userId: Optional[UUID] = Query(None, description="대상 사용자 ID"), db: Session = Depends(get_db)):
+    try:
+        rebuild_ledger_snapshots(db, userId)
+        db.commit()
+        clear_user_caches()
+        return {
+            "message": "거래 누적 합계를 다시 계산했습니다.",
+            "status": 200
+        }
+    except Exception:
+        db.rollback()
+        raise CustomException(message="거래 누적 합계를 계산하는 중 오류가 발생했습니다.", status=500)
+
+# 출석 요약 재계산 (AttendanceLogs 기준, userId가 없으면 전체 사용자)
+@router.post("/attendance/rebuild", summary="출석 요약 재계산")
+def rebuild_attendance(userId: Optional[UUID] = Query(None, description="대상 사용자 ID"), db: Session = Depends(get_db)):
+    try:
+        rebuild_attendance_summaries(db, [userId] if userId else None)
+        db.commit()
+        clear_user_caches()
+        return {
+            "message": "출석 요약을 다시 계산했습니다.",
+            "status": 200
+        }
+    except Exception:
+        db.rollback()
+        raise CustomException(message="출석 요약을 계산하는 중 오류가 발생했습니다.", status=500)
+
+# 편애도 일괄 재분배 (여러 사용자를 UPDATE ... FROM (VALUES ...) 한 문장으로 처리, 오프라인 재계산용)
+@router.post("/care/pattern-bias/rebalance", summary="편애도 일괄 재분배")
+def rebalance_pattern_biases(request: PatternBiasRebalanceRequest, db: Session = Depends(get_db)):
+    if not request.targets:
+        raise CustomException(message="재분배 대상이 비어 있습니다.", status=400)
+    if not 0 <= request.transferRate <= 1:
+        raise CustomException(message="transferRate는 0 이상 1 이하여야 합니다.", status=400)
+
+    try:
+        rebalance_user_pattern_biases(db, {target.userId: target.animalId for target in request.targets}, request.transferRate)
+        db.commit()
+        clear_user_caches()
+        return {
+            "message": "편애도를 재분배했습니다.",
+            "status": 200
+        }
+    except SQLAlchemyError:
+        db.rollback()
+        raise CustomException(message="편애도를 재분배하는 중 오류가 발생했습니다.", status=500)
+
+# 배치 작업 목록과 작업별 실행 결과 (실행 횟수, 마지막 실행 시간, 처리한 행 수, 다음 실행 시각)
+@router.get("/scheduler/jobs", summary="배치 작업 실행 현황 조회")
+def get_scheduler_jobs():
+    return {
+        "running": scheduler.running,
+        "jobs": scheduler.status(),
+        "status": 200
+    }
+
+# 배치 작업 즉시 실행 (DB 전체 작업은 다른 워커가 실행 중이면 건너뜀)
+@router.post("/scheduler/jobs/{name}/run", summary="배치 작업 즉시 실행")
+async def run_scheduler_job(name: str):
+    try:
+        result = await scheduler.run_now(name)
+    except KeyError:
+        raise CustomException(message="존재하지 않는 배치 작업입니다.", status=404)
+    return {
+        "message": "배치 작업을 실행했습니다.",
+        "data": result,
+        "status": 200
+    }
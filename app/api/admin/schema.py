@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from uuid import UUID
+from typing import List
+
+# 편애도 재분배 대상 dto (userId 사용자의 편애도를 animalId 동물로 모음)
+class PatternBiasTarget(BaseModel):
+    userId: UUID
+    animalId: int
+
+# 편애도 일괄 재분배 요청 dto (오프라인 재계산용)
+class PatternBiasRebalanceRequest(BaseModel):
+    targets: List[PatternBiasTarget]
+    transferRate: float = 0.3
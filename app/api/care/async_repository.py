@@ -0,0 +1,44 @@
+# app/api/care/async_repository.py
+# care repository의 비동기(AsyncSession) 버전 - DB_ASYNC=true일 때 사용
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_
+from typing import List, Optional
+from app.models.action import Action
+from app.models.category import Category
+from app.models.emotionmessages import EmotionMessage
+from app.core.catalog import catalog
+
+async def get_actions_by_category_and_evolution(db: AsyncSession, category_name: str, evolution_stage: int) -> List[Action]:
+    # 캐시 우선 조회, 없으면 DB 조회
+    actions = catalog.get_actions_by_category_and_evolution(category_name, evolution_stage)
+    if actions:
+        return actions
+    result = await db.execute(
+        select(Action).join(Category).where(
+            and_(Category.name == category_name, Action.evolutionStage == evolution_stage)
+        )
+    )
+    return list(result.scalars().all())
+
+async def get_category_by_name(db: AsyncSession, category_name: str) -> Optional[Category]:
+    category = catalog.get_category_by_name(category_name)
+    if category is not None:
+        return category
+    result = await db.execute(select(Category).where(Category.name == category_name).limit(1))
+    return result.scalars().first()
+
+async def get_emotion_by_message(db: AsyncSession, category_name: str, level: int) -> Optional[EmotionMessage]:
+    category = await get_category_by_name(db, category_name)
+    if not category:
+        return None
+
+    message = catalog.get_emotion_message(category.categoryId, level)
+    if message is not None:
+        return message
+    result = await db.execute(
+        select(EmotionMessage).where(
+            EmotionMessage.categoryId == category.categoryId,
+            EmotionMessage.emotionMessageLevel == level
+        ).limit(1)
+    )
+    return result.scalars().first()
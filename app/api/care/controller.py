@@ -1,13 +1,21 @@
 from fastapi import APIRouter, Depends, Query, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
+from typing import Optional
 from app.api.care.schema import PriceListResponse, CareActionRequest, CareActionResponse, EmotionMessageResponse, EmotionMessageRequest, MLInput
-from app.api.care.service import get_price_list_service, predict_and_apply_emotion_change, daily_increment_days_since_care_service, generate_emotion_message_service
-from app.core.database import get_db
+from app.api.care.service import get_price_list_service, predict_and_apply_emotion_change, daily_increment_days_since_care_service, daily_increment_status_service, generate_emotion_message_service
+from app.api.care.service import get_price_list_service_async, generate_emotion_message_service_async, export_care_logs_service
+from app.core.database import get_db, get_async_db, get_stream_session_factory
+from app.core.config import DB_ASYNC
 from app.core.exception import CustomException
 
 router = APIRouter(prefix="/api/v1/cares", tags=["Care"])
 
+# 비동기 세션 조회 API (DB_ASYNC=true일 때 같은 경로의 동기 API보다 먼저 등록됨)
+async_router = APIRouter(prefix="/api/v1/cares", tags=["Care"])
+
 @router.post("/action", response_model=CareActionResponse)
 def perform_care_action(
     request: CareActionRequest,
@@ -41,7 +49,19 @@ def daily_increment_days_since_care(
     except Exception as e:
         raise CustomException(message="서버 내부 오류가 발생했습니다.", status=500)
 
-@router.get("/pricelist", response_model=PriceListResponse)
+@router.get("/batch/daily-increment/status")
+def daily_increment_status(
+    db: Session = Depends(get_db)
+):
+    # 오늘 자정 배치 진행 상황 (처리한 동물 수, 청크 수, 마지막 위치)
+    try:
+        return daily_increment_status_service(db)
+    except CustomException as e:
+        raise e
+    except Exception as e:
+        raise CustomException(message="서버 내부 오류가 발생했습니다.", status=500)
+
+@router.get("/pricelist", response_model=PriceListResponse, include_in_schema=not DB_ASYNC)
 def get_price_list(
     category: str = Query(..., description="행동 카테고리 (feed, play, gift)"),
     animalId: int = Query(..., description="동물 ID"),
@@ -57,7 +77,7 @@ def get_price_list(
 
 
 # 감정 메시지 출력
-@router.post("/emotion-message", response_model=EmotionMessageResponse, summary="감정 메시지 출력")
+@router.post("/emotion-message", response_model=EmotionMessageResponse, summary="감정 메시지 출력", include_in_schema=not DB_ASYNC)
 def generate_emotion_message(
     req: EmotionMessageRequest,
     db: Session = Depends(get_db)
@@ -67,4 +87,49 @@ def generate_emotion_message(
     except CustomException as e:
         raise e
     except Exception:
-        raise CustomException(status=500, message="서버 내부 오류가 발생했습니다.")
\ No newline at end of file
+        raise CustomException(status=500, message="서버 내부 오류가 발생했습니다.")
+
+
+# 케어 로그 전체 내보내기 (NDJSON/CSV 스트리밍)
+@router.get("/logs/export")
+def export_care_logs(
+    format: str = Query("ndjson", description="내보내기 형식 (ndjson, csv)"),
+    animalId: Optional[int] = Query(None, description="동물 ID (없으면 전체)"),
+    db: Session = Depends(get_db),
+    session_factory = Depends(get_stream_session_factory),
+    user_id: UUID = Header(..., alias="user-id")
+):
+    stream, media_type = export_care_logs_service(db, session_factory, user_id, animalId, format)
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="care-logs-{user_id}.{format}"'}
+    )
+
+
+@async_router.get("/pricelist", response_model=PriceListResponse)
+async def get_price_list_async(
+    category: str = Query(..., description="행동 카테고리 (feed, play, gift)"),
+    animalId: int = Query(..., description="동물 ID"),
+    db: AsyncSession = Depends(get_async_db),
+    user_id: UUID = Header(..., alias="user-id")
+):
+    try:
+        return await get_price_list_service_async(db, category, animalId, user_id)
+    except CustomException as e:
+        raise e
+    except Exception as e:
+        raise CustomException(message="서버 내부 오류가 발생했습니다.", status=500)
+
+
+@async_router.post("/emotion-message", response_model=EmotionMessageResponse, summary="감정 메시지 출력")
+async def generate_emotion_message_async(
+    req: EmotionMessageRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        return await generate_emotion_message_service_async(db, req)
+    except CustomException as e:
+        raise e
+    except Exception:
+        raise CustomException(status=500, message="서버 내부 오류가 발생했습니다.")
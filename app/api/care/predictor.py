@@ -0,0 +1,178 @@
+# app/api/care/predictor.py
+import threading
+import time
+from concurrent.futures import Future
+from queue import Queue, Empty
+from typing import Dict, Tuple
+import numpy as np
+from sqlalchemy.orm import Session
+from app.api.care.schema import MLInput
+from app.models.action import Action
+from app.models.category import Category
+from app.api.care.repository import get_category_by_id
+from app.core.config import PREDICT_MAX_BATCH_SIZE, PREDICT_MAX_WAIT_MS
+
+# ML 모델 입력 컬럼 순서 (MLInput 필드 순서로 고정, 학습 시 컬럼 순서와 동일)
+FEATURE_COLUMNS = tuple(MLInput.model_fields.keys())
+FEATURE_COUNT = len(FEATURE_COLUMNS)
+FEATURE_INDEX = {column: index for index, column in enumerate(FEATURE_COLUMNS)}
+
+# 요청마다 값이 바뀌는 입력 슬롯 (나머지는 OneHot 인코딩으로 고정)
+CURRENT_EMOTION_SLOT = FEATURE_INDEX['current_emotion']
+ACTION_COUNT_SLOT = FEATURE_INDEX['action_count']
+USER_PATTERN_BIAS_SLOT = FEATURE_INDEX['user_pattern_bias']
+DAYS_SINCE_LAST_CARE_SLOT = FEATURE_INDEX['days_since_last_care']
+
+# 동물 타입 매핑 (animalId를 타입으로 변환, 없는 ID는 chick)
+ANIMAL_TYPE_MAPPING = {1: 'shiba', 2: 'duck', 3: 'chick'}
+DEFAULT_ANIMAL_TYPE = 'chick'
+
+# 카테고리를 찾을 수 없을 때 사용하는 기본 카테고리명
+DEFAULT_CATEGORY_NAME = 'feed'
+
+
+def features_from_ml_input(ml_input: MLInput) -> np.ndarray:
+    # MLInput -> 고정 순서 NumPy 배열 변환
+    return np.fromiter(
+        (getattr(ml_input, column) for column in FEATURE_COLUMNS),
+        dtype=np.float64,
+        count=FEATURE_COUNT
+    )
+
+
+def _build_feature_template(animal_type: str, action_ml_name: str) -> np.ndarray:
+    # 동적 슬롯을 제외한 OneHot 인코딩이 채워진 입력 행 생성
+    row = np.zeros(FEATURE_COUNT, dtype=np.float64)
+    for column in (f"animal_type_{animal_type}", f"action_{action_ml_name}"):
+        index = FEATURE_INDEX.get(column)
+        if index is not None:
+            row[index] = 1
+    return row
+
+
+class FeatureEncoder:
+    # (animalId, categoryId, actionLevel) -> 미리 인코딩된 ML 입력 행 테이블
+    # 서버 시작 시 Actions/Categories 기준으로 한 번 생성하고, 요청 시에는 동적 슬롯 4개만 채움
+
+    def __init__(self):
+        self._templates: Dict[Tuple[int, int, int], np.ndarray] = {}
+        self._action_ml_names: Dict[Tuple[int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> None:
+        # Actions/Categories 조회 후 전체 테이블 재구성
+        rows = db.query(Action.categoryId, Action.actionLevel, Category.name).outerjoin(
+            Category, Category.categoryId == Action.categoryId
+        ).distinct().all()
+
+        templates = {}
+        action_ml_names = {}
+        for category_id, action_level, category_name in rows:
+            action_ml_name = f"{category_name or DEFAULT_CATEGORY_NAME}{action_level}"
+            action_ml_names[(category_id, action_level)] = action_ml_name
+            for animal_id, animal_type in ANIMAL_TYPE_MAPPING.items():
+                templates[(animal_id, category_id, action_level)] = _build_feature_template(animal_type, action_ml_name)
+
+        with self._lock:
+            self._templates = templates
+            self._action_ml_names = action_ml_names
+
+    def get_action_ml_name(self, db: Session, category_id: int, action_level: int) -> str:
+        # 액션명 매핑 (category와 level을 ML 모델 형식으로, 예: feed1)
+        action_ml_name = self._action_ml_names.get((category_id, action_level))
+        if action_ml_name is None:
+            category_obj = get_category_by_id(db, category_id)
+            category_name = category_obj.name if category_obj else DEFAULT_CATEGORY_NAME
+            action_ml_name = f"{category_name}{action_level}"
+            with self._lock:
+                self._action_ml_names[(category_id, action_level)] = action_ml_name
+        return action_ml_name
+
+    def encode(self, db: Session, animal_id: int, category_id: int, action_level: int,
+               current_emotion: int, action_count: int, user_pattern_bias: float,
+               days_since_last_care: int) -> np.ndarray:
+        # 미리 인코딩된 행을 복사한 뒤 동적 슬롯만 채워서 반환
+        key = (animal_id, category_id, action_level)
+        template = self._templates.get(key)
+        if template is None:
+            # 시작 이후 추가된 액션 등 테이블에 없는 조합은 한 번만 계산해서 캐싱
+            action_ml_name = self.get_action_ml_name(db, category_id, action_level)
+            animal_type = ANIMAL_TYPE_MAPPING.get(animal_id, DEFAULT_ANIMAL_TYPE)
+            template = _build_feature_template(animal_type, action_ml_name)
+            with self._lock:
+                self._templates[key] = template
+
+        row = template.copy()
+        row[CURRENT_EMOTION_SLOT] = current_emotion
+        row[ACTION_COUNT_SLOT] = action_count
+        row[USER_PATTERN_BIAS_SLOT] = user_pattern_bias
+        row[DAYS_SINCE_LAST_CARE_SLOT] = days_since_last_care
+        return row
+
+
+class EmotionPredictor:
+    # 동시에 들어온 케어 요청들을 마이크로 배치로 묶어 한 번의 model.predict로 처리
+    # - max_batch_size: 한 번에 예측할 최대 요청 수
+    # - max_wait_ms: 첫 요청 이후 배치를 모으기 위해 기다리는 최대 시간
+    # 트리 모델은 행 단위로 독립적으로 예측하므로 배치 결과는 단일 행 예측 결과와 동일함
+
+    def __init__(self, model, max_batch_size: int = PREDICT_MAX_BATCH_SIZE, max_wait_ms: float = PREDICT_MAX_WAIT_MS):
+        self.model = model
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000
+        self._queue: Queue = Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def predict_one(self, features: np.ndarray) -> float:
+        # 단일 요청 예측 (배치 비활성화 시 즉시 예측)
+        if self.max_batch_size == 1 or self.max_wait == 0:
+            return float(self._predict(features.reshape(1, FEATURE_COUNT))[0])
+
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((features, future))
+        return future.result()
+
+    def _predict(self, matrix: np.ndarray):
+        return self.model.predict(matrix, validate_features=False)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="emotion-predictor", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        # 배치 버퍼는 워커 스레드에서 한 번만 할당하여 재사용
+        buffer = np.empty((self.max_batch_size, FEATURE_COUNT), dtype=np.float64)
+
+        while True:
+            features, future = self._queue.get()
+            buffer[0] = features
+            pending = [future]
+
+            # 최대 대기 시간 또는 최대 배치 크기에 도달할 때까지 요청 수집
+            deadline = time.monotonic() + self.max_wait
+            while len(pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    features, future = self._queue.get(timeout=remaining)
+                except Empty:
+                    break
+                buffer[len(pending)] = features
+                pending.append(future)
+
+            try:
+                predictions = self._predict(buffer[:len(pending)])
+            except Exception as e:
+                for future in pending:
+                    future.set_exception(e)
+                continue
+
+            for future, prediction in zip(pending, predictions):
+                future.set_result(float(prediction))
@@ -1,30 +1,50 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, desc
+from sqlalchemy import func, and_, desc, select, update, delete, case, literal, values, column, cast, tuple_, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.orm import aliased
 from app.models.animal import Animal
 from app.models.action import Action
 from app.models.category import Category
 from app.models.action_log import ActionLog
 from uuid import UUID
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, date
 from app.models.emotionmessages import EmotionMessage
+from app.models.user import User
+from app.models.care_daily_count import CareDailyCount
+from app.core.catalog import catalog
+from app.core.config import KST
 
 def get_actions_by_category_and_evolution(db: Session, category_name: str, evolution_stage: int) -> List[Action]:
+    # 캐시 우선 조회, 없으면 DB 조회
+    actions = catalog.get_actions_by_category_and_evolution(category_name, evolution_stage)
+    if actions:
+        return actions
     return db.query(Action).join(Category).filter(
         and_(Category.name == category_name, Action.evolutionStage == evolution_stage)
     ).all()
 
 def get_category_by_name(db: Session, category_name: str) -> Optional[Category]:
+    category = catalog.get_category_by_name(category_name)
+    if category is not None:
+        return category
     return db.query(Category).filter(Category.name == category_name).first()
 
+def get_category_by_id(db: Session, category_id: int) -> Optional[Category]:
+    category = catalog.get_category(category_id)
+    if category is not None:
+        return category
+    return db.query(Category).filter(Category.categoryId == category_id).first()
+
 def get_action_by_id(db: Session, action_id: int) -> Optional[Action]:
+    action = catalog.get_action(action_id)
+    if action is not None:
+        return action
     return db.query(Action).filter(Action.actionId == action_id).first()
 
 def calculate_recent_action_count(db: Session, user_id: UUID, animal_id: int, action_ml_name: str) -> int:
-    # 오늘(자정부터 현재까지) 해당 카테고리의 모든 액션 수행 횟수
+    # 오늘(자정부터 현재까지) 해당 카테고리의 모든 액션 수행 횟수 (일일 집계 테이블 조회)
     try:
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        
         # action_ml_name에서 카테고리만 추출
         if action_ml_name.startswith('feed'):
             category = 'feed'
@@ -36,18 +56,15 @@ def calculate_recent_action_count(db: Session, user_id: UUID, animal_id: int, ac
             return 0
         
         # 카테고리 ID 조회
-        category_obj = db.query(Category).filter(Category.name == category).first()
+        category_obj = get_category_by_name(db, category)
         if not category_obj:
             return 0
         
-        # 카테고리별로 모든 레벨의 액션 수 카운트 (actionLevel 조건 제거)
-        count = db.query(func.count(ActionLog.logId)).join(Action).filter(
-            and_(
-                ActionLog.userId == user_id,
-                ActionLog.animalId == animal_id,
-                Action.categoryId == category_obj.categoryId,
-                ActionLog.performedAt >= today_start
-            )
+        count = db.query(CareDailyCount.count).filter(
+            CareDailyCount.userId == user_id,
+            CareDailyCount.animalId == animal_id,
+            CareDailyCount.categoryId == category_obj.categoryId,
+            CareDailyCount.date == datetime.now(KST).date()
         ).scalar()
         
         return count or 0
@@ -55,23 +72,97 @@ def calculate_recent_action_count(db: Session, user_id: UUID, animal_id: int, ac
         print(f"Error calculating recent action count: {str(e)}")
         return 0
 
+def increment_care_daily_count(db: Session, user_id: UUID, animal_id: int, category_id: int, day: date) -> None:
+    # 일일 케어 횟수 +1 (없으면 생성, 케어 트랜잭션 안에서 호출)
+    stmt = pg_insert(CareDailyCount).values(
+        userId=user_id,
+        animalId=animal_id,
+        categoryId=category_id,
+        date=day,
+        count=1
+    )
+    db.execute(stmt.on_conflict_do_update(
+        constraint='pk_care_daily_count',
+        set_={"count": CareDailyCount.count + 1}
+    ))
+
+def delete_care_daily_counts_before(db: Session, day: date) -> int:
+    # 특성값 계산에 더 이상 쓰이지 않는 지난 일일 집계 삭제
+    result = db.execute(delete(CareDailyCount).where(CareDailyCount.date < day))
+    db.commit()
+    return result.rowcount
+
 def calculate_days_since_last_care(db: Session, animal_id: int, user_id: UUID) -> int:
-    # 마지막 케어 이후 경과 일수
+    # 마지막 케어 이후 경과 일수 (Animals.lastCaredAt 기준)
     try:
-        last_care = db.query(func.max(ActionLog.performedAt)).filter(
+        last_care = db.query(Animal.lastCaredAt).filter(
             and_(
-                ActionLog.animalId == animal_id,
-                ActionLog.userId == user_id
+                Animal.animalId == animal_id,
+                Animal.userId == user_id
             )
         ).scalar()
         
-        if last_care and last_care is not None:
-            return (datetime.now() - last_care).days
-        return 0
+        return days_since(last_care)
     except Exception as e:
         print(f"Error calculating days since last care: {str(e)}")
         return 0
 
+def days_since(last_cared_at: Optional[datetime]) -> int:
+    # 마지막 케어 시각 기준 경과 일수 (케어 기록이 없으면 0)
+    if last_cared_at is None:
+        return 0
+    now = datetime.now(last_cared_at.tzinfo) if last_cared_at.tzinfo else datetime.now()
+    return max(0, (now - last_cared_at).days)
+
+def get_care_action_state(db: Session, user_id: UUID, animal_id: int, category_id: Optional[int]) -> Optional[dict]:
+    # 케어 행동에 필요한 상태를 한 번의 쿼리로 조회 (행 잠금)
+    # - 사용자의 모든 동물 (편애도 재분배용, 마지막 케어 시각 포함), 사용자 잔액
+    # - 오늘 해당 카테고리 행동 수 (일일 집계 테이블)
+    if category_id is None:
+        today_action_count = literal(0)
+    else:
+        today_action_count = select(CareDailyCount.count).where(
+            CareDailyCount.userId == user_id,
+            CareDailyCount.animalId == animal_id,
+            CareDailyCount.categoryId == category_id,
+            CareDailyCount.date == datetime.now(KST).date()
+        ).scalar_subquery()
+
+    rows = db.query(Animal, User.money, today_action_count).join(
+        User, User.active(Animal.userId)
+    ).filter(
+        Animal.userId == user_id
+    ).with_for_update(of=[Animal, User]).all()
+
+    if not rows:
+        return None
+
+    _, money, action_count = rows[0]
+    return {
+        "animals": {row[0].animalId: row[0] for row in rows},
+        "money": money,
+        "todayActionCount": action_count or 0
+    }
+
+def apply_animal_updates(db: Session, user_id: UUID, animal_updates: Dict[int, dict]) -> None:
+    # 여러 동물의 변경사항을 UPDATE ... CASE 한 문장으로 반영
+    # animal_updates: {animalId: {컬럼명: 새 값}}
+    if not animal_updates:
+        return
+
+    columns = {column for changes in animal_updates.values() for column in changes}
+    values = {}
+    for column in columns:
+        whens = {animal_id: changes[column] for animal_id, changes in animal_updates.items() if column in changes}
+        values[column] = case(whens, value=Animal.animalId, else_=getattr(Animal, column))
+
+    db.execute(
+        update(Animal)
+        .where(Animal.userId == user_id, Animal.animalId.in_(list(animal_updates)))
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
 def update_animal_emotion(db: Session, animal_id: int, user_id: UUID, new_emotion: float) -> None:
     # 동물의 감정 상태 업데이트
     update_data = {"currentEmotion": new_emotion}
@@ -89,55 +180,48 @@ def get_all_user_animals(db: Session, user_id: UUID) -> List[Animal]:
     return db.query(Animal).filter(Animal.userId == user_id).all()
 
 def update_user_pattern_bias(db: Session, user_id: UUID, target_animal_id: int, transfer_rate: float = 0.3):
-    # 편애도 업데이트 로직 (전이율 기반)
-    animals = get_all_user_animals(db, user_id)
-    
-    if not animals:
-        return
-    
-    # 현재 편애도 값들을 가져오기
-    animal_biases = {}
-    target_animal = None
-    other_animals = []
-    
-    for animal in animals:
-        current_bias = float(animal.userPatternBias)
-        animal_biases[animal.animalId] = current_bias
-        
-        if animal.animalId == target_animal_id:
-            target_animal = animal
-        else:
-            other_animals.append(animal)
-    
-    if not target_animal:
+    # 편애도 업데이트 로직 (전이율 기반, 단일 UPDATE 문)
+    rebalance_user_pattern_biases(db, {user_id: target_animal_id}, transfer_rate)
+
+def rebalance_user_pattern_biases(db: Session, targets: Dict[UUID, int], transfer_rate: float = 0.3) -> None:
+    # 여러 사용자의 편애도를 UPDATE ... FROM (VALUES ...) 한 문장으로 재분배
+    # targets: {userId: 편애도를 받을 animalId}
+    # - 대상 동물: 현재 편애도 + 다른 동물들의 편애도 합 x 전이율
+    # - 다른 동물: 현재 편애도 x (1 - 전이율)
+    # 대상 동물이 없는 사용자는 변경하지 않음 (소수점 4자리로 반올림)
+    if not targets:
         return
-    
-    # 편애도 계산
-    target_current_bias = animal_biases[target_animal_id]
-    transfer_amount_per_animal = 0
-    
-    # 다른 동물들로부터 전이받을 양 계산
-    for other_animal in other_animals:
-        other_bias = animal_biases[other_animal.animalId]
-        transfer_from_this = other_bias * transfer_rate
-        transfer_amount_per_animal += transfer_from_this
-    
-    # 새로운 편애도 계산 (소수점 4자리로 반올림)
-    new_target_bias = round(target_current_bias + transfer_amount_per_animal, 4)
-    
-    # 타겟 동물 업데이트
-    db.query(Animal).filter(
-        and_(Animal.userId == user_id, Animal.animalId == target_animal_id)
-    ).update({"userPatternBias": new_target_bias})
-    
-    # 다른 동물들 업데이트 (각자 전이율만큼 감소, 소수점 4자리로 반올림)
-    for other_animal in other_animals:
-        current_bias = animal_biases[other_animal.animalId]
-        new_bias = round(current_bias * (1 - transfer_rate), 4)
-        
-        db.query(Animal).filter(
-            and_(Animal.userId == user_id, Animal.animalId == other_animal.animalId)
-        ).update({"userPatternBias": new_bias})
+
+    target_rows = values(
+        column("userId", PG_UUID(as_uuid=True)),
+        column("targetAnimalId", Integer),
+        name="targets"
+    ).data(list(targets.items()))
+
+    other = aliased(Animal)
+    others_total = select(func.coalesce(func.sum(other.userPatternBias), 0)).where(
+        other.userId == Animal.userId,
+        other.animalId != target_rows.c.targetAnimalId
+    ).correlate_except(other).scalar_subquery()
+
+    target_animal = aliased(Animal)
+    target_exists = select(target_animal.animalId).where(
+        target_animal.userId == target_rows.c.userId,
+        target_animal.animalId == target_rows.c.targetAnimalId
+    ).correlate_except(target_animal).exists()
+
+    rate = literal(transfer_rate, Numeric)
+    new_bias = case(
+        (Animal.animalId == target_rows.c.targetAnimalId, Animal.userPatternBias + others_total * rate),
+        else_=Animal.userPatternBias * (1 - rate)
+    )
+
+    db.execute(
+        update(Animal)
+        .where(Animal.userId == target_rows.c.userId, target_exists)
+        .values(userPatternBias=func.round(cast(new_bias, Numeric), 4))
+        .execution_options(synchronize_session=False)
+    )
 
 def reset_animal_days_since_care(db: Session, user_id: UUID, animal_id: int) -> None:
     # 특정 동물의 마지막 케어 이후 경과일을 0으로 리셋
@@ -145,12 +229,27 @@ def reset_animal_days_since_care(db: Session, user_id: UUID, animal_id: int) ->
         and_(Animal.userId == user_id, Animal.animalId == animal_id)
     ).update({"daySinceLastCare": 0})
 
-def increment_all_animals_days_since_care(db: Session) -> None:
-    # 모든 동물의 마지막 케어 이후 경과일을 1씩 증가 (자정 배치용)
-    db.query(Animal).update(
-        {"daySinceLastCare": Animal.daySinceLastCare + 1}
-    )
-    db.commit()
+def increment_days_since_care_chunk(db: Session, cursor: Optional[dict], chunk_size: int) -> Tuple[int, Optional[dict]]:
+    # 자정 배치용 - (animalId, userId) 순서로 cursor 다음 chunk_size마리의 마지막 케어 이후 경과일 +1 (커밋은 호출한 쪽에서)
+    # 감정 예측의 경과일은 lastCaredAt으로 계산하므로 이 값은 표시용 카운터로만 유지됨
+    # 처리한 행 수와 다음 cursor 반환
+    chunk = select(Animal.animalId, Animal.userId)
+    if cursor:
+        chunk = chunk.where(tuple_(Animal.animalId, Animal.userId) > tuple_(cursor["animalId"], UUID(cursor["userId"])))
+    chunk = chunk.order_by(Animal.animalId, Animal.userId).limit(chunk_size).cte("chunk")
+
+    rows = db.execute(
+        update(Animal)
+        .where(tuple_(Animal.animalId, Animal.userId).in_(select(chunk.c.animalId, chunk.c.userId)))
+        .values(daySinceLastCare=Animal.daySinceLastCare + 1)
+        .returning(Animal.animalId, Animal.userId)
+        .execution_options(synchronize_session=False)
+    ).all()
+    if not rows:
+        return 0, cursor
+
+    last = max((row.animalId, str(row.userId)) for row in rows)
+    return len(rows), {"animalId": last[0], "userId": last[1]}
 
 def log_action_result(db: Session, user_id: UUID, animal_id: int, action_id: int, 
                      emotion_before: float, emotion_after: float, predicted_delta: float,
@@ -176,7 +275,28 @@ def get_emotion_by_message(db: Session, category_name: str, level: int) -> Optio
     category_obj = get_category_by_name(db, category_name)
     if not category_obj:
         return None
+    message = catalog.get_emotion_message(category_obj.categoryId, level)
+    if message is not None:
+        return message
     return db.query(EmotionMessage).filter(
         EmotionMessage.categoryId == category_obj.categoryId,
         EmotionMessage.emotionMessageLevel == level
     ).first()
+
+def care_log_export_query(user_id: UUID, animal_id: Optional[int] = None):
+    # 케어 로그 내보내기 (동물별 수행 시각 순, (userId, animalId, performedAt) 인덱스 순서와 동일)
+    query = select(
+        ActionLog.logId,
+        ActionLog.animalId,
+        ActionLog.actionId,
+        ActionLog.emotionBefore,
+        ActionLog.emotionAfter,
+        ActionLog.predictedDelta,
+        ActionLog.actualDelta,
+        ActionLog.userPatternBias,
+        ActionLog.daysSinceLastCare,
+        ActionLog.performedAt
+    ).where(ActionLog.userId == user_id)
+    if animal_id is not None:
+        query = query.where(ActionLog.animalId == animal_id)
+    return query.order_by(ActionLog.animalId, ActionLog.performedAt, ActionLog.logId)
@@ -1,23 +1,33 @@
 import os
 import joblib
-import pandas as pd
 import math
+import numpy as np
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func
 from uuid import UUID
 from typing import Dict, Optional
+from datetime import date, datetime
 from app.api.care.schema import MLInput, PriceListResponse, CareActionResponse
+from app.api.care.predictor import EmotionPredictor, FeatureEncoder
 from app.api.care.repository import (
     get_actions_by_category_and_evolution, get_category_by_name,
-    get_action_by_id, calculate_recent_action_count, calculate_days_since_last_care,
-    update_animal_emotion, log_action_result, update_user_pattern_bias,
-    reset_animal_days_since_care, increment_all_animals_days_since_care, 
-    get_actions_by_category_and_evolution, get_emotion_by_message
+    get_action_by_id, get_care_action_state, apply_animal_updates, increment_care_daily_count,
+    log_action_result, increment_days_since_care_chunk, delete_care_daily_counts_before, get_emotion_by_message, days_since,
+    care_log_export_query
 )
-from app.api.pet.repository import get_animal_by_user_and_id, update_animal_evolution_stage
-from app.models.category import Category
+from app.api.pet.repository import get_animal_by_user_and_id
+from app.api.user.repository import get_user_money
+from app.core.export import stream_query, validate_export_format
+from app.api.care import async_repository
+from app.api.pet import async_repository as pet_async_repository
 from app.api.user.service import process_transaction
 from app.core.exception import CustomException
+from app.core.catalog import catalog
+from app.core.database import SessionLocal
+from app.core.batch_job import run_chunked_job, get_job_run, job_run_status
+from app.core.config import KST, DAILY_BATCH_CHUNK_SIZE, DAILY_BATCH_PAUSE_SECONDS
 from app.api.care.schema import EmotionMessageRequest, EmotionMessageResponse
 from app.models.emotionmessages import EmotionMessage
 
@@ -30,16 +40,31 @@ model_path = os.getenv("MODEL_PATH", "./ML/emotion_model.pkl")
 # 모델 불러오기
 model = joblib.load(model_path)
 
+# 동시 요청을 마이크로 배치로 묶어 예측하는 엔진
+predictor = EmotionPredictor(model)
+
+# (animalId, categoryId, actionLevel) 기준 ML 입력 인코딩 테이블
+feature_encoder = FeatureEncoder()
+
+# 오늘 행동 수를 집계하는 케어 카테고리
+CARE_CATEGORIES = ('feed', 'play', 'gift')
+
+# 기준 테이블 캐시가 새로 로드될 때 인코딩 테이블도 함께 재생성
+catalog.add_refresh_listener(feature_encoder.load)
+
 
 def predict_and_apply_emotion_change(db: Session, user_id: UUID, animal_id: int, action_id: int) -> CareActionResponse:
     # 감정 변화 예측 및 적용
+    # 조회 1회(상태 일괄 조회) + 갱신(동물 일괄 UPDATE, 잔액 UPDATE) + 삽입(거래, 로그)으로 처리
     
-    # 1. 기본 데이터 조회
-    animal = get_animal_by_user_and_id(db, user_id, animal_id)
+    # 1. 기본 데이터 조회 (행동은 캐시, 동물/잔액/마지막 케어/오늘 행동 수는 한 번의 쿼리)
+    action = get_action_by_id(db, action_id)
+    state = get_care_action_state(db, user_id, animal_id, action.categoryId if action else None)
+
+    animal = state["animals"].get(animal_id) if state else None
     if not animal:
         raise CustomException(message="존재하지 않는 동물입니다.", status=404)
     
-    action = get_action_by_id(db, action_id)
     if not action:
         raise CustomException(message="존재하지 않는 행동입니다.", status=404)
     
@@ -49,26 +74,23 @@ def predict_and_apply_emotion_change(db: Session, user_id: UUID, animal_id: int,
     if animal.currentEmotion >= 100:
         raise CustomException(message="이미 감정이 최대치입니다.", status=400)
     
-    # 3. 비용 확인 및 차감
+    # 3. 비용 확인 및 차감 (조회된 잔액 기준)
     action_cost = action.price
     if action_cost > 0:
-        try:
-            process_transaction(db, user_id, -action_cost, "care", commit=False)
-        except CustomException as e:
-            raise e
+        process_transaction(db, user_id, -action_cost, "care", commit=False, current_money=state["money"])
     
     # 4. 행동 전 상태 정보 저장 (로그용)
     previous_emotion = float(animal.currentEmotion)
     previous_bias = float(animal.userPatternBias)
-    days_since_care = calculate_days_since_last_care(db, animal_id, user_id)
+    days_since_care = days_since(animal.lastCaredAt)
     
-    # 5. ML 모델 입력 구성
-    ml_input = create_ml_input_from_db(db, animal, action, user_id)
+    # 5. ML 모델 입력 구성 (고정 순서 NumPy 배열)
+    action_ml_name = feature_encoder.get_action_ml_name(db, action.categoryId, action.actionLevel)
+    recent_action_count = state["todayActionCount"] if action_ml_name.startswith(CARE_CATEGORIES) else 0
+    features = create_ml_input_from_db(db, animal, action, recent_action_count, days_since_care)
     
-    # 6. ML 모델 예측
-    data = ml_input.dict()
-    df_input = pd.DataFrame([data])
-    predicted_delta = float(model.predict(df_input, validate_features=False)[0])
+    # 6. ML 모델 예측 (마이크로 배치)
+    predicted_delta = predictor.predict_one(features)
     
     # 7. 새로운 감정값 계산 (0-100 범위 제한)
     raw_new_emotion = previous_emotion + predicted_delta
@@ -82,40 +104,59 @@ def predict_and_apply_emotion_change(db: Session, user_id: UUID, animal_id: int,
     # 0-100 범위 제한
     new_emotion = max(0, min(100, new_emotion))
     
-    # 8. 데이터베이스 업데이트 (트랜잭션으로 모든 변경사항 한번에 커밋)
+    # 8. 변경사항 계산 (메모리에서 처리)
+    target_changes = {
+        "currentEmotion": new_emotion,
+        "daySinceLastCare": 0,  # 마지막 케어 이후 경과일 리셋 (action 수행 시 0으로)
+        "lastCaredAt": func.now()  # 마지막 케어 시각 (로그의 performedAt과 같은 트랜잭션 시각)
+    }
+
+    # 감정이 0 이하가 되면 가출 상태로 변경
+    if new_emotion <= 0:
+        target_changes["isRunaway"] = True
+
+    # 진화 단계 업데이트 (감정에 따라)
+    if new_emotion >= 90:
+        evolution_stage = 3
+    elif new_emotion >= 70:
+        evolution_stage = 2
+    else:
+        evolution_stage = 1
+
+    # 현재 진화 단계와 다르면 업데이트
+    if animal.evolutionStage != evolution_stage:
+        target_changes["evolutionStage"] = evolution_stage
+
+    # 편애도 업데이트 (전이율 0.3 적용)
+    animal_updates = {
+        other_id: {"userPatternBias": bias}
+        for other_id, bias in calculate_pattern_biases(
+            {a.animalId: float(a.userPatternBias) for a in state["animals"].values()},
+            animal_id,
+            transfer_rate=0.3
+        ).items()
+    }
+    animal_updates.setdefault(animal_id, {}).update(target_changes)
+
+    # 9. 데이터베이스 업데이트 (트랜잭션으로 모든 변경사항 한번에 커밋)
     try:
-        # 감정 상태 업데이트
-        update_animal_emotion(db, animal_id, user_id, new_emotion)
-        
-        # 진화 단계 업데이트 (감정에 따라)
-        if new_emotion >= 90:
-            evolution_stage = 3
-        elif new_emotion >= 70:
-            evolution_stage = 2
-        else:
-            evolution_stage = 1
-        
-        # 현재 진화 단계와 다르면 업데이트
-        if animal.evolutionStage != evolution_stage:
-            update_animal_evolution_stage(db, user_id, animal_id, evolution_stage)
-        
-        # 편애도 업데이트 (전이율 0.3 적용)
-        update_user_pattern_bias(db, user_id, animal_id, transfer_rate=0.3)
-        
-        # 마지막 케어 이후 경과일 리셋 (action 수행 시 0으로)
-        reset_animal_days_since_care(db, user_id, animal_id)
+        # 동물 상태 일괄 업데이트 (감정, 가출, 진화 단계, 편애도, 경과일)
+        apply_animal_updates(db, user_id, animal_updates)
+
+        # 오늘 카테고리별 케어 횟수 갱신
+        increment_care_daily_count(db, user_id, animal_id, action.categoryId, datetime.now(KST).date())
         
         # 행동 로그 기록 (행동 전 편애도와 경과 일수 포함)
         log_action_result(db, user_id, animal_id, action_id, previous_emotion, 
                          new_emotion, predicted_delta, previous_bias, days_since_care)
         
-        db.commit()  # 모든 변경사항 (비용 차감, 감정 업데이트, 진화 단계 업데이트, 편애도 업데이트, 경과일 리셋, 로그 기록) 커밋
+        db.commit()  # 모든 변경사항 (비용 차감, 동물 상태 업데이트, 로그 기록) 커밋
     except Exception as e:
         db.rollback()
         print(f"Database update error: {str(e)}")  # 디버깅용 로그
         raise CustomException(message=f"데이터베이스 업데이트 중 오류가 발생했습니다: {str(e)}", status=500)
     
-    # 9. 응답 구성
+    # 10. 응답 구성
     return CareActionResponse(
         predictedDelta=round(predicted_delta, 2),
         newEmotion=new_emotion,
@@ -125,6 +166,19 @@ def predict_and_apply_emotion_change(db: Session, user_id: UUID, animal_id: int,
         status=200
     )
 
+def calculate_pattern_biases(biases: Dict[int, float], target_animal_id: int, transfer_rate: float = 0.3) -> Dict[int, float]:
+    # 편애도 재분배 (전이율 기반)
+    # 대상 동물은 다른 동물들의 편애도 x 전이율만큼 증가, 다른 동물들은 전이율만큼 감소 (소수점 4자리로 반올림)
+    if target_animal_id not in biases:
+        return {}
+
+    transfer_amount = sum(bias * transfer_rate for animal_id, bias in biases.items() if animal_id != target_animal_id)
+
+    return {
+        animal_id: round(bias + transfer_amount, 4) if animal_id == target_animal_id else round(bias * (1 - transfer_rate), 4)
+        for animal_id, bias in biases.items()
+    }
+
 def validate_action_requirements(animal, action, user_id: UUID) -> None:
     # 유효성 검사
     # 동물 소유권 확인
@@ -139,57 +193,22 @@ def validate_action_requirements(animal, action, user_id: UUID) -> None:
     if animal.evolutionStage != action.evolutionStage:
         raise CustomException(message="현재 진화 단계와 맞지 않는 행동입니다.", status=400)
 
-def create_ml_input_from_db(db: Session, animal, action, user_id: UUID) -> MLInput:
-    # ML 입력 데이터 구성
-    
-    # 동물 타입 매핑 (animalId를 타입으로 변환)
-    animal_type_mapping = {1: 'shiba', 2: 'duck', 3: 'chick'}
-    animal_type = animal_type_mapping.get(animal.animalId, 'chick')
-    
-    # 액션명 매핑 (category와 level을 ML 모델 형식으로)
-    category_obj = db.query(Category).filter(Category.categoryId == action.categoryId).first()
-    category_name = category_obj.name if category_obj else 'feed'
-    action_ml_name = f"{category_name}{action.actionLevel}"
-    
-    # 계산된 값들
-    recent_action_count = calculate_recent_action_count(db, user_id, animal.animalId, action_ml_name)
-    days_since_care = calculate_days_since_last_care(db, animal.animalId, user_id)
-    
-    # ML 모델 입력 구성
-    ml_input_dict = {
-        'current_emotion': int(float(animal.currentEmotion)),
-        'action_count': recent_action_count,
-        'user_pattern_bias': float(animal.userPatternBias),
-        'days_since_last_care': days_since_care,
-        
-        # 동물 타입 OneHot 인코딩
-        'animal_type_chick': 1 if animal_type == 'chick' else 0,
-        'animal_type_duck': 1 if animal_type == 'duck' else 0,
-        'animal_type_shiba': 1 if animal_type == 'shiba' else 0,
-        
-        # 액션 OneHot 인코딩 (선택된 액션만 1, 나머지는 0)
-        'action_feed1': 1 if action_ml_name == 'feed1' else 0,
-        'action_feed2': 1 if action_ml_name == 'feed2' else 0,
-        'action_feed3': 1 if action_ml_name == 'feed3' else 0,
-        'action_play1': 1 if action_ml_name == 'play1' else 0,
-        'action_play2': 1 if action_ml_name == 'play2' else 0,
-        'action_play3': 1 if action_ml_name == 'play3' else 0,
-        'action_gift1': 1 if action_ml_name == 'gift1' else 0,
-        'action_gift2': 1 if action_ml_name == 'gift2' else 0,
-        'action_gift3': 1 if action_ml_name == 'gift3' else 0,
-    }
-    
-    return MLInput(**ml_input_dict)
+def create_ml_input_from_db(db: Session, animal, action, recent_action_count: int, days_since_care: int) -> np.ndarray:
+    # ML 입력 데이터 구성 (미리 인코딩된 행에 동적 값만 채움)
+    return feature_encoder.encode(
+        db,
+        animal.animalId,
+        action.categoryId,
+        action.actionLevel,
+        current_emotion=int(float(animal.currentEmotion)),
+        action_count=recent_action_count,
+        user_pattern_bias=float(animal.userPatternBias),
+        days_since_last_care=days_since_care
+    )
 
 # 가격 정보 조회 서비스
 def get_price_list_service(db: Session, category: str, animal_id: int, user_id: UUID) -> PriceListResponse:
-    # 지원하는 카테고리 확인
-    valid_categories = ['feed', 'play', 'gift']
-    if category not in valid_categories:
-        raise CustomException(
-            message="올바르지 않은 카테고리입니다. (feed, play, gift 중 선택 가능)",
-            status=400
-        )
+    validate_price_category(category)
     
     # 동물 상태 정보 조회 (pet repository 직접 사용)
     animal = get_animal_by_user_and_id(db, user_id, animal_id)
@@ -199,14 +218,33 @@ def get_price_list_service(db: Session, category: str, animal_id: int, user_id:
             status=404
         )
     
-    # 동물의 진화 단계 사용
-    evolution_stage = animal.evolutionStage
-
-    print(evolution_stage)
-    
     # 해당 카테고리와 진화 단계의 액션들 조회
-    actions = get_actions_by_category_and_evolution(db, category, evolution_stage)
-    
+    actions = get_actions_by_category_and_evolution(db, category, animal.evolutionStage)
+    return build_price_list_response(animal_id, animal.evolutionStage, category, actions)
+
+# 가격 정보 조회 서비스 (비동기 세션)
+async def get_price_list_service_async(db: AsyncSession, category: str, animal_id: int, user_id: UUID) -> PriceListResponse:
+    validate_price_category(category)
+
+    animal = await pet_async_repository.get_animal_by_user_and_id(db, user_id, animal_id)
+    if not animal:
+        raise CustomException(
+            message="존재하지 않는 동물 ID입니다.",
+            status=404
+        )
+
+    actions = await async_repository.get_actions_by_category_and_evolution(db, category, animal.evolutionStage)
+    return build_price_list_response(animal_id, animal.evolutionStage, category, actions)
+
+def validate_price_category(category: str) -> None:
+    # 지원하는 카테고리 확인
+    if category not in CARE_CATEGORIES:
+        raise CustomException(
+            message="올바르지 않은 카테고리입니다. (feed, play, gift 중 선택 가능)",
+            status=400
+        )
+
+def build_price_list_response(animal_id: int, evolution_stage: int, category: str, actions) -> PriceListResponse:
     # 가격 딕셔너리 생성
     prices = {}
     for action in actions:
@@ -227,22 +265,58 @@ def get_price_list_service(db: Session, category: str, animal_id: int, user_id:
         status=200
     )
 
-def daily_increment_days_since_care_service(db: Session) -> dict:
+# 자정 배치 작업 이름 (BatchJobRuns.jobName)
+DAILY_INCREMENT_JOB = "daily_increment_days_since_care"
+
+def daily_increment_days_since_care_service(db: Session, run_date: Optional[date] = None,
+                                            chunk_size: int = DAILY_BATCH_CHUNK_SIZE,
+                                            pause: float = DAILY_BATCH_PAUSE_SECONDS) -> dict:
     # 자정 배치용 - 모든 동물의 마지막 케어 이후 경과일 +1 증가
+    # 청크마다 커밋하고 진행 위치를 함께 저장하므로 중단되면 다시 호출했을 때 이어서 처리, 같은 날짜는 한 번만 반영
+    run_date = run_date or datetime.now(KST).date()
     try:
-        increment_all_animals_days_since_care(db)
-        return {
-            "message": "모든 동물의 마지막 케어 이후 경과일이 1일씩 증가되었습니다.",
-            "status": 200
-        }
+        result = run_chunked_job(db, DAILY_INCREMENT_JOB, run_date, increment_days_since_care_chunk, chunk_size, pause)
     except Exception as e:
-        db.rollback()
         raise CustomException(message="경과일 업데이트 중 오류가 발생했습니다.", status=500)
 
-# 감정 변화 메시지
-def generate_emotion_message_service(db: Session, req: EmotionMessageRequest) -> EmotionMessageResponse:
-    delta = req.predictedDelta
-    category_name = req.category
+    if result["alreadyCompleted"]:
+        message = "오늘은 이미 경과일이 증가되었습니다."
+    else:
+        message = "모든 동물의 마지막 케어 이후 경과일이 1일씩 증가되었습니다."
+    return {
+        "message": message,
+        "status": 200,
+        "data": result
+    }
+
+def daily_increment_job() -> int:
+    # 스케줄러 작업 - 별도 세션으로 자정 배치 실행 후 이번에 처리한 동물 수 반환
+    db = SessionLocal()
+    try:
+        return daily_increment_days_since_care_service(db)["data"]["rowsProcessed"]
+    finally:
+        db.close()
+
+def purge_care_daily_counts_job() -> int:
+    # 스케줄러 작업 - 지난 날짜의 일일 케어 횟수 삭제 후 삭제한 행 수 반환
+    # (집계 행은 TIMEZONE 기준 날짜로 쌓이므로 같은 기준으로 오늘 행은 남김)
+    db = SessionLocal()
+    try:
+        return delete_care_daily_counts_before(db, datetime.now(KST).date())
+    finally:
+        db.close()
+
+def daily_increment_status_service(db: Session, run_date: Optional[date] = None) -> dict:
+    # 자정 배치 진행 상황 (실행 기록이 없으면 data는 None)
+    run_date = run_date or datetime.now(KST).date()
+    return {
+        "message": "자정 배치 진행 상황을 조회했습니다.",
+        "status": 200,
+        "data": job_run_status(get_job_run(db, DAILY_INCREMENT_JOB, run_date))
+    }
+
+# 감정 변화량 -> 메시지 레벨 (1~5)
+def emotion_message_level(delta: float) -> int:
     if delta >= 10:
         level = 5
     elif 5 <= delta < 10:
@@ -253,10 +327,29 @@ def generate_emotion_message_service(db: Session, req: EmotionMessageRequest) ->
         level = 2
     elif delta <= -10:
         level = 1
+    return level
 
-    message_obj = get_emotion_by_message(db, category_name, level)
+# 감정 변화 메시지
+def generate_emotion_message_service(db: Session, req: EmotionMessageRequest) -> EmotionMessageResponse:
+    message_obj = get_emotion_by_message(db, req.category, emotion_message_level(req.predictedDelta))
 
     if not message_obj:
         raise CustomException(message="해당 조건에 맞는 메시지를 찾을 수 없습니다.", status=404)
 
     return EmotionMessageResponse(message=message_obj.emotionMessage, status=200)
+
+# 감정 변화 메시지 (비동기 세션)
+async def generate_emotion_message_service_async(db: AsyncSession, req: EmotionMessageRequest) -> EmotionMessageResponse:
+    message_obj = await async_repository.get_emotion_by_message(db, req.category, emotion_message_level(req.predictedDelta))
+
+    if not message_obj:
+        raise CustomException(message="해당 조건에 맞는 메시지를 찾을 수 없습니다.", status=404)
+
+    return EmotionMessageResponse(message=message_obj.emotionMessage, status=200)
+
+# 케어 로그 내보내기(/cares/logs/export) - (스트림, Content-Type) 반환
+def export_care_logs_service(db: Session, session_factory, user_id: UUID, animal_id: Optional[int], export_format: str):
+    media_type = validate_export_format(export_format)
+    if get_user_money(db, user_id) is None:
+        raise CustomException(message="사용자를 찾을 수 없습니다.", status=404)
+    return stream_query(session_factory, care_log_export_query(user_id, animal_id), export_format), media_type
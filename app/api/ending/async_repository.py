@@ -0,0 +1,18 @@
+# app/api/ending/async_repository.py
+# ending repository의 비동기(AsyncSession) 버전 - DB_ASYNC=true일 때 사용
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from app.models.user import User
+from app.api.ending.repository import ending_summary_query
+
+
+async def get_user_by_id(db: AsyncSession, user_id: UUID):
+    result = await db.execute(select(User).where(User.active(user_id)).limit(1))
+    return result.scalars().first()
+
+
+async def get_ending_summary(db: AsyncSession, user_id: UUID):
+    result = await db.execute(ending_summary_query(user_id))
+    return result.first()
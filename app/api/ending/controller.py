@@ -1,14 +1,19 @@
 from fastapi import APIRouter, Depends, Header
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
+from app.core.config import DB_ASYNC
 from app.core.exception import CustomException
-from app.api.ending.service import reset_game_service, get_ending_summary_service
+from app.api.ending.service import reset_game_service, get_ending_summary_service, get_ending_summary_service_async
 
 router = APIRouter(prefix="/api/v1/endings", tags=["Ending"])
 
+# 비동기 세션 조회 API (DB_ASYNC=true일 때 같은 경로의 동기 API보다 먼저 등록됨)
+async_router = APIRouter(prefix="/api/v1/endings", tags=["Ending"])
+
 
 @router.post("/reset")
 def reset_game(user_id: UUID = Header(..., alias="user-id"), db: Session = Depends(get_db)):
@@ -28,7 +33,7 @@ def reset_game(user_id: UUID = Header(..., alias="user-id"), db: Session = Depen
         return JSONResponse(status_code=500, content={"message": "게임 초기화 중 오류가 발생했습니다.", "status": 500})
 
 
-@router.get("/summary")
+@router.get("/summary", include_in_schema=not DB_ASYNC)
 def get_ending_summary(user_id: UUID = Header(..., alias="user-id"), db: Session = Depends(get_db)):
     try:
         data = get_ending_summary_service(db, user_id)
@@ -43,3 +48,20 @@ def get_ending_summary(user_id: UUID = Header(..., alias="user-id"), db: Session
         return JSONResponse(status_code=e.status, content={"message": e.message, "status": e.status})
     except Exception:
         return JSONResponse(status_code=500, content={"message": "게임 요약 정보를 조회하는 중 오류가 발생했습니다.", "status": 500})
+
+
+@async_router.get("/summary")
+async def get_ending_summary_async(user_id: UUID = Header(..., alias="user-id"), db: AsyncSession = Depends(get_async_db)):
+    try:
+        data = await get_ending_summary_service_async(db, user_id)
+        return JSONResponse(
+            status_code=200,
+            content={
+                **data,
+                "status": 200,
+            },
+        )
+    except CustomException as e:
+        return JSONResponse(status_code=e.status, content={"message": e.message, "status": e.status})
+    except Exception:
+        return JSONResponse(status_code=500, content={"message": "게임 요약 정보를 조회하는 중 오류가 발생했습니다.", "status": 500})
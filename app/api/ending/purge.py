@@ -0,0 +1,146 @@
+# app/api/ending/purge.py
+import threading
+import time
+from typing import Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import select, delete, tuple_
+from sqlalchemy.orm import Session
+from app.core.config import PURGE_BATCH_SIZE, PURGE_BATCH_PAUSE_SECONDS, PURGE_INTERVAL_SECONDS
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.api.ending.repository import USER_DATA_TABLES
+
+
+def purge_table(db: Session, model, keyset: List, user_id: UUID,
+                batch_size: int = PURGE_BATCH_SIZE, pause: float = PURGE_BATCH_PAUSE_SECONDS) -> int:
+    # 한 사용자의 행을 keyset 순서로 batch_size개씩 삭제하고 청크마다 커밋, 삭제한 행 수 반환
+    # - 이미 지나간 구간은 다시 읽지 않도록 마지막 keyset 값 이후부터 조회
+    # - 삭제는 PK로 하므로 keyset 컬럼에 NULL이 있어도 빠짐없이 삭제됨
+    # - 커서 없이 다시 조회해서 남은 행이 없을 때 종료 (삭제 중 새로 추가된 행 포함)
+    pk = list(model.__table__.primary_key.columns)
+    total = 0
+    last = None
+    while True:
+        query = select(*keyset, *pk).where(model.userId == user_id)
+        if last is not None:
+            query = query.where(tuple_(*keyset) > tuple_(*last))
+        rows = db.execute(query.order_by(*keyset).limit(batch_size)).all()
+        if not rows:
+            if last is None:
+                return total
+            last = None
+            continue
+
+        keys = [tuple(row[len(keyset):]) for row in rows]
+        db.execute(
+            delete(model)
+            .where(model.userId == user_id, tuple_(*pk).in_(keys))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        total += len(rows)
+
+        last = tuple(rows[-1][:len(keyset)]) if len(rows) == batch_size else None
+        if pause > 0:
+            time.sleep(pause)
+
+
+def purge_user(db: Session, user_id: UUID, batch_size: int = PURGE_BATCH_SIZE,
+               pause: float = PURGE_BATCH_PAUSE_SECONDS) -> Dict[str, int]:
+    # 삭제 대기 사용자의 데이터를 테이블별로 나눠서 삭제한 뒤 사용자 행 삭제, 테이블별 삭제 행 수 반환
+    deleted = {}
+    for model, keyset in USER_DATA_TABLES:
+        deleted[model.__tablename__] = purge_table(db, model, keyset, user_id, batch_size, pause)
+
+    result = db.execute(delete(User).where(User.userId == user_id, User.deletedAt.isnot(None)))
+    db.commit()
+    deleted[User.__tablename__] = result.rowcount
+    return deleted
+
+
+def get_pending_user_ids(db: Session, limit: int = 100) -> List[UUID]:
+    # 삭제 대기 사용자 (먼저 요청한 순)
+    return list(db.execute(
+        select(User.userId).where(User.deletedAt.isnot(None)).order_by(User.deletedAt).limit(limit)
+    ).scalars().all())
+
+
+class PurgeWorker:
+    # 삭제 대기 사용자 데이터를 백그라운드 스레드에서 삭제 (GAME_RESET_MODE=deferred)
+    # - interval초마다 또는 wake() 호출 시 삭제 대기 사용자를 확인
+    # - 여러 워커가 같은 사용자를 동시에 삭제해도 결과는 같음 (삭제는 멱등)
+    # - 실패한 사용자는 deletedAt이 남아 있으므로 다음 확인 때 이어서 삭제
+
+    def __init__(self, batch_size: int = PURGE_BATCH_SIZE, pause: float = PURGE_BATCH_PAUSE_SECONDS,
+                 interval: float = PURGE_INTERVAL_SECONDS):
+        self.batch_size = max(1, int(batch_size))
+        self.pause = max(0.0, float(pause))
+        self.interval = max(1.0, float(interval))
+        self.last_run: Optional[dict] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def run_once(self, db: Optional[Session] = None) -> dict:
+        # 삭제 대기 사용자를 (최대 100명) 삭제하고 처리 결과 반환
+        # db를 넘기지 않으면 별도 세션을 열어서 삭제
+        own_session = db is None
+        if own_session:
+            db = SessionLocal()
+        started = time.perf_counter()
+        users = rows = failed = 0
+        try:
+            for user_id in get_pending_user_ids(db):
+                if self._stop.is_set():
+                    break
+                try:
+                    rows += sum(purge_user(db, user_id, self.batch_size, self.pause).values())
+                    users += 1
+                except Exception as e:
+                    db.rollback()
+                    failed += 1
+                    print(f"Error purging user {user_id}: {str(e)}")
+        finally:
+            if own_session:
+                db.close()
+
+        seconds = time.perf_counter() - started
+        self.last_run = {
+            "users": users,
+            "failedUsers": failed,
+            "rows": rows,
+            "seconds": round(seconds, 3),
+            "rowsPerSecond": round(rows / seconds, 1) if seconds > 0 else 0.0
+        }
+        return self.last_run
+
+    def start(self) -> None:
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._run, name="user-purge", daemon=True)
+            self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                result = self.run_once()
+                if result["users"] or result["failedUsers"]:
+                    print(f"User purge: {result}")
+            except Exception as e:
+                print(f"Error in user purge worker: {str(e)}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+
+# 프로세스 전역 삭제 워커 (GAME_RESET_MODE=deferred일 때 서버 시작 시 실행)
+purge_worker = PurgeWorker()
@@ -1,88 +1,97 @@
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import delete, func, distinct
+from sqlalchemy import select, delete, update, func, true
 
 from app.models.user import User
 from app.models.animal import Animal
 from app.models.moneyTransaction import MoneyTransaction, TransactionDirection
-from app.models.attendance import AttendanceLog
+from app.models.attendance import AttendanceLog, AttendanceSummary
 from app.models.birthday import BirthdayReward
 from app.models.minigameattempts import MinigameAttempt
 from app.models.userminigameplays import UserMinigamePlay
+from app.models.minigame_leaderboard import MinigameLeaderboard
 from app.models.action_log import ActionLog
+from app.models.care_daily_count import CareDailyCount
+from app.models.ledger_snapshot import LedgerSnapshot
+
+# 사용자 데이터 테이블 (삭제 순서, 테이블별 keyset 컬럼)
+# keyset 컬럼은 userId로 시작하는 인덱스의 뒤쪽 컬럼 순서와 맞춤 (purge_table에서 나눠서 삭제할 때 사용)
+# 리더보드를 가장 먼저 지워서 삭제 대기 사용자가 순위에 남는 시간을 줄임
+# IdempotencyKeys는 초기화 후에도 만료 전까지 재시도 응답을 돌려주도록 남겨 둠 (purge_expired_keys로 정리)
+USER_DATA_TABLES = [
+    (MinigameLeaderboard, [MinigameLeaderboard.minigameId, MinigameLeaderboard.period, MinigameLeaderboard.periodStart]),
+    (MinigameAttempt, [MinigameAttempt.minigameAttemptId]),
+    (UserMinigamePlay, [UserMinigamePlay.minigameId, UserMinigamePlay.playDate]),
+    (ActionLog, [ActionLog.animalId, ActionLog.performedAt, ActionLog.logId]),
+    (CareDailyCount, [CareDailyCount.animalId, CareDailyCount.categoryId, CareDailyCount.date]),
+    (MoneyTransaction, [MoneyTransaction.createdAt, MoneyTransaction.txId]),
+    (LedgerSnapshot, [LedgerSnapshot.source, LedgerSnapshot.direction]),
+    (AttendanceLog, [AttendanceLog.date, AttendanceLog.attendanceId]),
+    (AttendanceSummary, [AttendanceSummary.userId]),
+    (BirthdayReward, [BirthdayReward.animalId, BirthdayReward.date, BirthdayReward.rewardId]),
+    (Animal, [Animal.animalId]),
+]
 
 def delete_user_and_related_data(db: Session, user_id: UUID):
-    # 미니게임 관련 데이터 삭제
-    db.execute(delete(MinigameAttempt).where(MinigameAttempt.userId == user_id))
-    db.execute(delete(UserMinigamePlay).where(UserMinigamePlay.userId == user_id))
-
-    # 케어 로그 삭제
-    db.execute(delete(ActionLog).where(ActionLog.userId == user_id))
-
-    # 연관 데이터 삭제 (동물, 트랜잭션, 출석, 생일 보상)
-    db.execute(delete(Animal).where(Animal.userId == user_id))
-    db.execute(delete(MoneyTransaction).where(MoneyTransaction.userId == user_id))
-    db.execute(delete(AttendanceLog).where(AttendanceLog.userId == user_id))
-    db.execute(delete(BirthdayReward).where(BirthdayReward.userId == user_id))
-
-    # 마지막으로 유저 삭제
+    # 연관 데이터 삭제 후 마지막으로 유저 삭제 (GAME_RESET_MODE=sync)
+    for model, _ in USER_DATA_TABLES:
+        db.execute(delete(model).where(model.userId == user_id))
     db.execute(delete(User).where(User.userId == user_id))
     db.commit()
 
 
-def get_user_by_id(db: Session, user_id: UUID):
-    return db.query(User).filter(User.userId == user_id).first()
-
-
-def get_ending_summary_data(db: Session, user_id: UUID):
-    # 총 플레이 일수 (출석 로그의 고유 날짜 수)
-    total_play_days = db.query(func.count(distinct(AttendanceLog.date))).filter(
-        AttendanceLog.userId == user_id
-    ).scalar() or 0
-
-    # 총 사용 금액 (direction이 'out'인 트랜잭션의 합계)
-    total_used_money = db.query(func.sum(MoneyTransaction.amount)).filter(
-        MoneyTransaction.userId == user_id,
-        MoneyTransaction.direction == TransactionDirection.OUT
-    ).scalar() or 0
-
-    # 연속 출석일 계산 (가장 최근 날짜부터 역순으로 연속된 날짜 수 계산)
-    attendance_dates = db.query(distinct(AttendanceLog.date)).filter(
-        AttendanceLog.userId == user_id
-    ).order_by(AttendanceLog.date.desc()).all()
-
-    consecutive_days = 0
-    if attendance_dates:
-        from datetime import timedelta
-        prev_date = None
-        for (date,) in attendance_dates:
-            if prev_date is None:
-                consecutive_days = 1
-                prev_date = date
-            elif prev_date - date == timedelta(days=1):
-                consecutive_days += 1
-                prev_date = date
-            else:
-                break
-
-    # 가출 횟수 (모든 동물의 누적 가출 횟수 합계)
-    runaway_count = db.query(func.sum(Animal.runawayCount)).filter(
-        Animal.userId == user_id
-    ).scalar() or 0
-
-    return {
-        "totalPlayDays": total_play_days,
-        "totalUsedMoney": total_used_money,
-        "consecutiveAttendanceDays": consecutive_days,
-        "runawayCount": runaway_count
-    }
-
-
-def check_all_animals_happy(db: Session, user_id: UUID):
-    # 세 마리의 동물이 모두 currentEmotion이 100인지 확인
-    animals = db.query(Animal).filter(Animal.userId == user_id).all()
+def mark_user_deleted(db: Session, user_id: UUID) -> bool:
+    # 삭제 대기로 표시 (GAME_RESET_MODE=deferred), 이미 표시된 사용자면 False
+    result = db.execute(
+        update(User)
+        .where(User.active(user_id))
+        .values(deletedAt=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount > 0
 
-    if len(animals) != 3:
-        return False
 
-    return all(float(animal.currentEmotion) == 100.0 for animal in animals)
+def get_user_by_id(db: Session, user_id: UUID):
+    # 삭제 대기 중인 사용자는 없는 사용자로 취급
+    return db.query(User).filter(User.active(user_id)).first()
+
+
+def ending_summary_query(user_id: UUID):
+    # 게임 요약 값과 종료 조건(동물 세 마리 모두 감정도 100)을 한 번에 조회
+    # 사용자가 없거나 삭제 대기 중이면 결과 행 없음
+    # - 총 플레이 일수 / 연속 출석일: 출석 요약 (연속 출석일은 날짜 - 순번 구간으로 계산해 둔 값)
+    # - 총 사용 금액: 거래 누적 합계의 OUT 합계
+    # - 가출 횟수 / 종료 조건: 동물 집계
+    animals = (
+        select(
+            func.count().label("animalCount"),
+            func.coalesce(func.sum(Animal.runawayCount), 0).label("runawayCount"),
+            func.coalesce(func.bool_and(Animal.currentEmotion == 100), False).label("allHappy")
+        )
+        .where(Animal.userId == user_id)
+        .cte("animals")
+    )
+    spent = (
+        select(func.coalesce(func.sum(LedgerSnapshot.totalAmount), 0).label("totalUsedMoney"))
+        .where(LedgerSnapshot.userId == user_id, LedgerSnapshot.direction == TransactionDirection.OUT)
+        .cte("spent")
+    )
+    return (
+        select(
+            func.coalesce(AttendanceSummary.attendanceDays, 0).label("totalPlayDays"),
+            spent.c.totalUsedMoney,
+            func.coalesce(AttendanceSummary.currentStreak, 0).label("consecutiveAttendanceDays"),
+            animals.c.runawayCount,
+            ((animals.c.animalCount == 3) & animals.c.allHappy).label("allHappy")
+        )
+        .select_from(User)
+        .outerjoin(AttendanceSummary, AttendanceSummary.userId == User.userId)
+        .join(spent, true())
+        .join(animals, true())
+        .where(User.active(user_id))
+    )
+
+
+def get_ending_summary(db: Session, user_id: UUID):
+    return db.execute(ending_summary_query(user_id)).first()
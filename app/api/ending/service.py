@@ -1,22 +1,37 @@
 from uuid import UUID
+from typing import Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exception import CustomException
 from app.api.ending.repository import (
     get_user_by_id,
     delete_user_and_related_data,
-    get_ending_summary_data,
-    check_all_animals_happy
+    mark_user_deleted,
+    get_ending_summary
 )
+from app.api.ending import async_repository
+from app.api.ending.purge import purge_worker
+from app.core.config import GAME_RESET_MODE, ENDING_SUMMARY_CACHE_SECONDS, ENDING_SUMMARY_CACHE_SIZE
+from app.core.cache import user_cache
 
+# 사용자별 게임 요약 캐시 (쓰기 요청이 끝나면 UserCacheInvalidationMiddleware가 무효화)
+ending_summary_cache = user_cache(ENDING_SUMMARY_CACHE_SIZE, ENDING_SUMMARY_CACHE_SECONDS)
 
-def reset_game_service(db: Session, user_id: UUID):
+
+def reset_game_service(db: Session, user_id: UUID, mode: Optional[str] = None):
     user = get_user_by_id(db, user_id)
     if not user:
         raise CustomException(message="존재하지 않는 사용자입니다.", status=404)
 
     try:
-        delete_user_and_related_data(db, user_id)
+        if (mode or GAME_RESET_MODE) == "deferred":
+            # 삭제 대기로 표시만 하고 응답, 기록은 백그라운드 워커가 나눠서 삭제
+            if not mark_user_deleted(db, user_id):
+                raise CustomException(message="존재하지 않는 사용자입니다.", status=404)
+            purge_worker.wake()
+        else:
+            delete_user_and_related_data(db, user_id)
     except Exception:
         db.rollback()
         raise
@@ -35,18 +50,43 @@ def reset_game_service(db: Session, user_id: UUID):
 
 
 def get_ending_summary_service(db: Session, user_id: UUID):
-    user = get_user_by_id(db, user_id)
-    if not user:
+    version = ending_summary_cache.version(user_id)
+    summary = ending_summary_cache.get(user_id)
+    if summary is None:
+        summary = build_ending_summary(get_ending_summary(db, user_id), user_id, version)
+    return {
+        **summary,
+        "message": "게임 요약 정보 조회 성공"
+    }
+
+
+async def get_ending_summary_service_async(db: AsyncSession, user_id: UUID):
+    # 게임 요약 조회 (비동기 세션)
+    version = ending_summary_cache.version(user_id)
+    summary = ending_summary_cache.get(user_id)
+    if summary is None:
+        summary = build_ending_summary(await async_repository.get_ending_summary(db, user_id), user_id, version)
+    return {
+        **summary,
+        "message": "게임 요약 정보 조회 성공"
+    }
+
+
+def build_ending_summary(row, user_id: UUID, version: int) -> dict:
+    # 요약 조회 결과 검증 후 캐시에 저장 (종료 조건을 만족한 요약만 저장)
+    # version: 조회 전에 받은 캐시 버전 (조회하는 동안 사용자 캐시가 무효화됐으면 저장하지 않음)
+    if row is None:
         raise CustomException(message="존재하지 않는 사용자입니다.", status=404)
 
     # 세 마리 동물 모두 감정도 100인지 확인
-    if not check_all_animals_happy(db, user_id):
+    if not row.allHappy:
         raise CustomException(message="아직 게임이 종료되지 않았습니다. 모든 동물의 감정도가 100이 되어야 합니다.", status=400)
 
-    # 요약 데이터 조회
-    summary_data = get_ending_summary_data(db, user_id)
-
-    return {
-        **summary_data,
-        "message": "게임 요약 정보 조회 성공"
+    summary = {
+        "totalPlayDays": int(row.totalPlayDays),
+        "totalUsedMoney": int(row.totalUsedMoney),
+        "consecutiveAttendanceDays": int(row.consecutiveAttendanceDays),
+        "runawayCount": int(row.runawayCount)
     }
+    ending_summary_cache.set(user_id, summary, version)
+    return summary
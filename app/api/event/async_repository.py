@@ -0,0 +1,31 @@
+# app/api/event/async_repository.py
+# event repository의 비동기(AsyncSession) 버전 - DB_ASYNC=true일 때 사용
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from datetime import date
+from uuid import UUID
+from typing import List, Optional
+from app.models.attendance import AttendanceReward, AttendanceSummary
+from app.core.catalog import catalog
+from app.api.event.repository import birthday_animals_with_reward_status_query, birthday_user_ids_query
+
+async def get_attendance_summary(db: AsyncSession, user_id: UUID) -> Optional[AttendanceSummary]:
+    # 출석 요약 한 행 조회 (출석 기록이 없으면 None)
+    return await db.get(AttendanceSummary, user_id)
+
+async def get_attendance_rewards(db: AsyncSession) -> List[AttendanceReward]:
+    # 캐시 우선 조회, 없으면 DB 조회
+    rewards = catalog.get_attendance_rewards()
+    if rewards:
+        return rewards
+    result = await db.execute(select(AttendanceReward).order_by(AttendanceReward.attendanceRewardId))
+    return list(result.scalars().all())
+
+# 오늘 생일인 동물과 보상 수령 여부를 한 번에 조회 (animalId, name, rewarded)
+async def get_birthday_animals_with_reward_status(db: AsyncSession, user_id: UUID, today: date) -> List[tuple]:
+    result = await db.execute(birthday_animals_with_reward_status_query(user_id, today))
+    return list(result.all())
+
+async def get_birthday_user_ids(db: AsyncSession, today: date, limit: int) -> List[UUID]:
+    result = await db.execute(birthday_user_ids_query(today, limit))
+    return list(result.scalars().all())
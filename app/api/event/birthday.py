@@ -0,0 +1,63 @@
+# app/api/event/birthday.py
+import threading
+import time
+from datetime import date
+from typing import Iterable, Optional, Set
+from uuid import UUID
+from app.core.config import BIRTHDAY_CALENDAR_MAX_USERS, BIRTHDAY_CALENDAR_REFRESH_SECONDS
+from app.api.event.repository import birthday_key
+
+
+class BirthdayCalendar:
+    # 오늘 생일인 동물이 있는 사용자 ID 집합 (하루에 한 번 적재, refresh_seconds마다 다시 적재)
+    # - 집합에 없는 사용자는 DB 조회 없이 "생일 동물 없음"으로 응답
+    # - 대상 사용자가 max_users를 넘는 날은 집합을 만들지 않고 항상 DB 조회 (메모리 제한)
+    # - 같은 프로세스에서 새로 추가된 동물은 생성 시 add_animal로 바로 반영 (다른 워커는 다시 적재할 때 반영)
+
+    def __init__(self, max_users: int = BIRTHDAY_CALENDAR_MAX_USERS, refresh_seconds: int = BIRTHDAY_CALENDAR_REFRESH_SECONDS):
+        self.max_users = max(0, int(max_users))
+        self.refresh_seconds = refresh_seconds
+        self._day: Optional[date] = None
+        self._user_ids: Optional[Set[UUID]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def needs_load(self, today: date) -> bool:
+        if self._day != today:
+            return True
+        return self.refresh_seconds > 0 and time.monotonic() - self._loaded_at > self.refresh_seconds
+
+    def load(self, today: date, user_ids: Iterable[UUID]) -> None:
+        # user_ids는 max_users + 1개까지 조회한 결과 (넘으면 캐시하지 않음)
+        user_ids = set(user_ids)
+        with self._lock:
+            self._day = today
+            self._user_ids = user_ids if len(user_ids) <= self.max_users else None
+            self._loaded_at = time.monotonic()
+
+    def has_birthday(self, user_id: UUID, today: date) -> Optional[bool]:
+        # 집합으로 판단할 수 없으면 None (DB 조회 필요)
+        with self._lock:
+            if self._day != today or self._user_ids is None:
+                return None
+            return user_id in self._user_ids
+
+    def add(self, user_id: UUID, today: date) -> None:
+        with self._lock:
+            if self._day == today and self._user_ids is not None:
+                self._user_ids.add(user_id)
+
+    def add_animal(self, user_id: UUID, birthday: date, today: date) -> None:
+        # 새로 만든 동물의 생일이 오늘이면 사용자 추가
+        if birthday_key(birthday) == birthday_key(today):
+            self.add(user_id, today)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._day = None
+            self._user_ids = None
+
+
+# 프로세스 전역 생일 캘린더
+birthday_calendar = BirthdayCalendar()
+
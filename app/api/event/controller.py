@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends, Header
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_db, get_async_db
+from app.core.config import DB_ASYNC, KST
+from datetime import datetime
 from app.api.event.service import get_attendance_data, check_in_attendance, get_birthday_animals, give_birthday_reward
+from app.api.event.service import get_attendance_data_async, get_birthday_animals_async
 from app.api.event.schema import AttendanceResponse
 from uuid import UUID
 from app.core.exception import CustomException
@@ -16,7 +19,10 @@ from app.api.event.schema import (
 )
 router = APIRouter(prefix="/api/v1/events", tags=["event"])
 
-@router.get("/attendance", response_model=AttendanceResponse)
+# 비동기 세션 조회 API (DB_ASYNC=true일 때 같은 경로의 동기 API보다 먼저 등록됨)
+async_router = APIRouter(prefix="/api/v1/events", tags=["event"])
+
+@router.get("/attendance", response_model=AttendanceResponse, include_in_schema=not DB_ASYNC)
 def attendance_info(user_id: UUID = Header(..., alias="user-id"), db: Session = Depends(get_db)):
     if not user_id:
         raise CustomException(message = "user-id 헤더가 누락되었거나 유효하지 않습니다.", status=401)
@@ -62,7 +68,7 @@ def birthday_reward(
         raise CustomException(message="user-id 헤더가 누락되었거나 유효하지 않습니다.", status=401)
 
     try:
-        data = give_birthday_reward(user_id, date.today(), db)
+        data = give_birthday_reward(user_id, datetime.now(KST).date(), db)
         reward_data = BirthdayRewardData(
             animal_id=data['animal_id'],
             name=data['name'],
@@ -85,13 +91,17 @@ def birthday_reward(
         raise CustomException(message="서버 내부 오류가 발생했습니다.", status=500)
 
 
-@router.get("/birthday", response_model=BirthdayAnimalsResponse, summary="생일인 동물 조회")
+@router.get("/birthday", response_model=BirthdayAnimalsResponse, summary="생일인 동물 조회", include_in_schema=not DB_ASYNC)
 def birthday_animals(user_id: UUID = Header(..., alias="user-id"), db: Session = Depends(get_db)):
     if not user_id:
         raise CustomException(message="user-id 헤더가 누락되었거나 유효하지 않습니다.", status=401)
 
-    today = date.today()
+    today = datetime.now(KST).date()
     today_animals_data = get_birthday_animals(user_id, today, db)
+    return build_birthday_animals_response(today_animals_data)
+
+
+def build_birthday_animals_response(today_animals_data) -> BirthdayAnimalsResponse:
     today_animals = [
         BirthdayAnimalInfo(
             animalId=a["animalId"],
@@ -108,3 +118,25 @@ def birthday_animals(user_id: UUID = Header(..., alias="user-id"), db: Session =
         message=message,
         data=today_animals
     )
+
+
+@async_router.get("/attendance", response_model=AttendanceResponse)
+async def attendance_info_async(user_id: UUID = Header(..., alias="user-id"), db: AsyncSession = Depends(get_async_db)):
+    try:
+        data = await get_attendance_data_async(user_id, db)
+        return {
+            "status": 200,
+            "message": "출석 정보 조회 성공",
+            "data": data
+        }
+    except CustomException:
+        raise
+    except Exception:
+        traceback.print_exc()
+        raise CustomException(message = "서버 내부 오류가 발생했습니다.", status=500)
+
+
+@async_router.get("/birthday", response_model=BirthdayAnimalsResponse, summary="생일인 동물 조회")
+async def birthday_animals_async(user_id: UUID = Header(..., alias="user-id"), db: AsyncSession = Depends(get_async_db)):
+    today_animals_data = await get_birthday_animals_async(user_id, datetime.now(KST).date(), db)
+    return build_birthday_animals_response(today_animals_data)
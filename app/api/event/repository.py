@@ -1,60 +1,152 @@
 from sqlalchemy.orm import Session
-from datetime import date
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from datetime import date, timedelta
 from uuid import UUID
-from typing import List, Optional
-from app.models.attendance import AttendanceLog, AttendanceReward
+from typing import Iterable, List, Optional
+from app.models.attendance import AttendanceLog, AttendanceReward, AttendanceSummary
 from app.models.birthday import BirthdayReward
 from app.models.animal import Animal
-from sqlalchemy import extract
-
-def get_attendance_logs(db: Session, user_id: UUID) -> List[AttendanceLog]:
-    return db.query(AttendanceLog).filter(AttendanceLog.userId == user_id).all()
-
-def get_today_attendance_log(db: Session, user_id: UUID, today: date) -> Optional[AttendanceLog]:
-    return db.query(AttendanceLog).filter(
-        AttendanceLog.userId == user_id,
-        AttendanceLog.date == today
-    ).first()
+from app.models.user import User
+from sqlalchemy import and_, select, insert, delete, func, case, cast, literal, BigInteger, Integer
+from app.core.catalog import catalog
 
 def get_attendance_rewards(db: Session) -> List[AttendanceReward]:
+    # 캐시 우선 조회, 없으면 DB 조회
+    rewards = catalog.get_attendance_rewards()
+    if rewards:
+        return rewards
     return db.query(AttendanceReward).order_by(AttendanceReward.attendanceRewardId).all()
 
 def get_reward_by_index(db: Session, index: int) -> Optional[AttendanceReward]:
+    reward = catalog.get_attendance_reward(index)
+    if reward is not None:
+        return reward
     return db.query(AttendanceReward).filter(
         AttendanceReward.attendanceRewardId == index
     ).first()
 
-def create_and_save_attendance_log(db: Session, user_id: UUID, today: date, reward_id: int) -> AttendanceLog:
-    log = AttendanceLog(
-        date=today,
+def get_attendance_summary(db: Session, user_id: UUID) -> Optional[AttendanceSummary]:
+    # 출석 요약 한 행 조회 (출석 기록이 없으면 None)
+    return db.get(AttendanceSummary, user_id)
+
+def claim_today_attendance(db: Session, user_id: UUID, today: date):
+    # 오늘 출석을 요약 행에 한 문장으로 반영하고 (totalCount, rewardMask) 반환 (이미 오늘 출석했으면 None)
+    # 출석판 순서는 기존 출석 수 기준 (((totalCount - 1) % 7) + 1), 해당 보상 ID 비트를 함께 기록
+    summary = AttendanceSummary
+    stmt = pg_insert(summary).values(
         userId=user_id,
-        attendanceRewardId=reward_id
+        totalCount=1,
+        attendanceDays=1,
+        lastDate=today,
+        currentStreak=1,
+        rewardMask=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[summary.userId],
+        set_={
+            "totalCount": summary.totalCount + 1,
+            "attendanceDays": summary.attendanceDays + 1,
+            "currentStreak": case(
+                (summary.lastDate == today - timedelta(days=1), summary.currentStreak + 1),
+                else_=1
+            ),
+            "lastDate": today,
+            "rewardMask": summary.rewardMask.op("|")(cast(literal(1), BigInteger).op("<<")(summary.totalCount % 7)),
+            "updatedAt": func.now()
+        },
+        where=(summary.lastDate.is_(None)) | (summary.lastDate < today)
+    ).returning(summary.totalCount, summary.rewardMask)
+    return db.execute(stmt).first()
+
+def create_attendance_log(db: Session, user_id: UUID, today: date, reward_id: int) -> None:
+    # 출석 로그 저장 (요약은 claim_today_attendance에서 이미 갱신했으므로 Core INSERT 사용)
+    db.execute(insert(AttendanceLog).values(date=today, userId=user_id, attendanceRewardId=reward_id))
+
+def rebuild_attendance_summaries(db, user_ids: Optional[Iterable[UUID]] = None) -> None:
+    # AttendanceLogs 기준으로 출석 요약 재계산 (체크인 외 경로로 추가된 로그 반영 / 정합성 점검용)
+    # 날짜별로 묶은 뒤 (날짜 - 순번)이 같은 구간을 연속 출석으로 보고, 마지막 날짜가 속한 구간 길이를 연속 출석일로 사용
+    # AttendanceLogs에는 FK가 없으므로 Users에 없는 사용자의 로그는 제외 (AttendanceSummaries.userId는 Users FK)
+    log = AttendanceLog
+    user_ids = list(user_ids) if user_ids is not None else None
+    summary_filter = [AttendanceSummary.userId.in_(user_ids)] if user_ids is not None else []
+    log_filter = [log.userId.in_(user_ids)] if user_ids is not None else []
+
+    reward_bit = case(
+        (log.attendanceRewardId.between(1, 63), cast(literal(1), BigInteger).op("<<")(log.attendanceRewardId - 1)),
+        else_=cast(literal(0), BigInteger)
+    )
+    days = (
+        select(log.userId, log.date, func.count().label("n"), func.bit_or(reward_bit).label("mask"))
+        .where(*log_filter, log.userId.in_(select(User.userId)))
+        .group_by(log.userId, log.date)
+        .subquery("days")
+    )
+    grouped = select(
+        days,
+        (days.c.date - cast(func.row_number().over(partition_by=days.c.userId, order_by=days.c.date), Integer)).label("grp")
+    ).subquery("grouped")
+    ranked = select(
+        grouped,
+        func.first_value(grouped.c.grp).over(partition_by=grouped.c.userId, order_by=grouped.c.date.desc()).label("lastGrp")
+    ).subquery("ranked")
+
+    db.execute(delete(AttendanceSummary).where(*summary_filter))
+    db.execute(
+        pg_insert(AttendanceSummary).from_select(
+            ["userId", "totalCount", "attendanceDays", "lastDate", "rewardMask", "currentStreak"],
+            select(
+                ranked.c.userId,
+                func.sum(ranked.c.n),
+                func.count(),
+                func.max(ranked.c.date),
+                func.bit_or(ranked.c.mask),
+                func.count().filter(ranked.c.grp == ranked.c.lastGrp)
+            ).group_by(ranked.c.userId)
+        )
     )
-    db.add(log)
-    return log
 
-def save_attendance_log(db: Session, log: AttendanceLog) -> None:
-    db.add(log)
+def birthday_key(day: date) -> int:
+    # 날짜 -> Animals.birthdayKey 값 (MMDD)
+    return day.month * 100 + day.day
 
 # 오늘 생일인 동물 하나 조회
 def get_birthday_animal_by_user_and_date(db: Session, user_id: UUID, today: date) -> Optional[Animal]:
     return db.query(Animal).filter(
-        Animal.userId == user_id,
-        extract("month", Animal.birthday) == today.month,
-        extract("day", Animal.birthday) == today.day
-        # extract("month", Animal.birthday) == 4,
-        # extract("day", Animal.birthday) == 19
-    ).first()
+        Animal.birthdayKey == birthday_key(today),
+        Animal.userId == user_id
+    ).order_by(Animal.animalId).first()
 
-# 오늘 생일인 모든 동물 조회 (수정 완료)
+# 오늘 생일인 모든 동물 조회
 def get_birthday_animals_by_user_and_date(db: Session, user_id: UUID, today: date) -> List[Animal]:
     return db.query(Animal).filter(
-        Animal.userId == user_id,
-        extract("month", Animal.birthday) == today.month,
-        extract("day", Animal.birthday) == today.day
-        # extract("month", Animal.birthday) == 4,
-        # extract("day", Animal.birthday) == 19
-    ).all()
+        Animal.birthdayKey == birthday_key(today),
+        Animal.userId == user_id
+    ).order_by(Animal.animalId).all()
+
+# 오늘 생일인 동물과 보상 수령 여부를 한 번에 조회 (animalId, name, rewarded)
+def get_birthday_animals_with_reward_status(db: Session, user_id: UUID, today: date) -> List[tuple]:
+    return db.execute(birthday_animals_with_reward_status_query(user_id, today)).all()
+
+def birthday_animals_with_reward_status_query(user_id: UUID, today: date):
+    # BirthdayRewards를 LEFT JOIN해서 동물별 반복 조회(N+1) 없이 조회
+    return (
+        select(Animal.animalId, Animal.name, (func.count(BirthdayReward.rewardId) > 0).label("rewarded"))
+        .outerjoin(BirthdayReward, and_(
+            BirthdayReward.userId == Animal.userId,
+            BirthdayReward.animalId == Animal.animalId,
+            BirthdayReward.date == today
+        ))
+        .where(Animal.birthdayKey == birthday_key(today), Animal.userId == user_id)
+        .group_by(Animal.animalId, Animal.name)
+        .order_by(Animal.animalId)
+    )
+
+def birthday_user_ids_query(today: date, limit: int):
+    # 오늘 생일인 동물이 있는 사용자 ID (limit개까지)
+    return select(Animal.userId).where(Animal.birthdayKey == birthday_key(today)).distinct().limit(limit)
+
+def get_birthday_user_ids(db: Session, today: date, limit: int) -> List[UUID]:
+    return list(db.execute(birthday_user_ids_query(today, limit)).scalars().all())
 
 # 오늘 생일 보상 지급 여부 확인
 def has_birthday_reward_been_given(db: Session, user_id: UUID, animal_id: int, today: date) -> bool:
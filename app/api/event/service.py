@@ -1,20 +1,35 @@
-from datetime import date
+from datetime import date, datetime
 from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.event.schema import AttendanceResponseData, Reward, BoardItem
 from app.core.exception import CustomException
+from app.core.database import SessionLocal
+from app.core.config import KST
 from app.models.attendance import AttendanceReward
 from app.api.event import repository
+from app.api.event import async_repository
+from app.api.event.birthday import birthday_calendar
 from app.api.user.service import process_transaction
 
 # 출석 보상 조회(/events/attendance)
 def get_attendance_data(user_id: UUID, db: Session) -> AttendanceResponseData:
-    today = date.today()
-    logs = repository.get_attendance_logs(db, user_id)
+    today = datetime.now(KST).date()
+    summary = repository.get_attendance_summary(db, user_id)
     rewards = repository.get_attendance_rewards(db)
-
-    total_attendance = len(logs)
-    already_checked_in = any(log.date == today for log in logs)
+    return build_attendance_data(summary, rewards, today)
+
+# 출석 보상 조회 (비동기 세션)
+async def get_attendance_data_async(user_id: UUID, db: AsyncSession) -> AttendanceResponseData:
+    today = datetime.now(KST).date()
+    summary = await async_repository.get_attendance_summary(db, user_id)
+    rewards = await async_repository.get_attendance_rewards(db)
+    return build_attendance_data(summary, rewards, today)
+
+def build_attendance_data(summary, rewards, today: date) -> AttendanceResponseData:
+    # 출석 요약 한 행으로 출석판 구성 (출석 로그 전체 조회 없음)
+    total_attendance = summary.totalCount if summary else 0
+    already_checked_in = summary is not None and summary.lastDate == today
     today_index = ((total_attendance - 1) % 7) + 1
 
     today_reward_row = next((r for r in rewards if r.attendanceRewardId == today_index), None)
@@ -23,79 +38,71 @@ def get_attendance_data(user_id: UUID, db: Session) -> AttendanceResponseData:
         amount=today_reward_row.rewardAmount
     ) if today_reward_row else Reward(type="money", amount=0)
 
-    checked_day_ids = {log.attendanceRewardId for log in logs}
-    board = [
-        BoardItem(
-            day=reward.attendanceRewardId,
-            reward=reward.rewardAmount,
-            checkedIn=reward.attendanceRewardId in checked_day_ids
-        )
-        for reward in rewards
-    ]
-
     return AttendanceResponseData(
         alreadyCheckedIn=already_checked_in,
         totalAttendance=total_attendance,
         todayIndex=today_index,
         todayReward=today_reward,
-        board=board
+        board=build_attendance_board(rewards, summary.rewardMask if summary else 0)
     )
 
+def build_attendance_board(rewards, reward_mask: int) -> list:
+    # 보상 ID n의 출석 여부는 rewardMask의 n-1번째 비트
+    return [
+        BoardItem(
+            day=reward.attendanceRewardId,
+            reward=reward.rewardAmount,
+            checkedIn=bool(reward_mask >> (reward.attendanceRewardId - 1) & 1)
+        )
+        for reward in rewards
+    ]
+
 # 출석 보상 받기(/events/attendance/checkin)
 def check_in_attendance(user_id: UUID, db: Session) -> AttendanceResponseData:
-    today = date.today()
+    today = datetime.now(KST).date()
 
-    if repository.get_today_attendance_log(db, user_id, today):
-        raise CustomException(message="이미 오늘 출석하셨습니다.", status=409)
+    try:
+        # 출석 요약 행을 원자적으로 갱신 (오늘 이미 출석했으면 갱신되지 않음)
+        claimed = repository.claim_today_attendance(db, user_id, today)
+        if claimed is None:
+            raise CustomException(message="이미 오늘 출석하셨습니다.", status=409)
 
-    # 누적 출석 수 계산 (기존 로그 수)
-    logs = repository.get_attendance_logs(db, user_id)
-    total_attendance = len(logs) + 1  # 오늘 포함
-    today_index = ((total_attendance - 1) % 7) + 1
+        total_attendance, reward_mask = claimed  # 오늘 포함
+        today_index = ((total_attendance - 1) % 7) + 1
 
-    reward_row = repository.get_reward_by_index(db, today_index)
-    if not reward_row:
-        reward_row = AttendanceReward(attendanceRewardId=today_index, rewardAmount=0, rewardType="money")
+        reward_row = repository.get_reward_by_index(db, today_index)
+        if not reward_row:
+            reward_row = AttendanceReward(attendanceRewardId=today_index, rewardAmount=0, rewardType="money")
+
+        repository.create_attendance_log(db, user_id, today, reward_row.attendanceRewardId)
 
-    try:
-        new_log = repository.create_and_save_attendance_log(db, user_id, today, reward_row.attendanceRewardId)
-        
         # 유저 보상 지급 처리
         process_transaction(db, user_id, reward_row.rewardAmount, "attendance", commit=False)
-        
+
         db.commit()
     except Exception:
         db.rollback()
         raise
 
-    all_logs = logs + [new_log]
-    checked_day_ids = {log.attendanceRewardId for log in all_logs}
     rewards = repository.get_attendance_rewards(db)
 
-    board = [
-        BoardItem(
-            day=reward.attendanceRewardId,
-            reward=reward.rewardAmount,
-            checkedIn=reward.attendanceRewardId in checked_day_ids
-        )
-        for reward in rewards
-    ]
-
     return AttendanceResponseData(
         alreadyCheckedIn=False,
         totalAttendance=total_attendance,
         todayIndex=today_index,
         todayReward=Reward(type=reward_row.rewardType, amount=reward_row.rewardAmount),
-        board=board
+        board=build_attendance_board(rewards, reward_mask)
     )
 
 # 생일 축하 선물 받기(/events/birthday/reward)
 def give_birthday_reward(user_id: UUID, today: date, db: Session):
-    animal = repository.get_birthday_animal_by_user_and_date(db, user_id, today)
-    if not animal:
+    # 생일 여부와 보상 수령 여부를 한 번에 조회 (지급은 캘린더 캐시 없이 항상 DB 기준)
+    animals = repository.get_birthday_animals_with_reward_status(db, user_id, today)
+    if not animals:
         raise CustomException(message="오늘 생일이 아님", status=403)
 
-    if repository.has_birthday_reward_been_given(db, user_id, animal.animalId, today):
+    animal = animals[0]
+    if animal.rewarded:
         raise CustomException(message="이미 선물 수령함", status=409)
 
     REWARD_AMOUNT = 100
@@ -124,12 +131,39 @@ def give_birthday_reward(user_id: UUID, today: date, db: Session):
     
 # 오늘 생일인 동물 조회(/events/birthday)
 def get_birthday_animals(user_id: UUID, today: date, db: Session):
-    animals = repository.get_birthday_animals_by_user_and_date(db, user_id, today)
+    if birthday_calendar.needs_load(today):
+        birthday_calendar.load(today, repository.get_birthday_user_ids(db, today, birthday_calendar.max_users + 1))
+    if birthday_calendar.has_birthday(user_id, today) is False:
+        return []
+    return to_birthday_animals(repository.get_birthday_animals_with_reward_status(db, user_id, today))
+
+# 오늘 생일인 동물 조회 (비동기 세션)
+async def get_birthday_animals_async(user_id: UUID, today: date, db: AsyncSession):
+    if birthday_calendar.needs_load(today):
+        birthday_calendar.load(today, await async_repository.get_birthday_user_ids(db, today, birthday_calendar.max_users + 1))
+    if birthday_calendar.has_birthday(user_id, today) is False:
+        return []
+    return to_birthday_animals(await async_repository.get_birthday_animals_with_reward_status(db, user_id, today))
+
+# 스케줄러 작업 - 날짜가 바뀌면 오늘 생일 사용자 집합을 미리 적재하고 적재한 사용자 수 반환
+# (출석은 체크인 시 lastDate와 오늘 날짜를 비교하므로 날짜 경계에 따로 처리할 데이터가 없음)
+def load_birthday_calendar_job() -> int:
+    # 스케줄러 실행 시각(SCHEDULER_DAILY_AT)과 같은 TIMEZONE 기준 날짜로 적재
+    today = datetime.now(KST).date()
+    db = SessionLocal()
+    try:
+        user_ids = repository.get_birthday_user_ids(db, today, birthday_calendar.max_users + 1)
+    finally:
+        db.close()
+    birthday_calendar.load(today, user_ids)
+    return len(user_ids)
+
+def to_birthday_animals(rows) -> list:
     return [
         {
-            "animalId": a.animalId,
-            "name": a.name,
-            "rewarded": repository.has_birthday_reward_been_given(db, user_id, a.animalId, today)
+            "animalId": row.animalId,
+            "name": row.name,
+            "rewarded": row.rewarded
         }
-        for a in animals
+        for row in rows
     ]
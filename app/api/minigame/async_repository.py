@@ -0,0 +1,68 @@
+# app/api/minigame/async_repository.py
+# minigame repository의 비동기(AsyncSession) 버전 - DB_ASYNC=true일 때 사용
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from datetime import date
+from uuid import UUID
+from typing import List, Optional
+
+from app.models.minigames import Minigame
+from app.models.userminigameplays import UserMinigamePlay
+from app.models.minigame_leaderboard import MinigameLeaderboard
+from app.core.catalog import catalog
+from app.api.minigame.repository import kst_today
+
+async def get_minigame_by_id(db: AsyncSession, game_id: int) -> Optional[Minigame]:
+    # 게임 ID로 미니게임 정보 조회 (캐시 우선 조회, 없으면 DB 조회)
+    minigame = catalog.get_minigame(game_id)
+    if minigame is not None:
+        return minigame
+    result = await db.execute(select(Minigame).where(Minigame.minigameId == game_id).limit(1))
+    return result.scalars().first()
+
+async def get_minigames(db: AsyncSession) -> List[Minigame]:
+    # 전체 미니게임 목록 (캐시 우선 조회, 없으면 DB 조회)
+    minigames = catalog.get_minigames()
+    if minigames:
+        return minigames
+    result = await db.execute(select(Minigame).order_by(Minigame.minigameId))
+    return list(result.scalars().all())
+
+async def get_user_daily_play_count(db: AsyncSession, user_id: UUID, game_id: int, play_date: date = None) -> int:
+    # 사용자의 특정 게임 일일 플레이 횟수 조회
+    if play_date is None:
+        play_date = kst_today()
+
+    result = await db.execute(
+        select(UserMinigamePlay.playCount).where(
+            UserMinigamePlay.userId == user_id,
+            UserMinigamePlay.minigameId == game_id,
+            UserMinigamePlay.playDate == play_date
+        ).limit(1)
+    )
+    return result.scalar() or 0
+
+async def get_leaderboard_top(db: AsyncSession, game_id: int, period: str, period_start: date, limit: int) -> List[tuple]:
+    # 기간 상위 limit명 (점수 내림차순, 동점이면 먼저 달성한 순)
+    board = MinigameLeaderboard
+    result = await db.execute(
+        select(board.userId, board.bestScore, board.timeSpent, board.achievedAt)
+        .where(board.minigameId == game_id, board.period == period, board.periodStart == period_start)
+        .order_by(board.bestScore.desc(), board.achievedAt)
+        .limit(limit)
+    )
+    return list(result.all())
+
+async def get_leaderboard_score_counts(db: AsyncSession, game_id: int, period: str, period_start: date) -> List[tuple]:
+    # 기간 내 점수별 사용자 수 (순위 계산용 히스토그램 적재)
+    board = MinigameLeaderboard
+    result = await db.execute(
+        select(board.bestScore, func.count())
+        .where(board.minigameId == game_id, board.period == period, board.periodStart == period_start)
+        .group_by(board.bestScore)
+    )
+    return list(result.all())
+
+async def get_leaderboard_entry(db: AsyncSession, game_id: int, period: str, period_start: date, user_id: UUID) -> Optional[MinigameLeaderboard]:
+    # 사용자 기간 최고 기록 (PK 조회)
+    return await db.get(MinigameLeaderboard, (game_id, period, period_start, user_id))
@@ -1,16 +1,33 @@
-from fastapi import APIRouter, Depends, Header, Path
+from fastapi import APIRouter, Depends, Header, Path, Query
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_db, get_async_db
 from .service import start_minigame
 from .schema import MinigameStartResponse
 from uuid import UUID
-from typing import Annotated
-from app.api.minigame.schema import MinigameResultRequest, MinigameResultResponse
-from app.api.minigame.service import process_minigame_result
+from typing import Annotated, Optional
+from app.api.minigame.schema import MinigameResultRequest, MinigameResultResponse, LeaderboardResponse
+from app.api.minigame.schema import MinigameListResponse, MinigamePlayCountResponse
+from app.api.minigame.service import process_minigame_result, get_leaderboard_service, get_minigames_service, get_play_count_service
+from app.api.minigame.service import get_leaderboard_service_async, get_minigames_service_async, get_play_count_service_async
+from app.core.config import LEADERBOARD_TOP_K, DB_ASYNC
 from app.core.exception import CustomException
 
 router = APIRouter(prefix="/api/v1/minigames", tags=["Minigame"])
 
+# 비동기 세션 조회 API (DB_ASYNC=true일 때 같은 경로의 동기 API보다 먼저 등록됨)
+async_router = APIRouter(prefix="/api/v1/minigames", tags=["Minigame"])
+
+# 미니게임 목록 조회
+@router.get("", response_model=MinigameListResponse, summary="미니게임 목록 조회", include_in_schema=not DB_ASYNC)
+def get_minigames(db: Session = Depends(get_db)):
+    return get_minigames_service(db)
+
+# 오늘 플레이 횟수 조회
+@router.get("/{gameId}/plays/today", response_model=MinigamePlayCountResponse, summary="오늘 플레이 횟수 조회", include_in_schema=not DB_ASYNC)
+def get_play_count(gameId: int, user_id: UUID = Header(..., alias="user-id"), db: Session = Depends(get_db)):
+    return get_play_count_service(db, user_id, gameId)
+
 # 미니게임 플레이 요청
 @router.post("/{game_id}/start", response_model=MinigameStartResponse, summary="미니게임 플레이 요청")
 def start_game(
@@ -47,3 +64,47 @@ async def submit_minigame_result(
     
     # 미니게임 결과 처리
     return process_minigame_result(db, user_uuid, gameId, result_data)
+
+
+# 미니게임 리더보드 조회
+@router.get("/{gameId}/leaderboard", response_model=LeaderboardResponse, summary="미니게임 리더보드 조회", include_in_schema=not DB_ASYNC)
+def get_leaderboard(
+    gameId: int,
+    period: str = Query("daily", description="기간 (daily, weekly, all)"),
+    limit: int = Query(10, ge=1, le=LEADERBOARD_TOP_K, description="상위 인원 수"),
+    user_id: Optional[UUID] = Header(None, alias="user-id"),
+    db: Session = Depends(get_db)
+):
+    # 상위 기록은 메모리 상위 K명 목록, 사용자 순위는 점수 분포에서 조회 (MinigameAttempts 정렬 없음)
+    try:
+        return get_leaderboard_service(db, gameId, period, limit, user_id)
+    except CustomException as e:
+        raise e
+    except Exception:
+        raise CustomException(message="서버 내부 오류가 발생했습니다.", status=500)
+
+
+@async_router.get("", response_model=MinigameListResponse, summary="미니게임 목록 조회")
+async def get_minigames_async(db: AsyncSession = Depends(get_async_db)):
+    return await get_minigames_service_async(db)
+
+
+@async_router.get("/{gameId}/plays/today", response_model=MinigamePlayCountResponse, summary="오늘 플레이 횟수 조회")
+async def get_play_count_async(gameId: int, user_id: UUID = Header(..., alias="user-id"), db: AsyncSession = Depends(get_async_db)):
+    return await get_play_count_service_async(db, user_id, gameId)
+
+
+@async_router.get("/{gameId}/leaderboard", response_model=LeaderboardResponse, summary="미니게임 리더보드 조회")
+async def get_leaderboard_async(
+    gameId: int,
+    period: str = Query("daily", description="기간 (daily, weekly, all)"),
+    limit: int = Query(10, ge=1, le=LEADERBOARD_TOP_K, description="상위 인원 수"),
+    user_id: Optional[UUID] = Header(None, alias="user-id"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        return await get_leaderboard_service_async(db, gameId, period, limit, user_id)
+    except CustomException as e:
+        raise e
+    except Exception:
+        raise CustomException(message="서버 내부 오류가 발생했습니다.", status=500)
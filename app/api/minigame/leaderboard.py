@@ -0,0 +1,230 @@
+# app/api/minigame/leaderboard.py
+import bisect
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import LEADERBOARD_TOP_K, LEADERBOARD_REFRESH_SECONDS
+from app.models.minigame_leaderboard import LEADERBOARD_PERIODS, ALL_TIME_PERIOD_START
+from app.api.minigame.repository import get_leaderboard_top, get_leaderboard_score_counts, get_leaderboard_entry
+from app.api.minigame import async_repository
+
+# (minigameId, period, periodStart)
+BoardKey = Tuple[int, str, date]
+
+# 점수 컬럼(Integer) 범위
+MAX_SCORE_BITS = 31
+
+
+def period_start(period: str, day: date) -> date:
+    # 날짜 -> 기간 시작일 (daily: 당일, weekly: 해당 주 월요일, all: 고정값)
+    if period == "daily":
+        return day
+    if period == "weekly":
+        return day - timedelta(days=day.weekday())
+    return ALL_TIME_PERIOD_START
+
+
+class ScoreHistogram:
+    # 점수별 사용자 수 Fenwick 트리 (dict 기반이라 점수 범위만큼 메모리를 미리 잡지 않음)
+    # 추가/삭제와 "점수 초과 인원" 조회 모두 O(log MAX_SCORE)
+
+    def __init__(self):
+        self._tree: Dict[int, int] = {}
+        self._size = 1 << MAX_SCORE_BITS
+        self.total = 0
+
+    def add(self, score: int, delta: int = 1) -> None:
+        index = min(max(score, 0), self._size - 1) + 1
+        while index <= self._size:
+            self._tree[index] = self._tree.get(index, 0) + delta
+            index += index & -index
+        self.total += delta
+
+    def count_at_most(self, score: int) -> int:
+        if score < 0:
+            return 0
+        index = min(score, self._size - 1) + 1
+        count = 0
+        while index > 0:
+            count += self._tree.get(index, 0)
+            index -= index & -index
+        return count
+
+    def count_above(self, score: int) -> int:
+        return self.total - self.count_at_most(score)
+
+
+class Board:
+    # 한 게임/기간의 순위 구조
+    # - histogram: 전체 사용자 점수 분포 (순위 계산)
+    # - top: 상위 top_k명 (-점수, 달성 시각, userId) 정렬 목록, 점수는 올라가기만 하므로 새 기록만 끼워 넣으면 됨
+
+    def __init__(self, top_k: int):
+        self.top_k = top_k
+        self.histogram = ScoreHistogram()
+        self.top: List[tuple] = []
+        self.entries: Dict[str, tuple] = {}   # str(userId) -> (정렬 키, userId, timeSpent)
+        self.loaded_at = time.monotonic()
+
+    def load(self, score_counts: List[tuple], top_rows: List[tuple]) -> None:
+        for score, count in score_counts:
+            self.histogram.add(score, count)
+        for user_id, score, time_spent, achieved_at in top_rows:
+            self._insert_top(user_id, score, time_spent, achieved_at)
+
+    def apply(self, user_id: UUID, old_score: Optional[int], new_score: int, time_spent: Optional[int], achieved_at: datetime) -> None:
+        # 최고 점수 갱신 반영 (처음 기록이면 old_score None)
+        if old_score is not None:
+            if new_score <= old_score:
+                return
+            self.histogram.add(old_score, -1)
+        self.histogram.add(new_score, 1)
+        self._insert_top(user_id, new_score, time_spent, achieved_at)
+
+    def rank_of(self, score: int) -> int:
+        # 동점자는 같은 순위 (자신보다 높은 점수 인원 + 1)
+        return self.histogram.count_above(score) + 1
+
+    def top_entries(self, limit: int) -> List[tuple]:
+        # 상위 limit명 (userId, 점수, timeSpent, 달성 시각)
+        result = []
+        for key in self.top[:limit]:
+            _, user_id, time_spent = self.entries[key[2]]
+            result.append((user_id, -key[0], time_spent, key[1]))
+        return result
+
+    def _insert_top(self, user_id: UUID, score: int, time_spent: Optional[int], achieved_at: datetime) -> None:
+        key = (-score, achieved_at, str(user_id))
+        if len(self.top) >= self.top_k and key >= self.top[-1]:
+            return
+
+        previous = self.entries.pop(key[2], None)
+        if previous is not None:
+            self.top.pop(bisect.bisect_left(self.top, previous[0]))
+        bisect.insort(self.top, key)
+        self.entries[key[2]] = (key, user_id, time_spent)
+
+        if len(self.top) > self.top_k:
+            removed = self.top.pop()
+            del self.entries[removed[2]]
+
+
+class LeaderboardEngine:
+    # 게임별 daily/weekly/all 리더보드 (MinigameLeaderboards 요약 테이블 기반)
+    # - 보드는 처음 조회할 때 상위 K명과 점수 분포만 적재 (MinigameAttempts 정렬 없음)
+    # - 결과 저장이 커밋되면 record()로 메모리 구조를 바로 갱신
+    # - refresh_seconds가 지나면 다시 적재 (다른 워커에서 갱신된 기록 반영)
+
+    def __init__(self, top_k: int = LEADERBOARD_TOP_K, refresh_seconds: int = LEADERBOARD_REFRESH_SECONDS):
+        self.top_k = max(1, int(top_k))
+        self.refresh_seconds = refresh_seconds
+        self._boards: Dict[BoardKey, Board] = {}
+        self._lock = threading.Lock()
+
+    def board(self, db: Session, game_id: int, period: str, day: date) -> Board:
+        key = (game_id, period, period_start(period, day))
+        board = self._loaded_board(key)
+        if board is not None:
+            return board
+
+        with self._lock:
+            board = self._loaded_board(key)
+            if board is None:
+                board = self._install(key, get_leaderboard_score_counts(db, *key), get_leaderboard_top(db, *key, self.top_k))
+        return board
+
+    async def board_async(self, db: AsyncSession, game_id: int, period: str, day: date) -> Board:
+        # 비동기 세션 버전 (DB 조회 중에는 잠금을 잡지 않음, 그사이 다른 요청이 적재했으면 그 보드 사용)
+        key = (game_id, period, period_start(period, day))
+        board = self._loaded_board(key)
+        if board is not None:
+            return board
+
+        score_counts = await async_repository.get_leaderboard_score_counts(db, *key)
+        top_rows = await async_repository.get_leaderboard_top(db, *key, self.top_k)
+        with self._lock:
+            return self._loaded_board(key) or self._install(key, score_counts, top_rows)
+
+    def _loaded_board(self, key: BoardKey) -> Optional[Board]:
+        board = self._boards.get(key)
+        if board is not None and not self._is_expired(board):
+            return board
+        return None
+
+    def _install(self, key: BoardKey, score_counts: List[tuple], top_rows: List[tuple]) -> Board:
+        # 조회 결과로 보드를 만들어 등록 (self._lock을 잡은 상태에서 호출)
+        board = Board(self.top_k)
+        board.load(score_counts, top_rows)
+        # 같은 게임/기간의 지난 보드는 메모리에서 제거
+        for stale in [k for k in self._boards if k[:2] == key[:2] and k[2] != key[2]]:
+            del self._boards[stale]
+        self._boards[key] = board
+        return board
+
+    def record(self, game_id: int, user_id: UUID, time_spent: Optional[int], changes: List[tuple]) -> None:
+        # upsert_leaderboard_scores 결과를 적재된 보드에 반영 (적재되지 않은 보드는 다음 조회 때 테이블에서 읽음)
+        with self._lock:
+            for period, start, old_score, best_score, achieved_at in changes:
+                board = self._boards.get((game_id, period, start))
+                if board is not None:
+                    board.apply(user_id, old_score, best_score, time_spent, achieved_at)
+
+    def get_top(self, db: Session, game_id: int, period: str, day: date, limit: int) -> List[dict]:
+        return self.top_of(self.board(db, game_id, period, day), limit)
+
+    def get_rank(self, db: Session, game_id: int, period: str, day: date, user_id: UUID) -> Optional[dict]:
+        # 사용자 순위 (최고 점수는 PK 조회, 순위는 점수 분포에서 O(log n))
+        board = self.board(db, game_id, period, day)
+        return self.rank_in(board, get_leaderboard_entry(db, game_id, period, period_start(period, day), user_id))
+
+    def get_total(self, db: Session, game_id: int, period: str, day: date) -> int:
+        return self.board(db, game_id, period, day).histogram.total
+
+    async def get_leaderboard_async(self, db: AsyncSession, game_id: int, period: str, day: date, limit: int,
+                                    user_id: Optional[UUID] = None) -> Tuple[List[dict], Optional[dict], int]:
+        # 비동기 세션으로 (상위 limit명, 사용자 순위, 전체 인원) 조회
+        board = await self.board_async(db, game_id, period, day)
+        me = None
+        if user_id is not None:
+            entry = await async_repository.get_leaderboard_entry(db, game_id, period, period_start(period, day), user_id)
+            me = self.rank_in(board, entry)
+        return self.top_of(board, limit), me, board.histogram.total
+
+    def top_of(self, board: Board, limit: int) -> List[dict]:
+        with self._lock:
+            return [
+                {
+                    "rank": board.rank_of(score),
+                    "userId": user_id,
+                    "score": score,
+                    "timeSpent": time_spent,
+                    "achievedAt": achieved_at
+                }
+                for user_id, score, time_spent, achieved_at in board.top_entries(limit)
+            ]
+
+    def rank_in(self, board: Board, entry) -> Optional[dict]:
+        if entry is None:
+            return None
+        with self._lock:
+            return {"rank": board.rank_of(entry.bestScore), "score": entry.bestScore, "total": board.histogram.total}
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._boards = {}
+
+    def _is_expired(self, board: Board) -> bool:
+        return self.refresh_seconds > 0 and time.monotonic() - board.loaded_at > self.refresh_seconds
+
+
+def leaderboard_boards(day: date) -> List[Tuple[str, date]]:
+    # 결과 한 건이 갱신하는 (period, periodStart) 목록
+    return [(period, period_start(period, day)) for period in LEADERBOARD_PERIODS]
+
+
+# 프로세스 전역 리더보드
+leaderboard = LeaderboardEngine()
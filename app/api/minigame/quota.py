@@ -0,0 +1,236 @@
+# app/api/minigame/quota.py
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import date
+from typing import Callable, Dict, Optional, Tuple
+from uuid import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import MINIGAME_QUOTA_BACKEND, MINIGAME_QUOTA_FLUSH_INTERVAL_SECONDS, MINIGAME_QUOTA_FLUSH_BATCH_SIZE
+from app.core.database import SessionLocal
+from app.api.minigame.repository import get_user_daily_play_count, add_daily_play_counts, kst_today
+from app.api.minigame import async_repository
+
+# (userId, minigameId, playDate)
+QuotaKey = Tuple[UUID, int, date]
+
+
+class QuotaBackend(ABC):
+    # 일일 플레이 카운터 저장소 인터페이스
+    # 여러 워커가 같은 저장소를 사용하면 워커 간 한도가 일치함 (예: Redis SETNX / INCR + Lua 스크립트)
+
+    @abstractmethod
+    def get(self, key: QuotaKey) -> Optional[int]:
+        ...
+
+    @abstractmethod
+    def seed(self, key: QuotaKey, count: int) -> int:
+        # 키가 없을 때만 초기값 설정 후 현재 값 반환
+        ...
+
+    @abstractmethod
+    def reserve(self, key: QuotaKey, limit: int) -> Optional[int]:
+        # 현재 값이 limit 미만이면 +1 후 반환, 한도에 도달했으면 None
+        ...
+
+    @abstractmethod
+    def release(self, key: QuotaKey) -> None:
+        # reserve 취소 (요청 처리 실패 시)
+        ...
+
+    @abstractmethod
+    def evict_before(self, day: date) -> int:
+        # day 이전 날짜의 카운터 삭제 후 삭제 수 반환
+        ...
+
+
+class LocalQuotaBackend(QuotaBackend):
+    # 프로세스 메모리 카운터 (공유 저장소 대용, 워커가 하나일 때만 한도가 정확함)
+
+    def __init__(self):
+        self._counts: Dict[QuotaKey, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: QuotaKey) -> Optional[int]:
+        return self._counts.get(key)
+
+    def seed(self, key: QuotaKey, count: int) -> int:
+        with self._lock:
+            return self._counts.setdefault(key, count)
+
+    def reserve(self, key: QuotaKey, limit: int) -> Optional[int]:
+        with self._lock:
+            count = self._counts.get(key, 0)
+            if count >= limit:
+                return None
+            self._counts[key] = count + 1
+            return count + 1
+
+    def release(self, key: QuotaKey) -> None:
+        with self._lock:
+            if self._counts.get(key, 0) > 0:
+                self._counts[key] -= 1
+
+    def evict_before(self, day: date) -> int:
+        with self._lock:
+            expired = [key for key in self._counts if key[2] < day]
+            for key in expired:
+                del self._counts[key]
+            return len(expired)
+
+
+# MINIGAME_QUOTA_BACKEND 값 -> 저장소 생성 함수 (공유 저장소 백엔드는 여기에 등록)
+QUOTA_BACKENDS: Dict[str, Callable[[], QuotaBackend]] = {
+    "local": LocalQuotaBackend,
+}
+
+
+class MinigameQuota:
+    # 미니게임 일일 플레이 횟수 추적 (write-behind)
+    # - 한도 확인/증가는 저장소 카운터로 처리하고, 증가분은 모아 두었다가 UserMinigamePlays에 일괄 반영
+    # - 카운터가 없는 키는 처음 조회할 때 테이블 값으로 초기화
+    # - flush_interval 초마다 또는 반영 대기 키가 flush_batch_size개 이상이면 백그라운드 스레드에서 반영
+    # - 날짜가 바뀌면 남은 증가분을 반영한 뒤 지난 날짜 카운터 삭제
+
+    def __init__(self, backend: QuotaBackend,
+                 flush_interval: float = MINIGAME_QUOTA_FLUSH_INTERVAL_SECONDS,
+                 flush_batch_size: int = MINIGAME_QUOTA_FLUSH_BATCH_SIZE,
+                 today: Callable[[], date] = kst_today):
+        self.backend = backend
+        self.flush_interval = max(0.1, float(flush_interval))
+        self.flush_batch_size = max(1, int(flush_batch_size))
+        self._today = today
+        self._day: Optional[date] = None
+        self._pending: Dict[QuotaKey, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker = None
+
+    def today(self) -> date:
+        # 현재 기준 날짜 (날짜가 바뀌었으면 이전 날짜 카운터 정리)
+        today = self._today()
+        if self._day != today:
+            self._rollover(today)
+        return today
+
+    def get_count(self, db: Session, user_id: UUID, game_id: int) -> int:
+        # 오늘 플레이 횟수 조회 (카운터가 없으면 테이블 값으로 초기화)
+        return self._seed(db, (user_id, game_id, self.today()))
+
+    async def get_count_async(self, db: AsyncSession, user_id: UUID, game_id: int) -> int:
+        # 오늘 플레이 횟수 조회 (비동기 세션, 카운터가 없으면 테이블 값으로 초기화)
+        key = (user_id, game_id, self.today())
+        count = self.backend.get(key)
+        if count is None:
+            count = self.backend.seed(key, await async_repository.get_user_daily_play_count(db, user_id, game_id, key[2]))
+        return count
+
+    def reserve(self, db: Session, user_id: UUID, game_id: int, max_play: int) -> Optional[int]:
+        # 오늘 플레이 1회 예약, 한도에 도달했으면 None
+        key = (user_id, game_id, self.today())
+        self._seed(db, key)
+        count = self.backend.reserve(key, max_play)
+        if count is None:
+            return None
+
+        with self._lock:
+            self._pending[key] += 1
+            pending_keys = len(self._pending)
+        self._ensure_worker()
+        if pending_keys >= self.flush_batch_size:
+            self._wake.set()
+        return count
+
+    def release(self, user_id: UUID, game_id: int) -> None:
+        # 예약 취소 (반영 대기 증가분에서 차감)
+        # 예약이 이미 테이블에 반영됐으면 대기 값이 음수가 되고, 다음 반영 때 테이블 값에서 차감됨 (0 미만으로 내려가지 않음)
+        key = (user_id, game_id, self.today())
+        self.backend.release(key)
+        with self._lock:
+            self._pending[key] -= 1
+            if self._pending[key] == 0:
+                del self._pending[key]
+
+    def flush(self, db: Optional[Session] = None) -> int:
+        # 반영 대기 중인 증가분을 테이블에 일괄 반영하고 반영한 키 수 반환 (실패 시 다음 반영으로 이월)
+        # db를 넘기지 않으면 별도 세션을 열어서 반영
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, defaultdict(int)
+            if not pending:
+                return 0
+
+            own_session = db is None
+            if own_session:
+                db = SessionLocal()
+            try:
+                add_daily_play_counts(db, pending)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                with self._lock:
+                    for key, count in pending.items():
+                        self._pending[key] += count
+                print(f"Error flushing minigame quota: {str(e)}")
+                return 0
+            finally:
+                if own_session:
+                    db.close()
+            return len(pending)
+
+    def _seed(self, db: Session, key: QuotaKey) -> int:
+        count = self.backend.get(key)
+        if count is None:
+            user_id, game_id, play_date = key
+            count = self.backend.seed(key, get_user_daily_play_count(db, user_id, game_id, play_date))
+        return count
+
+    def _rollover(self, today: date) -> None:
+        with self._lock:
+            if self._day == today:
+                return
+            self._day = today
+        self.flush()
+        self.backend.evict_before(today)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="minigame-quota-flush", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.today()
+                self.flush()
+            except Exception as e:
+                print(f"Error in minigame quota worker: {str(e)}")
+
+
+def create_minigame_quota(kind: str = MINIGAME_QUOTA_BACKEND) -> Optional[MinigameQuota]:
+    # db 방식이면 None (요청마다 reserve_daily_play로 테이블 직접 갱신)
+    if kind == "db":
+        return None
+    if kind in QUOTA_BACKENDS:
+        return MinigameQuota(QUOTA_BACKENDS[kind]())
+    raise ValueError(f"지원하지 않는 MINIGAME_QUOTA_BACKEND입니다: {kind}")
+
+
+# 프로세스 전역 플레이 횟수 추적기 (MINIGAME_QUOTA_BACKEND=db이면 None)
+minigame_quota = create_minigame_quota()
+
+
+def rollover_minigame_quota() -> int:
+    # 날짜 경계 작업: 남은 증가분을 반영하고 지난 날짜 카운터 정리, 반영한 키 수 반환
+    if minigame_quota is None:
+        return 0
+    flushed = minigame_quota.flush()
+    minigame_quota.today()
+    return flushed
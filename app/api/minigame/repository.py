@@ -1,21 +1,40 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from datetime import date
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy import select, update, delete, func, case, and_, tuple_, literal, cast, values, column, Integer, Date, TIMESTAMP
+from datetime import date, datetime
 from uuid import UUID
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.models.minigames import Minigame
 from app.models.minigameattempts import MinigameAttempt
 from app.models.userminigameplays import UserMinigamePlay
+from app.models.minigame_leaderboard import MinigameLeaderboard, LEADERBOARD_PERIODS, ALL_TIME_PERIOD_START
 from app.models.user import User
+from app.core.catalog import catalog
+from app.core.config import TIMEZONE, KST
+
+def kst_today() -> date:
+    # 일일 한도 기준 날짜 (설정된 TIMEZONE 기준, 플레이 횟수/리더보드 날짜 모두 이 기준)
+    return datetime.now(KST).date()
 
 def get_minigame_by_id(db: Session, game_id: int) -> Optional[Minigame]:
-    # 게임 ID로 미니게임 정보 조회
+    # 게임 ID로 미니게임 정보 조회 (캐시 우선 조회, 없으면 DB 조회)
+    minigame = catalog.get_minigame(game_id)
+    if minigame is not None:
+        return minigame
     try:
         return db.query(Minigame).filter(Minigame.minigameId == game_id).first()
     except SQLAlchemyError as e:
         raise e
 
+def get_minigames(db: Session) -> List[Minigame]:
+    # 전체 미니게임 목록 (캐시 우선 조회, 없으면 DB 조회)
+    minigames = catalog.get_minigames()
+    if minigames:
+        return minigames
+    return db.query(Minigame).order_by(Minigame.minigameId).all()
+
 def get_today_play(db: Session, user_id: UUID, game_id: int) -> Optional[UserMinigamePlay]:
     # 오늘 플레이 기록 조회
     try:
@@ -24,39 +43,24 @@ def get_today_play(db: Session, user_id: UUID, game_id: int) -> Optional[UserMin
             .filter(
                 UserMinigamePlay.userId == user_id,
                 UserMinigamePlay.minigameId == game_id,
-                UserMinigamePlay.playDate == date.today()
+                UserMinigamePlay.playDate == kst_today()
             )
             .first()
         )
     except SQLAlchemyError as e:
         raise e
 
-def create_today_play(db: Session, user_id: UUID, game_id: int) -> UserMinigamePlay:
-    # 오늘 기록 생성
-    try:
-        play = UserMinigamePlay(
-            userId=user_id,
-            minigameId=game_id,
-            playDate=date.today(),
-            playCount=0
-        )
-        db.add(play)
-        db.flush()
-        return play
-    except SQLAlchemyError as e:
-        raise e
-
 def get_user_by_id(db: Session, user_id: UUID) -> Optional[User]:
     # 사용자 ID로 사용자 정보 조회
     try:
-        return db.query(User).filter(User.userId == user_id).first()
+        return db.query(User).filter(User.active(user_id)).first()
     except SQLAlchemyError as e:
         raise e
 
 def get_user_daily_play_count(db: Session, user_id: UUID, game_id: int, play_date: date = None) -> int:
     # 사용자의 특정 게임 일일 플레이 횟수 조회
     if play_date is None:
-        play_date = date.today()
+        play_date = kst_today()
     
     try:
         result = db.query(UserMinigamePlay).filter(
@@ -87,34 +91,197 @@ def create_minigame_attempt(db: Session, attempt_data: dict) -> MinigameAttempt:
     except SQLAlchemyError as e:
         raise e
 
-def update_user_daily_play_count(db: Session, user_id: UUID, game_id: int, play_date: date = None) -> UserMinigamePlay:
-    # 사용자의 일일 플레이 횟수 업데이트
+def reserve_daily_play(db: Session, user_id: UUID, game_id: int, max_play: int, play_date: date = None) -> Optional[int]:
+    # 일일 플레이 횟수 1회 예약 (INSERT ... ON CONFLICT DO UPDATE 한 번으로 조회/생성/증가 처리)
+    # 한도에 도달했으면 갱신되는 행이 없으므로 None 반환, 성공 시 증가된 playCount 반환
     if play_date is None:
-        play_date = date.today()
-    
+        play_date = kst_today()
+    if max_play <= 0:
+        return None
+
+    stmt = pg_insert(UserMinigamePlay).values(
+        userId=user_id,
+        minigameId=game_id,
+        playDate=play_date,
+        playCount=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserMinigamePlay.userId, UserMinigamePlay.minigameId, UserMinigamePlay.playDate],
+        set_={"playCount": UserMinigamePlay.playCount + 1},
+        where=UserMinigamePlay.playCount < max_play
+    ).returning(UserMinigamePlay.playCount)
+
     try:
-        # 기존 기록 조회
-        existing_play = db.query(UserMinigamePlay).filter(
-            UserMinigamePlay.userId == user_id,
-            UserMinigamePlay.minigameId == game_id,
-            UserMinigamePlay.playDate == play_date
-        ).first()
-        
-        if existing_play:
-            # 기존 기록이 있으면 플레이 횟수 증가
-            existing_play.playCount += 1
-            db.flush()
-            return existing_play
-        else:
-            # 기존 기록이 없으면 새로 생성
-            new_play = UserMinigamePlay(
-                userId=user_id,
-                minigameId=game_id,
-                playDate=play_date,
-                playCount=1
+        return db.execute(stmt).scalar()
+    except SQLAlchemyError as e:
+        raise e
+
+
+def add_daily_play_counts(db: Session, counts: Dict[Tuple[UUID, int, date], int]) -> None:
+    # (userId, minigameId, playDate)별 플레이 횟수 증감분 반영
+    # - 증가분: multi-row upsert 한 문장
+    # - 감소분 (이미 반영된 예약을 취소한 경우): UPDATE ... FROM (VALUES ...) 한 문장, 0 미만으로 내려가지 않음
+    # 동시 반영 간 교착 상태를 막기 위해 키 순서로 정렬
+    ordered = sorted(counts.items(), key=lambda item: (str(item[0][0]), item[0][1], item[0][2]))
+    increments = [
+        {"userId": user_id, "minigameId": game_id, "playDate": play_date, "playCount": count}
+        for (user_id, game_id, play_date), count in ordered
+        if count > 0
+    ]
+    decrements = [
+        (user_id, game_id, play_date, count)
+        for (user_id, game_id, play_date), count in ordered
+        if count < 0
+    ]
+
+    try:
+        if increments:
+            stmt = pg_insert(UserMinigamePlay).values(increments)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[UserMinigamePlay.userId, UserMinigamePlay.minigameId, UserMinigamePlay.playDate],
+                set_={"playCount": UserMinigamePlay.playCount + stmt.excluded.playCount}
+            )
+            db.execute(stmt)
+
+        if decrements:
+            deltas = values(
+                column("userId", PG_UUID(as_uuid=True)),
+                column("minigameId", Integer),
+                column("playDate", Date),
+                column("delta", Integer),
+                name="deltas"
+            ).data(decrements)
+            db.execute(
+                update(UserMinigamePlay)
+                .where(
+                    UserMinigamePlay.userId == deltas.c.userId,
+                    UserMinigamePlay.minigameId == deltas.c.minigameId,
+                    UserMinigamePlay.playDate == deltas.c.playDate
+                )
+                .values(playCount=func.greatest(UserMinigamePlay.playCount + deltas.c.delta, 0))
+                .execution_options(synchronize_session=False)
             )
-            db.add(new_play)
-            db.flush()
-            return new_play
     except SQLAlchemyError as e:
-        raise e
\ No newline at end of file
+        raise e
+
+
+def upsert_leaderboard_scores(db: Session, user_id: UUID, game_id: int, score: int, time_spent: Optional[int],
+                              achieved_at: datetime, boards: List[Tuple[str, date]]) -> List[tuple]:
+    # 기간별 최고 점수를 한 문장으로 갱신하고 (period, periodStart, 이전 점수, 현재 최고 점수, 달성 시각) 목록 반환
+    # 이전 점수는 갱신 전 스냅샷을 FOR UPDATE로 읽음 (처음 기록이면 None)
+    board = MinigameLeaderboard
+    old = (
+        select(board.period, board.periodStart, board.bestScore)
+        .where(
+            board.minigameId == game_id,
+            board.userId == user_id,
+            tuple_(board.period, board.periodStart).in_(boards)
+        )
+        .with_for_update()
+        .cte("old")
+    )
+
+    stmt = pg_insert(board).values([
+        {
+            "minigameId": game_id,
+            "period": period,
+            "periodStart": period_start,
+            "userId": user_id,
+            "bestScore": score,
+            "timeSpent": time_spent,
+            "achievedAt": achieved_at,
+            "attemptCount": 1
+        }
+        for period, period_start in boards
+    ])
+    improved = stmt.excluded.bestScore > board.bestScore
+    upserted = stmt.on_conflict_do_update(
+        constraint='pk_minigame_leaderboard',
+        set_={
+            "bestScore": func.greatest(board.bestScore, stmt.excluded.bestScore),
+            "timeSpent": case((improved, stmt.excluded.timeSpent), else_=board.timeSpent),
+            "achievedAt": case((improved, stmt.excluded.achievedAt), else_=board.achievedAt),
+            "attemptCount": board.attemptCount + 1,
+            "updatedAt": func.now()
+        }
+    ).returning(board.period, board.periodStart, board.bestScore, board.achievedAt).cte("upserted")
+
+    result = db.execute(
+        select(
+            upserted.c.period,
+            upserted.c.periodStart,
+            old.c.bestScore.label("oldScore"),
+            upserted.c.bestScore,
+            upserted.c.achievedAt
+        ).select_from(
+            upserted.outerjoin(old, and_(old.c.period == upserted.c.period, old.c.periodStart == upserted.c.periodStart))
+        )
+    )
+    return result.all()
+
+def get_leaderboard_top(db: Session, game_id: int, period: str, period_start: date, limit: int) -> List[tuple]:
+    # 기간 상위 limit명 (점수 내림차순, 동점이면 먼저 달성한 순) - 인덱스 순서대로 limit개만 읽음
+    board = MinigameLeaderboard
+    return db.execute(
+        select(board.userId, board.bestScore, board.timeSpent, board.achievedAt)
+        .where(board.minigameId == game_id, board.period == period, board.periodStart == period_start)
+        .order_by(board.bestScore.desc(), board.achievedAt)
+        .limit(limit)
+    ).all()
+
+def get_leaderboard_score_counts(db: Session, game_id: int, period: str, period_start: date) -> List[tuple]:
+    # 기간 내 점수별 사용자 수 (순위 계산용 히스토그램 적재)
+    board = MinigameLeaderboard
+    return db.execute(
+        select(board.bestScore, func.count())
+        .where(board.minigameId == game_id, board.period == period, board.periodStart == period_start)
+        .group_by(board.bestScore)
+    ).all()
+
+def get_leaderboard_entry(db: Session, game_id: int, period: str, period_start: date, user_id: UUID) -> Optional[MinigameLeaderboard]:
+    # 사용자 기간 최고 기록 (PK 조회)
+    return db.get(MinigameLeaderboard, (game_id, period, period_start, user_id))
+
+def _period_start_sql(period: str, achieved_at):
+    # 달성 시각 -> 기간 시작일 (leaderboard.period_start와 같은 규칙의 SQL 버전)
+    # 세션 시간대 기준으로 저장된 시각을 설정된 TIMEZONE(AT TIME ZONE)으로 바꾼 뒤 날짜 계산 (kst_today와 같은 기준)
+    local_at = func.timezone(TIMEZONE, cast(achieved_at, TIMESTAMP(timezone=True)))
+    if period == "daily":
+        return cast(local_at, Date)
+    if period == "weekly":
+        return cast(func.date_trunc("week", local_at), Date)
+    return cast(literal(ALL_TIME_PERIOD_START), Date)
+
+def rebuild_minigame_leaderboards(db: Session) -> int:
+    # MinigameAttempts 전체로 기간별 최고 점수 테이블 재생성 (완료되고 점수가 있는 기록만 집계)
+    attempt = MinigameAttempt
+    achieved_at = func.coalesce(attempt.completionAt, attempt.startedAt)
+    db.execute(delete(MinigameLeaderboard))
+
+    inserted = 0
+    for period in LEADERBOARD_PERIODS:
+        period_start = _period_start_sql(period, achieved_at)
+        best = (
+            select(
+                attempt.minigameId,
+                literal(period).label("period"),
+                period_start.label("periodStart"),
+                attempt.userId,
+                attempt.score,
+                attempt.timeSpent,
+                achieved_at.label("achievedAt"),
+                func.count().over(partition_by=(attempt.minigameId, period_start, attempt.userId)).label("attemptCount")
+            )
+            .where(attempt.completionAt.isnot(None), attempt.score.isnot(None))
+            .distinct(attempt.minigameId, period_start, attempt.userId)
+            .order_by(attempt.minigameId, period_start, attempt.userId, attempt.score.desc(), achieved_at)
+        )
+        result = db.execute(
+            pg_insert(MinigameLeaderboard).from_select(
+                ["minigameId", "period", "periodStart", "userId", "bestScore", "timeSpent", "achievedAt", "attemptCount"],
+                best
+            )
+        )
+        inserted += result.rowcount
+    db.commit()
+    return inserted
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, field_validator, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 class MinigameStartResponse(BaseModel):
@@ -45,4 +45,53 @@ class MinigameResultResponse(BaseModel):
     data: dict[str, MinigameResultData]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    userId: UUID
+    score: int
+    timeSpent: Optional[int] = None
+    achievedAt: datetime
+
+class LeaderboardUserRank(BaseModel):
+    rank: int
+    score: int
+    total: int
+
+class LeaderboardData(BaseModel):
+    gameId: int
+    period: str
+    total: int
+    entries: List[LeaderboardEntry]
+    me: Optional[LeaderboardUserRank] = None
+
+class LeaderboardResponse(BaseModel):
+    message: str
+    data: LeaderboardData
+    status: int
+
+class MinigameInfo(BaseModel):
+    minigameId: int
+    name: str
+    description: Optional[str] = None
+    maxPlay: int
+
+    class Config:
+        from_attributes = True
+
+class MinigameListResponse(BaseModel):
+    message: str
+    data: List[MinigameInfo]
+    status: int
+
+class MinigamePlayCountData(BaseModel):
+    gameId: int
+    playCount: int
+    maxPlay: int
+    remainingPlays: int
+
+class MinigamePlayCountResponse(BaseModel):
+    message: str
+    data: MinigamePlayCountData
+    status: int
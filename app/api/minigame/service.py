@@ -1,23 +1,43 @@
 from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from app.core.exception import CustomException
 from app.api.ending.repository import get_user_by_id
 from app.models.minigameattempts import MinigameAttempt
-from datetime import date
+from datetime import date, datetime
+from typing import Optional
 from app.api.minigame.repository import (
     get_minigame_by_id,
-    get_user_by_id,
+    get_minigames,
     get_user_daily_play_count,
+    get_user_by_id,
     create_minigame_attempt,
-    update_user_daily_play_count,
-    get_today_play,
-    create_today_play
+    reserve_daily_play,
+    upsert_leaderboard_scores
 )
+from app.api.minigame.quota import minigame_quota, kst_today
+from app.api.minigame import async_repository
+from app.core.config import KST
+from app.api.minigame.leaderboard import leaderboard, leaderboard_boards
+from app.models.minigame_leaderboard import LEADERBOARD_PERIODS
 from app.api.user.service import process_transaction
 from app.api.minigame.schema import MinigameResultRequest, MinigameResultResponse, MinigameResultData
 from app.core.exception import CustomException
 
+def reserve_play(db: Session, user_id: UUID, game_id: int, max_play: int) -> Optional[int]:
+    # 오늘 플레이 1회 예약 후 증가된 횟수 반환, 한도에 도달했으면 None
+    # - db: UserMinigamePlays upsert (요청 트랜잭션에 포함되어 롤백 시 함께 취소)
+    # - 그 외: 카운터 증가 후 테이블에는 일괄 반영 (실패 시 release_play로 취소)
+    if minigame_quota is not None:
+        return minigame_quota.reserve(db, user_id, game_id, max_play)
+    return reserve_daily_play(db, user_id, game_id, max_play, kst_today())
+
+def release_play(user_id: UUID, game_id: int) -> None:
+    # 요청 처리 실패 시 메모리 카운터 예약 취소 (db 방식은 롤백으로 취소됨)
+    if minigame_quota is not None:
+        minigame_quota.release(user_id, game_id)
+
 # 미니게임 플레이 요청
 def start_minigame(db: Session, user_id: UUID, game_id: int):
     user = get_user_by_id(db, user_id)
@@ -30,25 +50,24 @@ def start_minigame(db: Session, user_id: UUID, game_id: int):
 
     max_play = game.maxPlay
 
-    # 오늘 플레이 기록 조회
-    play_record = get_today_play(db, user_id, game_id)
-    if not play_record:
-        play_record = create_today_play(db, user_id, game_id)
-
-    # 횟수 제한 체크
-    if play_record.playCount >= max_play:
+    # 오늘 플레이 횟수 예약 (횟수 제한 체크와 증가를 한 번에 처리)
+    play_count = reserve_play(db, user_id, game_id, max_play)
+    if play_count is None:
+        db.rollback()
         raise CustomException("오늘은 해당 게임을 더 이상 플레이할 수 없습니다.", 403)
 
-    # 시작 가능 → playCount 증가 & MinigameAttempt 생성
-    play_record.playCount += 1
-    from datetime import datetime
+    # 시작 가능 → MinigameAttempt 생성
     attempt = MinigameAttempt(userId=user_id, minigameId=game_id, startedAt=datetime.now())
     db.add(attempt)
 
-    db.commit()
-    db.refresh(play_record)
+    try:
+        db.commit()
+    except Exception:
+        db.rollback()
+        release_play(user_id, game_id)
+        raise
 
-    remaining = max_play - play_record.playCount
+    remaining = max_play - play_count
 
     return {
         "message": "게임 시작 가능",
@@ -72,11 +91,9 @@ def process_minigame_result(db: Session, user_id: UUID, game_id: int, result_dat
         if not user:
             raise CustomException(message="사용자를 찾을 수 없습니다", status=404)
         
-        # 4. 일일 플레이 횟수 확인
-        today = date.today()
-        current_play_count = get_user_daily_play_count(db, user_id, game_id, today)
-        
-        if current_play_count >= minigame.maxPlay:
+        # 4. 일일 플레이 횟수 예약 (한도 초과 시 갱신 없이 None)
+        if reserve_play(db, user_id, game_id, minigame.maxPlay) is None:
+            db.rollback()
             raise CustomException(message="일일 플레이 횟수를 초과했습니다", status=403)
         
         # 5. 데이터베이스 트랜잭션 처리
@@ -92,9 +109,14 @@ def process_minigame_result(db: Session, user_id: UUID, game_id: int, result_dat
                 'userId': user_id
             }
             create_minigame_attempt(db, attempt_data)
-            
-            # 일일 플레이 횟수 업데이트
-            update_user_daily_play_count(db, user_id, game_id, today)
+
+            # 리더보드 최고 점수 갱신 (완료되고 점수가 있는 기록만)
+            leaderboard_changes = []
+            if result_data.completedAt is not None and result_data.score is not None:
+                leaderboard_changes = upsert_leaderboard_scores(
+                    db, user_id, game_id, result_data.score, result_data.timeSpent,
+                    datetime.now(KST), leaderboard_boards(kst_today())
+                )
             
             # 재화 지급 (commit=False로 트랜잭션 관리)
             # money가 null이 아니고 0보다 클 때만 재화 지급
@@ -103,6 +125,7 @@ def process_minigame_result(db: Session, user_id: UUID, game_id: int, result_dat
             
             # 모든 작업이 성공하면 커밋
             db.commit()
+            leaderboard.record(game_id, user_id, result_data.timeSpent, leaderboard_changes)
             
             # 6. 성공 응답 반환
             response_data = MinigameResultData(
@@ -128,6 +151,7 @@ def process_minigame_result(db: Session, user_id: UUID, game_id: int, result_dat
             
         except Exception as e:
             db.rollback()
+            release_play(user_id, game_id)
             if isinstance(e, CustomException):
                 raise e
             else:
@@ -142,6 +166,85 @@ def process_minigame_result(db: Session, user_id: UUID, game_id: int, result_dat
         db.rollback()
         raise CustomException(message="서버 내부 오류가 발생했습니다", status=500)
 
+def get_minigames_service(db: Session):
+    # 미니게임 목록 조회
+    return {"message": "미니게임 목록 조회 성공", "data": get_minigames(db), "status": 200}
+
+async def get_minigames_service_async(db: AsyncSession):
+    # 미니게임 목록 조회 (비동기 세션)
+    return {"message": "미니게임 목록 조회 성공", "data": await async_repository.get_minigames(db), "status": 200}
+
+def get_play_count_service(db: Session, user_id: UUID, game_id: int):
+    # 오늘 플레이 횟수와 남은 횟수 조회 (MINIGAME_QUOTA_BACKEND가 db가 아니면 메모리 카운터 우선)
+    minigame = get_minigame_by_id(db, game_id)
+    if not minigame:
+        raise CustomException(message="존재하지 않는 게임입니다", status=404)
+    if minigame_quota is not None:
+        play_count = minigame_quota.get_count(db, user_id, game_id)
+    else:
+        play_count = get_user_daily_play_count(db, user_id, game_id, kst_today())
+    return build_play_count_response(minigame, play_count)
+
+async def get_play_count_service_async(db: AsyncSession, user_id: UUID, game_id: int):
+    # 오늘 플레이 횟수와 남은 횟수 조회 (비동기 세션)
+    minigame = await async_repository.get_minigame_by_id(db, game_id)
+    if not minigame:
+        raise CustomException(message="존재하지 않는 게임입니다", status=404)
+    if minigame_quota is not None:
+        play_count = await minigame_quota.get_count_async(db, user_id, game_id)
+    else:
+        play_count = await async_repository.get_user_daily_play_count(db, user_id, game_id, kst_today())
+    return build_play_count_response(minigame, play_count)
+
+def build_play_count_response(minigame, play_count: int) -> dict:
+    return {
+        "message": "오늘 플레이 횟수 조회 성공",
+        "data": {
+            "gameId": minigame.minigameId,
+            "playCount": play_count,
+            "maxPlay": minigame.maxPlay,
+            "remainingPlays": max(0, minigame.maxPlay - play_count)
+        },
+        "status": 200
+    }
+
+def validate_leaderboard_period(period: str) -> None:
+    if period not in LEADERBOARD_PERIODS:
+        raise CustomException(message="period는 daily, weekly, all 중 하나여야 합니다", status=400)
+
+def get_leaderboard_service(db: Session, game_id: int, period: str, limit: int, user_id: Optional[UUID] = None):
+    # 게임별 기간 리더보드 조회 (상위 limit명 + 요청한 사용자 순위)
+    validate_leaderboard_period(period)
+    if not get_minigame_by_id(db, game_id):
+        raise CustomException(message="존재하지 않는 게임입니다", status=404)
+
+    today = kst_today()
+    entries = leaderboard.get_top(db, game_id, period, today, limit)
+    me = leaderboard.get_rank(db, game_id, period, today, user_id) if user_id is not None else None
+    return build_leaderboard_response(game_id, period, entries, me, leaderboard.get_total(db, game_id, period, today))
+
+async def get_leaderboard_service_async(db: AsyncSession, game_id: int, period: str, limit: int, user_id: Optional[UUID] = None):
+    # 게임별 기간 리더보드 조회 (비동기 세션)
+    validate_leaderboard_period(period)
+    if not await async_repository.get_minigame_by_id(db, game_id):
+        raise CustomException(message="존재하지 않는 게임입니다", status=404)
+
+    entries, me, total = await leaderboard.get_leaderboard_async(db, game_id, period, kst_today(), limit, user_id)
+    return build_leaderboard_response(game_id, period, entries, me, total)
+
+def build_leaderboard_response(game_id: int, period: str, entries: list, me: Optional[dict], total: int) -> dict:
+    return {
+        "message": "리더보드 조회 성공",
+        "data": {
+            "gameId": game_id,
+            "period": period,
+            "total": total,
+            "entries": entries,
+            "me": me
+        },
+        "status": 200
+    }
+
 def _validate_input(user_id: UUID, game_id: int, result_data: MinigameResultRequest):
     # 입력값 검증
     # gameId 범위 확인 (URL의 gameId 검증)
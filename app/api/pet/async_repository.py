@@ -0,0 +1,17 @@
+# app/api/pet/async_repository.py
+# pet repository의 비동기(AsyncSession) 버전 - DB_ASYNC=true일 때 사용
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from uuid import UUID
+from typing import Optional
+from app.models.animal import Animal
+
+# 동물 상태 상세 조회(/pets/{animalId})
+async def get_animal_by_user_and_id(db: AsyncSession, user_id: UUID, animal_id: int) -> Optional[Animal]:
+    result = await db.execute(
+        select(Animal).where(
+            Animal.userId == user_id,
+            Animal.animalId == animal_id
+        ).limit(1)
+    )
+    return result.scalars().first()
@@ -2,16 +2,22 @@
 from fastapi import APIRouter, Depends, Header
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
+from app.core.config import DB_ASYNC
 
 from app.api.pet.schema import AnimalNicknameRequest, AnimalNicknameResponse, AnimalInfoResponse, AnimalEmotionResetResponse, AnimalRunawayResponse
 from app.api.pet.service import register_pet_nicknames, get_pet_info_service, handle_emotion_reset, handle_animal_runaway
+from app.api.pet.service import get_pet_info_service_async
 from app.core.exception import CustomException
 from uuid import UUID
 
 router = APIRouter(prefix="/api/v1/pets", tags=["Pet"])
 
+# 비동기 세션 조회 API (DB_ASYNC=true일 때 같은 경로의 동기 API보다 먼저 등록됨)
+async_router = APIRouter(prefix="/api/v1/pets", tags=["Pet"])
+
 # 동물 이름 지어주는 api
 @router.post("/nickname", response_model=AnimalNicknameResponse)
 def nickname_animals(request: AnimalNicknameRequest, db: Session = Depends(get_db), user_id: UUID = Header(..., alias="user-id")): # user_id UUID는 dto가 아닌 Header에서 user-id로 받음 
@@ -29,7 +35,7 @@ def nickname_animals(request: AnimalNicknameRequest, db: Session = Depends(get_d
         raise e   # 커스텀 예외는 그대로 상위 예외 핸들러로 전달
 
 # 동물 상태 상세 조회 api
-@router.get("/{animalId}", response_model=AnimalInfoResponse)
+@router.get("/{animalId}", response_model=AnimalInfoResponse, include_in_schema=not DB_ASYNC)
 def get_pet_info(animalId: int, db: Session = Depends(get_db) ,user_id: UUID = Header(..., alias="user-id")):
     pet_info = get_pet_info_service(db, user_id, animalId)
     if pet_info is None:
@@ -73,5 +79,12 @@ def runaway_pet(animalId: int, db: Session = Depends(get_db), user_id: UUID = He
             }
         )
     except CustomException as e:
-        raise e   # 커스텀 예외는 그대로 상위 예외 핸들러로 전달    
+        raise e   # 커스텀 예외는 그대로 상위 예외 핸들러로 전달
 
+# 동물 상태 상세 조회 api (비동기 세션)
+@async_router.get("/{animalId}", response_model=AnimalInfoResponse)
+async def get_pet_info_async(animalId: int, db: AsyncSession = Depends(get_async_db), user_id: UUID = Header(..., alias="user-id")):
+    pet_info = await get_pet_info_service_async(db, user_id, animalId)
+    if pet_info is None:
+        raise CustomException(message = "해당 동물을 찾을 수 없습니다.", status=404)
+    return pet_info
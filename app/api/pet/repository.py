@@ -2,11 +2,16 @@ from sqlalchemy.orm import Session
 from app.models.animal import Animal
 from app.models.user import User
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
+from app.core.config import KST
 from app.core.exception import CustomException
+from app.api.event.birthday import birthday_calendar
 
 # 동물 이름 지어주면서 만들기(/pets/nickname)
 def create_animal(db: Session, user_id: UUID, animal_id: int, name: str, birthday: date):
+    if db.query(User.userId).filter(User.active(user_id)).first() is None:
+        raise CustomException("사용자 정보를 찾을 수 없습니다.", status=404)
+
     existing = db.query(Animal).filter(Animal.animalId == animal_id, Animal.userId == user_id).first()
     if existing:
         raise CustomException(f"{animal_id}번 동물은 이미 존재합니다.", status=400)
@@ -20,6 +25,7 @@ def create_animal(db: Session, user_id: UUID, animal_id: int, name: str, birthda
     db.add(animal)
     db.commit()
     db.refresh(animal)
+    birthday_calendar.add_animal(user_id, birthday, datetime.now(KST).date())
     return animal
 
 # 동물 상태 상세 조회(/pets/{animalId})
@@ -75,7 +81,7 @@ def reset_emotion_and_deduct_money(db: Session, user_id: UUID, animal_id: int, c
         raise CustomException("감정 초기화는 행복도가 0일 때만 가능합니다.", status=400)
 
     # 사용자 잔액 확인
-    user = db.query(User).filter(User.userId == user_id).first()
+    user = db.query(User).filter(User.active(user_id)).first()
     if user is None:
         raise CustomException("사용자 정보를 찾을 수 없습니다.", status=404)
 
@@ -1,10 +1,12 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict
 from uuid import UUID
 from datetime import date
 
 from app.api.pet.schema import AnimalInfoResponse
 from app.api.pet.repository import create_animal, get_animal_by_user_and_id, reset_emotion_and_deduct_money, update_animal_runaway_status
+from app.api.pet import async_repository
 from app.core.exception import CustomException
 
 # 동물 이름 새로 지어주면서 만들기(/pets/nickname)
@@ -45,8 +47,17 @@ def get_pet_info_service(db: Session, user_id: UUID, animal_id: int) -> AnimalIn
     if animal is None:
         return None
 
-    evolutionStage = animal.evolutionStage
+    return to_animal_info_response(animal)
 
+# 동물 상태 상세 조회 (비동기 세션)
+async def get_pet_info_service_async(db: AsyncSession, user_id: UUID, animal_id: int) -> AnimalInfoResponse | None:
+    animal = await async_repository.get_animal_by_user_and_id(db, user_id, animal_id)
+    if animal is None:
+        return None
+
+    return to_animal_info_response(animal)
+
+def to_animal_info_response(animal) -> AnimalInfoResponse:
     return AnimalInfoResponse(
         animalId=animal.animalId,
         name=animal.name,
@@ -0,0 +1,33 @@
+# app/api/user/async_repository.py
+# user repository의 비동기(AsyncSession) 버전 - DB_ASYNC=true일 때 사용
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from uuid import UUID
+from typing import List, Optional
+from app.models.user import User
+from app.models.moneyTransaction import MoneyTransaction
+from app.models.ledger_snapshot import LedgerSnapshot
+from app.api.user.repository import transaction_page_query
+
+async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
+    # 삭제 대기 중인 사용자는 없는 사용자로 취급
+    result = await db.execute(select(User).where(User.active(user_id)).limit(1))
+    return result.scalars().first()
+
+async def get_user_money(db: AsyncSession, user_id: UUID) -> Optional[int]:
+    # 잔액만 조회 (엔티티 로드 없이)
+    result = await db.execute(select(User.money).where(User.active(user_id)))
+    return result.scalar()
+
+async def get_ledger_snapshots(db: AsyncSession, user_id: UUID) -> List[LedgerSnapshot]:
+    result = await db.execute(
+        select(LedgerSnapshot).where(
+            LedgerSnapshot.userId == user_id
+        ).order_by(LedgerSnapshot.source, LedgerSnapshot.direction)
+    )
+    return list(result.scalars().all())
+
+async def get_transaction_page(db: AsyncSession, user_id: UUID, limit: int, after: Optional[tuple] = None) -> List[MoneyTransaction]:
+    # 거래 내역 keyset 페이지 조회 (최신순)
+    result = await db.execute(transaction_page_query(user_id, limit, after))
+    return list(result.scalars().all())
@@ -1,14 +1,24 @@
-from fastapi import APIRouter, Depends, status, Header
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, status, Header, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.user.schema import UserCreateResponse, UserPropertyResponse, TransactionRequest, TransactionResponse
+from app.api.user.schema import BatchTransactionRequest, BatchTransactionResponse, TransactionHistoryResponse, LedgerResponse
 from app.api.user.service import create_user, get_user_property_service, process_transaction
+from app.api.user.service import get_user_property_service_async, process_transactions_batch
+from app.api.user.service import get_transaction_history_service, get_transaction_history_service_async
+from app.api.user.service import get_ledger_service, get_ledger_service_async, export_transactions_service
 from app.core.exception import CustomException
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db, get_stream_session_factory
+from app.core.config import DB_ASYNC
 from uuid import UUID
+from typing import Optional
 
 router = APIRouter(prefix="/api/v1/users", tags=["User"])
 
+# 비동기 세션 조회 API (DB_ASYNC=true일 때 같은 경로의 동기 API보다 먼저 등록됨)
+async_router = APIRouter(prefix="/api/v1/users", tags=["User"])
+
 # 사용자를 하나 생성하는 api
 @router.post("/start", response_model=UserCreateResponse, status_code=status.HTTP_201_CREATED)  # POST /api/v1/users/start 요청이 오면 실행됨.
 def start_game(db: Session = Depends(get_db)):                                                  # 요청 시 DB 세션을 get_db() 함수로부터 주입받음 (의존성 주입).
@@ -16,7 +26,7 @@ def start_game(db: Session = Depends(get_db)):
     return {"userId": user.userId}                                                              # 생성된 userId를 JSON으로 반환.
 
 # 사용자의 보유 코인을 조회하는 api
-@router.get("/property", response_model=UserPropertyResponse)
+@router.get("/property", response_model=UserPropertyResponse, include_in_schema=not DB_ASYNC)
 def get_user_property(db: Session = Depends(get_db), user_id: UUID = Header(..., alias="user-id")):
     try:
         user = get_user_property_service(db, user_id)
@@ -34,6 +44,22 @@ def get_user_property(db: Session = Depends(get_db), user_id: UUID = Header(...,
     except CustomException as e:
         raise e
 
+# 사용자의 보유 코인을 조회하는 api (비동기 세션)
+@async_router.get("/property", response_model=UserPropertyResponse)
+async def get_user_property_async(db: AsyncSession = Depends(get_async_db), user_id: UUID = Header(..., alias="user-id")):
+    user = await get_user_property_service_async(db, user_id)
+    if user is None:
+        raise CustomException("사용자 정보를 찾을 수 없습니다.", status=404)
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "money": user.money,
+            "message": "현재 보유 골드 조회 성공",
+            "status": 200
+        }
+    )
+
 # 돈 거래 API
 @router.post("/transactions", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 def create_money_transaction(
@@ -65,3 +91,92 @@ def create_money_transaction(
             }
         )
 
+# 일괄 거래 API (오프라인에서 쌓인 구매/보상 재전송용, 항목별 결과 반환)
+@router.post("/transactions/batch", response_model=BatchTransactionResponse)
+def create_money_transactions_batch(
+    request: BatchTransactionRequest,
+    db: Session = Depends(get_db),
+    user_id: Optional[UUID] = Header(None, alias="user-id")
+):
+    try:
+        results = process_transactions_batch(db, user_id, request.transactions)
+        applied = sum(1 for result in results if result.status == 201)
+
+        return JSONResponse(
+            status_code=200,
+            content={
+                "applied": applied,
+                "rejected": len(results) - applied,
+                "results": [result.model_dump(mode="json") for result in results],
+                "status": 200
+            }
+        )
+    except CustomException as e:
+        return JSONResponse(
+            status_code=e.status,
+            content={
+                "message": e.message,
+                "status": e.status,
+            }
+        )
+
+# 거래 내역 조회 API (최신순, cursor 기반 페이지네이션)
+@router.get("/transactions", response_model=TransactionHistoryResponse, include_in_schema=not DB_ASYNC)
+def get_money_transactions(
+    limit: int = Query(50, ge=1, le=500, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    db: Session = Depends(get_db),
+    user_id: UUID = Header(..., alias="user-id")
+):
+    page = get_transaction_history_service(db, user_id, limit, cursor)
+    return JSONResponse(
+        status_code=200,
+        content={**page, "message": "거래 내역 조회 성공", "status": 200}
+    )
+
+# 거래 내역 조회 API (비동기 세션)
+@async_router.get("/transactions", response_model=TransactionHistoryResponse)
+async def get_money_transactions_async(
+    limit: int = Query(50, ge=1, le=500, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    db: AsyncSession = Depends(get_async_db),
+    user_id: UUID = Header(..., alias="user-id")
+):
+    page = await get_transaction_history_service_async(db, user_id, limit, cursor)
+    return JSONResponse(
+        status_code=200,
+        content={**page, "message": "거래 내역 조회 성공", "status": 200}
+    )
+
+# 출처/방향별 거래 누적 합계 조회 API
+@router.get("/ledger", response_model=LedgerResponse, include_in_schema=not DB_ASYNC)
+def get_ledger(db: Session = Depends(get_db), user_id: UUID = Header(..., alias="user-id")):
+    ledger = get_ledger_service(db, user_id)
+    return JSONResponse(
+        status_code=200,
+        content={**ledger, "message": "거래 누적 합계 조회 성공", "status": 200}
+    )
+
+# 출처/방향별 거래 누적 합계 조회 API (비동기 세션)
+@async_router.get("/ledger", response_model=LedgerResponse)
+async def get_ledger_async(db: AsyncSession = Depends(get_async_db), user_id: UUID = Header(..., alias="user-id")):
+    ledger = await get_ledger_service_async(db, user_id)
+    return JSONResponse(
+        status_code=200,
+        content={**ledger, "message": "거래 누적 합계 조회 성공", "status": 200}
+    )
+
+# 거래 내역 전체 내보내기 API (NDJSON/CSV 스트리밍)
+@router.get("/transactions/export")
+def export_money_transactions(
+    format: str = Query("ndjson", description="내보내기 형식 (ndjson, csv)"),
+    db: Session = Depends(get_db),
+    session_factory = Depends(get_stream_session_factory),
+    user_id: UUID = Header(..., alias="user-id")
+):
+    stream, media_type = export_transactions_service(db, session_factory, user_id, format)
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="transactions-{user_id}.{format}"'}
+    )
@@ -1,9 +1,14 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import update, insert, select, literal, values, column, Integer, func, tuple_
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from typing import Dict, Iterable, List, Optional
 from app.models.user import User
 from app.models.moneyTransaction import MoneyTransaction, TransactionDirection
+from app.models.ledger_snapshot import LedgerSnapshot
 from uuid import uuid4, UUID
 from datetime import datetime
 from app.core.config import KST
+from app.core.idgen import next_tx_id
 
 def insert_user(db: Session) -> User: # 데이터베이스에 유저를 추가하는 쿼리
     # 유저가 이미 하나라도 있으면 새로 생성하지 않음
@@ -21,23 +26,34 @@ def insert_user(db: Session) -> User: # 데이터베이스에 유저를 추가
     return new_user
 
 def get_user_by_id(db: Session, user_id: UUID):
-    return db.query(User).filter(User.userId == user_id).first()
+    # 삭제 대기 중인 사용자는 없는 사용자로 취급
+    return db.query(User).filter(User.active(user_id)).first()
+
+def get_user_money(db: Session, user_id: UUID) -> Optional[int]:
+    # 잔액만 조회 (엔티티 로드 없이)
+    return db.execute(select(User.money).where(User.active(user_id))).scalar()
 
 def update_user_money(db: Session, user_id: UUID, new_amount: int) -> User:
-    user = db.query(User).filter(User.userId == user_id).first()
+    user = db.query(User).filter(User.active(user_id)).first()
     if user:
         user.money = new_amount
         db.flush()  # commit 대신 flush 사용
     return user
 
+def set_user_money(db: Session, user_id: UUID, new_amount: int) -> None:
+    # 이미 조회된 사용자의 잔액을 재조회 없이 갱신
+    db.execute(
+        update(User)
+        .where(User.active(user_id))
+        .values(money=new_amount)
+        .execution_options(synchronize_session=False)
+    )
+
 def create_transaction(db: Session, user_id: UUID, amount: int, source: str, direction: TransactionDirection, current_money: int) -> MoneyTransaction:
     now_kst = datetime.now(KST)
     
-    # txId를 자동 생성 (타임스탬프 기반)
-    tx_id = str(int(now_kst.timestamp() * 1000000))
-    
     transaction = MoneyTransaction(
-        txId=tx_id,
+        txId=next_tx_id(),
         userId=user_id,
         amount=amount,
         source=source,
@@ -48,4 +64,199 @@ def create_transaction(db: Session, user_id: UUID, amount: int, source: str, dir
     
     db.add(transaction)
     db.flush()  # commit 대신 flush 사용
-    return transaction
\ No newline at end of file
+    # 거래 누적 합계도 같은 트랜잭션에서 갱신
+    increment_ledger_snapshots(db, [{
+        "userId": user_id, "source": source, "direction": direction, "amount": amount, "createdAt": now_kst
+    }])
+    return transaction
+
+def apply_balance_change(db: Session, user_id: UUID, amount: int, source: str, direction: TransactionDirection) -> Optional[MoneyTransaction]:
+    # 잔액 증감과 거래 기록을 한 문장으로 처리 (잔액을 읽어서 계산하지 않으므로 동시 요청에도 갱신 유실 없음)
+    # WITH updated AS (UPDATE "Users" SET money = money + :amount WHERE "userId" = :id AND money + :amount >= 0 RETURNING ...),
+    #      inserted AS (INSERT INTO "MoneyTransactions" (...) SELECT ... FROM updated RETURNING ...),
+    #      ledger AS (INSERT INTO "LedgerSnapshots" ... SELECT ... FROM inserted ON CONFLICT DO UPDATE ...)
+    # SELECT ... FROM inserted
+    # 사용자가 없거나 잔액이 부족하면 갱신되는 행이 없으므로 None 반환
+    now_kst = datetime.now(KST)
+    tx_id = next_tx_id()
+    columns = MoneyTransaction.__table__.c
+
+    updated = (
+        update(User)
+        .where(User.active(user_id), User.money + amount >= 0)
+        .values(money=User.money + amount)
+        .returning(User.userId, User.money)
+        .cte("updated")
+    )
+
+    inserted = (
+        insert(MoneyTransaction)
+        .from_select(
+            ["txId", "userId", "amount", "source", "direction", "currentMoney", "createdAt"],
+            select(
+                literal(tx_id, columns.txId.type),
+                updated.c.userId,
+                literal(amount, columns.amount.type),
+                literal(source, columns.source.type),
+                literal(direction, columns.direction.type),
+                updated.c.money,
+                literal(now_kst, columns.createdAt.type)
+            )
+        )
+        .returning(columns.txId, columns.userId, columns.amount, columns.source,
+                   columns.direction, columns.currentMoney, columns.createdAt)
+        .cte("inserted")
+    )
+
+    ledger = _upsert_ledger_snapshots(
+        pg_insert(LedgerSnapshot).from_select(
+            ["userId", "source", "direction", "totalAmount", "txCount", "lastTxAt"],
+            select(
+                inserted.c.userId, inserted.c.source, inserted.c.direction,
+                inserted.c.amount, literal(1), inserted.c.createdAt
+            )
+        )
+    ).cte("ledger")
+
+    stmt = select(inserted.c.txId, inserted.c.currentMoney, inserted.c.createdAt).add_cte(ledger)
+
+    row = db.execute(stmt).first()
+    if row is None:
+        return None
+
+    # 응답용 객체 (이미 저장되었으므로 세션에 추가하지 않음)
+    return MoneyTransaction(
+        txId=row.txId,
+        userId=user_id,
+        amount=amount,
+        source=source,
+        direction=direction,
+        currentMoney=row.currentMoney,
+        createdAt=row.createdAt
+    )
+
+def lock_user_balances(db: Session, user_ids: Iterable[UUID]) -> Dict[UUID, int]:
+    # 여러 사용자의 잔액을 한 번에 조회하고 잠금 (userId 순서로 잠가 교착 상태 방지)
+    rows = db.execute(
+        select(User.userId, User.money)
+        .where(User.active_in(user_ids))
+        .order_by(User.userId)
+        .with_for_update()
+    ).all()
+    return {user_id: money for user_id, money in rows}
+
+def set_user_balances(db: Session, balances: Dict[UUID, int]) -> None:
+    # 여러 사용자의 잔액을 UPDATE ... FROM (VALUES ...) 한 문장으로 갱신
+    if not balances:
+        return
+
+    balance_rows = values(
+        column("userId", PG_UUID(as_uuid=True)),
+        column("money", Integer),
+        name="balances"
+    ).data(list(balances.items()))
+
+    db.execute(
+        update(User)
+        .where(User.userId == balance_rows.c.userId)
+        .values(money=balance_rows.c.money)
+        .execution_options(synchronize_session=False)
+    )
+
+def create_transactions(db: Session, rows: List[dict]) -> None:
+    # 거래 기록 여러 건을 multi-row INSERT로 저장 (거래 누적 합계도 함께 갱신)
+    if rows:
+        db.execute(insert(MoneyTransaction), rows)
+        increment_ledger_snapshots(db, rows)
+
+def _upsert_ledger_snapshots(stmt):
+    # 거래 누적 합계 upsert (이미 있으면 합계/건수 누적)
+    return stmt.on_conflict_do_update(
+        constraint='pk_ledger_snapshot',
+        set_={
+            "totalAmount": LedgerSnapshot.totalAmount + stmt.excluded.totalAmount,
+            "txCount": LedgerSnapshot.txCount + stmt.excluded.txCount,
+            "lastTxAt": func.greatest(LedgerSnapshot.lastTxAt, stmt.excluded.lastTxAt),
+            "updatedAt": func.now()
+        }
+    )
+
+def increment_ledger_snapshots(db, transactions: Iterable[dict]) -> None:
+    # (userId, source, direction)별로 묶어서 누적 합계를 multi-row upsert 한 문장으로 갱신
+    # 동시 요청 간 교착 상태를 막기 위해 PK 순서로 정렬
+    totals = {}
+    for tx in transactions:
+        key = (tx["userId"], tx["source"], tx["direction"])
+        amount, count, last_tx_at = totals.get(key, (0, 0, None))
+        created_at = tx.get("createdAt") or datetime.now(KST)
+        totals[key] = (amount + tx["amount"], count + 1, max(last_tx_at, created_at) if last_tx_at else created_at)
+
+    if not totals:
+        return
+
+    rows = [
+        {
+            "userId": user_id,
+            "source": source,
+            "direction": direction,
+            "totalAmount": amount,
+            "txCount": count,
+            "lastTxAt": last_tx_at
+        }
+        for (user_id, source, direction), (amount, count, last_tx_at)
+        in sorted(totals.items(), key=lambda item: (str(item[0][0]), item[0][1], item[0][2].value))
+    ]
+    db.execute(_upsert_ledger_snapshots(pg_insert(LedgerSnapshot).values(rows)))
+
+def rebuild_ledger_snapshots(db: Session, user_id: Optional[UUID] = None) -> None:
+    # MoneyTransactions 기준으로 누적 합계 재계산 (정합성 점검/복구용)
+    snapshot_filter = [LedgerSnapshot.userId == user_id] if user_id else []
+    transaction_filter = [MoneyTransaction.userId == user_id] if user_id else []
+
+    db.execute(
+        LedgerSnapshot.__table__.delete().where(*snapshot_filter)
+    )
+    db.execute(
+        pg_insert(LedgerSnapshot).from_select(
+            ["userId", "source", "direction", "totalAmount", "txCount", "lastTxAt"],
+            select(
+                MoneyTransaction.userId,
+                MoneyTransaction.source,
+                MoneyTransaction.direction,
+                func.sum(MoneyTransaction.amount),
+                func.count(),
+                func.max(MoneyTransaction.createdAt)
+            )
+            .where(*transaction_filter)
+            .group_by(MoneyTransaction.userId, MoneyTransaction.source, MoneyTransaction.direction)
+        )
+    )
+
+def get_ledger_snapshots(db: Session, user_id: UUID) -> List[LedgerSnapshot]:
+    return db.query(LedgerSnapshot).filter(
+        LedgerSnapshot.userId == user_id
+    ).order_by(LedgerSnapshot.source, LedgerSnapshot.direction).all()
+
+def get_transaction_page(db: Session, user_id: UUID, limit: int, after: Optional[tuple] = None) -> List[MoneyTransaction]:
+    # 거래 내역 keyset 페이지 조회 (최신순, OFFSET 없이 (createdAt, txId) 기준 다음 페이지)
+    # after: 이전 페이지 마지막 거래의 (createdAt, txId)
+    return db.execute(transaction_page_query(user_id, limit, after)).scalars().all()
+
+def transaction_page_query(user_id: UUID, limit: int, after: Optional[tuple] = None):
+    query = select(MoneyTransaction).where(MoneyTransaction.userId == user_id)
+    if after is not None:
+        query = query.where(tuple_(MoneyTransaction.createdAt, MoneyTransaction.txId) < tuple_(*after))
+    return query.order_by(MoneyTransaction.createdAt.desc(), MoneyTransaction.txId.desc()).limit(limit)
+
+def transaction_export_query(user_id: UUID):
+    # 거래 내역 내보내기 (오래된 순, 컬럼 단위 조회)
+    return select(
+        MoneyTransaction.txId,
+        MoneyTransaction.createdAt,
+        MoneyTransaction.source,
+        MoneyTransaction.direction,
+        MoneyTransaction.amount,
+        MoneyTransaction.currentMoney
+    ).where(
+        MoneyTransaction.userId == user_id
+    ).order_by(MoneyTransaction.createdAt, MoneyTransaction.txId)
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from uuid import UUID
 from datetime import datetime
+from typing import List, Optional
 
 # 유저 생성 응답 dto(/users/start)
 class UserCreateResponse(BaseModel):   
@@ -31,4 +32,56 @@ class TransactionResponse(BaseModel):
 class TransactionErrorResponse(BaseModel):
     message: str
     status: int
-    code: str = None
\ No newline at end of file
+    code: str = None
+
+# 일괄 거래 항목 dto (userId가 없으면 user-id 헤더의 사용자)
+class BatchTransactionEntry(BaseModel):
+    userId: Optional[UUID] = None
+    amount: int
+    source: str
+
+# 일괄 거래 요청 dto
+class BatchTransactionRequest(BaseModel):
+    transactions: List[BatchTransactionEntry]
+
+# 일괄 거래 항목별 결과 dto
+class BatchTransactionResult(BaseModel):
+    index: int
+    status: int
+    message: str
+    userId: Optional[UUID] = None
+    txId: Optional[str] = None
+    amount: int
+    source: str
+    direction: Optional[str] = None
+    currentMoney: Optional[int] = None
+    createdAt: Optional[datetime] = None
+
+# 일괄 거래 응답 dto
+class BatchTransactionResponse(BaseModel):
+    applied: int
+    rejected: int
+    results: List[BatchTransactionResult]
+    status: int
+
+# 거래 내역 조회 응답 dto (keyset 페이지네이션, nextCursor가 없으면 마지막 페이지)
+class TransactionHistoryResponse(BaseModel):
+    items: List[TransactionResponse]
+    nextCursor: Optional[str] = None
+    message: str
+    status: int
+
+# 출처/방향별 거래 누적 합계 dto
+class LedgerTotal(BaseModel):
+    source: str
+    direction: str
+    totalAmount: int
+    txCount: int
+    lastTxAt: Optional[datetime] = None
+
+# 거래 누적 합계 조회 응답 dto
+class LedgerResponse(BaseModel):
+    money: int
+    totals: List[LedgerTotal]
+    message: str
+    status: int
@@ -1,10 +1,28 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from app.api.user.repository import insert_user, get_user_by_id, update_user_money, create_transaction
+from app.api.user.repository import insert_user, get_user_by_id, get_user_money, set_user_money, create_transaction, apply_balance_change
+from app.api.user.repository import lock_user_balances, set_user_balances, create_transactions
+from app.api.user.repository import get_transaction_page, get_ledger_snapshots, transaction_export_query
+from app.core.export import stream_query, validate_export_format
+from app.api.user.schema import BatchTransactionEntry, BatchTransactionResult
+from app.models.moneyTransaction import MoneyTransaction
+from app.core.config import KST
+from app.core.idgen import next_tx_id
+from datetime import datetime
+from typing import List, Optional
+import base64
+import binascii
+from app.api.user import async_repository
 from app.models.moneyTransaction import TransactionDirection
 from app.core.exception import CustomException
 from uuid import UUID
 
+# 일괄 거래 요청 한 번에 처리할 수 있는 최대 항목 수
+MAX_BATCH_TRANSACTIONS = 1000
+# MoneyTransactions.source 컬럼 길이
+SOURCE_MAX_LENGTH = MoneyTransaction.__table__.c.source.type.length
+
 # 유저 생성(/users/start)
 def create_user(db: Session):
     try:
@@ -16,35 +34,42 @@ def create_user(db: Session):
 def get_user_property_service(db: Session, user_id: UUID):
     return get_user_by_id(db, user_id)
 
+# 코인 조회 (비동기 세션)
+async def get_user_property_service_async(db: AsyncSession, user_id: UUID):
+    return await async_repository.get_user_by_id(db, user_id)
+
 # 거래 처리(/users/transactions)
-def process_transaction(db: Session, user_id: UUID, amount: int, source: str, commit: bool = True):
+# current_money: 호출 측에서 이미 조회(잠금)한 잔액, 주어지면 사용자를 다시 조회하지 않고 이 잔액 기준으로 처리
+def process_transaction(db: Session, user_id: UUID, amount: int, source: str, commit: bool = True,
+                        current_money: Optional[int] = None):
     try:
-        # 사용자 조회
-        user = get_user_by_id(db, user_id)
-        if not user:
-            raise CustomException(message="사용자를 찾을 수 없습니다.", status=404)
+        # 거래 방향 결정
+        direction = TransactionDirection.IN if amount > 0 else TransactionDirection.OUT
         
-        # 새로운 잔액 계산
-        new_balance = user.money + amount
-
-        print(new_balance)
+        if current_money is not None:
+            new_balance = current_money + amount
+            if new_balance < 0:
+                raise CustomException(
+                    message=f"잔액이 부족합니다. 현재 잔액: {current_money}원, 요청 금액: {abs(amount)}원",
+                    status=400
+                )
+            set_user_money(db, user_id, new_balance)
+            transaction = create_transaction(db, user_id, amount, source, direction, new_balance)
+        else:
+            # 잔액 증감 + 거래 로그 생성 (조건부 UPDATE ... RETURNING과 INSERT를 한 문장으로 처리)
+            transaction = apply_balance_change(db, user_id, amount, source, direction)
         
-        # 잔액 부족 체크
-        if new_balance < 0:
+        if transaction is None:
+            # 갱신된 행이 없는 경우에만 원인 확인 (사용자 없음 / 잔액 부족)
+            current_money = get_user_money(db, user_id)
+            if current_money is None:
+                raise CustomException(message="사용자를 찾을 수 없습니다.", status=404)
+            
             raise CustomException(
-                message=f"잔액이 부족합니다. 현재 잔액: {user.money}원, 요청 금액: {abs(amount)}원", 
+                message=f"잔액이 부족합니다. 현재 잔액: {current_money}원, 요청 금액: {abs(amount)}원", 
                 status=400
             )
         
-        # 거래 방향 결정
-        direction = TransactionDirection.IN if amount > 0 else TransactionDirection.OUT
-        
-        # 사용자 잔액 업데이트
-        updated_user = update_user_money(db, user_id, new_balance)
-        
-        # 거래 로그 생성
-        transaction = create_transaction(db, user_id, amount, source, direction, new_balance)
-        
         if commit:
             db.commit()
         
@@ -61,3 +86,163 @@ def process_transaction(db: Session, user_id: UUID, amount: int, source: str, co
         db.rollback()
         print(f"Unexpected error: {str(e)}")
         raise CustomException(message="서버 내부 오류로 인해 거래를 생성하지 못했습니다.", status=500)
+
+
+# 일괄 거래 처리(/users/transactions/batch)
+# 항목별로 검증하고, 사용자별 잔액 갱신 1회 + 거래 기록 multi-row INSERT로 한 트랜잭션에 처리
+# 같은 사용자의 항목은 요청 순서대로 누적 잔액을 계산하며, 잔액이 부족한 항목만 거절됨
+def process_transactions_batch(db: Session, default_user_id: Optional[UUID], entries: List[BatchTransactionEntry]) -> List[BatchTransactionResult]:
+    if not entries:
+        raise CustomException(message="거래 항목이 비어 있습니다.", status=400)
+
+    if len(entries) > MAX_BATCH_TRANSACTIONS:
+        raise CustomException(message=f"한 번에 최대 {MAX_BATCH_TRANSACTIONS}건까지 처리할 수 있습니다.", status=400)
+
+    try:
+        user_ids = {entry.userId or default_user_id for entry in entries} - {None}
+        balances = lock_user_balances(db, user_ids) if user_ids else {}
+
+        now_kst = datetime.now(KST)
+        new_balances = {}
+        rows = []
+        results = []
+
+        for index, entry in enumerate(entries):
+            user_id = entry.userId or default_user_id
+            result = BatchTransactionResult(
+                index=index, status=400, message="", userId=user_id, amount=entry.amount, source=entry.source
+            )
+            results.append(result)
+
+            if user_id is None:
+                result.message = "userId 또는 user-id 헤더가 필요합니다."
+                continue
+
+            if not entry.source or len(entry.source) > SOURCE_MAX_LENGTH:
+                result.message = f"source는 1~{SOURCE_MAX_LENGTH}자여야 합니다."
+                continue
+
+            if user_id not in balances:
+                result.status = 404
+                result.message = "사용자를 찾을 수 없습니다."
+                continue
+
+            current_money = new_balances.get(user_id, balances[user_id])
+            new_balance = current_money + entry.amount
+            if new_balance < 0:
+                result.message = f"잔액이 부족합니다. 현재 잔액: {current_money}원, 요청 금액: {abs(entry.amount)}원"
+                continue
+
+            direction = TransactionDirection.IN if entry.amount > 0 else TransactionDirection.OUT
+            new_balances[user_id] = new_balance
+            row = {
+                "txId": next_tx_id(),
+                "userId": user_id,
+                "amount": entry.amount,
+                "source": entry.source,
+                "direction": direction,
+                "currentMoney": new_balance,
+                "createdAt": now_kst
+            }
+            rows.append(row)
+
+            result.status = 201
+            result.message = "거래가 완료되었습니다."
+            result.txId = row["txId"]
+            result.direction = direction.value.upper()
+            result.currentMoney = new_balance
+            result.createdAt = now_kst
+
+        set_user_balances(db, new_balances)
+        create_transactions(db, rows)
+        db.commit()
+
+        return results
+
+    except CustomException as e:
+        db.rollback()
+        raise e
+    except SQLAlchemyError as e:
+        db.rollback()
+        print(f"Database error: {str(e)}")
+        raise CustomException(message="데이터베이스 오류가 발생했습니다.", status=500)
+
+
+# 거래 내역 커서 (이전 페이지 마지막 거래의 createdAt, txId)
+def encode_transaction_cursor(transaction: MoneyTransaction) -> str:
+    raw = f"{transaction.createdAt.isoformat()}|{transaction.txId}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_transaction_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    if not cursor:
+        return None
+    try:
+        created_at, tx_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), tx_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise CustomException(message="유효하지 않은 cursor입니다.", status=400)
+
+def to_transaction_response(transaction: MoneyTransaction) -> dict:
+    return {
+        "txId": transaction.txId,
+        "userId": str(transaction.userId),
+        "amount": transaction.amount,
+        "source": transaction.source,
+        "direction": transaction.direction.value.upper(),
+        "currentMoney": transaction.currentMoney,
+        "createdAt": transaction.createdAt.isoformat()
+    }
+
+def build_transaction_page(transactions: List[MoneyTransaction], limit: int) -> dict:
+    # limit + 1건을 조회해서 다음 페이지 존재 여부 판단
+    has_next = len(transactions) > limit
+    page = transactions[:limit]
+    return {
+        "items": [to_transaction_response(transaction) for transaction in page],
+        "nextCursor": encode_transaction_cursor(page[-1]) if has_next else None
+    }
+
+# 거래 내역 조회(/users/transactions) - 최신순 keyset 페이지네이션
+def get_transaction_history_service(db: Session, user_id: UUID, limit: int, cursor: Optional[str]) -> dict:
+    after = decode_transaction_cursor(cursor)
+    transactions = get_transaction_page(db, user_id, limit + 1, after)
+    return build_transaction_page(transactions, limit)
+
+# 거래 내역 조회 (비동기 세션)
+async def get_transaction_history_service_async(db: AsyncSession, user_id: UUID, limit: int, cursor: Optional[str]) -> dict:
+    after = decode_transaction_cursor(cursor)
+    transactions = await async_repository.get_transaction_page(db, user_id, limit + 1, after)
+    return build_transaction_page(transactions, limit)
+
+def build_ledger_totals(snapshots) -> List[dict]:
+    return [
+        {
+            "source": snapshot.source,
+            "direction": snapshot.direction.value.upper(),
+            "totalAmount": int(snapshot.totalAmount),
+            "txCount": snapshot.txCount,
+            "lastTxAt": snapshot.lastTxAt.isoformat() if snapshot.lastTxAt else None
+        }
+        for snapshot in snapshots
+    ]
+
+# 거래 누적 합계 조회(/users/ledger)
+def get_ledger_service(db: Session, user_id: UUID) -> dict:
+    money = get_user_money(db, user_id)
+    if money is None:
+        raise CustomException(message="사용자를 찾을 수 없습니다.", status=404)
+    return {"money": money, "totals": build_ledger_totals(get_ledger_snapshots(db, user_id))}
+
+# 거래 누적 합계 조회 (비동기 세션)
+async def get_ledger_service_async(db: AsyncSession, user_id: UUID) -> dict:
+    money = await async_repository.get_user_money(db, user_id)
+    if money is None:
+        raise CustomException(message="사용자를 찾을 수 없습니다.", status=404)
+    return {"money": money, "totals": build_ledger_totals(await async_repository.get_ledger_snapshots(db, user_id))}
+
+# 거래 내역 내보내기(/users/transactions/export) - (스트림, Content-Type) 반환
+def export_transactions_service(db: Session, session_factory, user_id: UUID, export_format: str):
+    media_type = validate_export_format(export_format)
+    if get_user_money(db, user_id) is None:
+        raise CustomException(message="사용자를 찾을 수 없습니다.", status=404)
+    return stream_query(session_factory, transaction_export_query(user_id), export_format), media_type
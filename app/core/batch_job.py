@@ -0,0 +1,102 @@
+# app/core/batch_job.py
+# 일 단위 배치 작업을 PK 구간(청크)으로 나눠 실행 (청크마다 커밋, 중단되면 이어서 실행, 같은 날짜는 한 번만 실행)
+import time
+from datetime import date
+from typing import Callable, Optional, Tuple
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.models.batch_job_run import BatchJobRun
+
+# (db, 이전 cursor, 청크 크기) -> (처리한 행 수, 다음 cursor), 처리한 행이 없으면 작업 완료
+ChunkProcessor = Callable[[Session, Optional[dict], int], Tuple[int, Optional[dict]]]
+
+
+def lock_job_run(db: Session, job_name: str, run_date: date) -> BatchJobRun:
+    # 작업 실행 기록을 만들고(없으면) 행 잠금 후 반환
+    # 같은 작업을 동시에 실행해도 청크 처리가 이 잠금으로 직렬화되어 같은 구간을 두 번 처리하지 않음
+    db.execute(
+        pg_insert(BatchJobRun)
+        .values(jobName=job_name, runDate=run_date)
+        .on_conflict_do_nothing(constraint='pk_batch_job_run')
+    )
+    return db.execute(
+        select(BatchJobRun)
+        .where(BatchJobRun.jobName == job_name, BatchJobRun.runDate == run_date)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    ).scalar_one()
+
+
+def get_job_run(db: Session, job_name: str, run_date: date) -> Optional[BatchJobRun]:
+    return db.get(BatchJobRun, (job_name, run_date))
+
+
+def run_chunked_job(db: Session, job_name: str, run_date: date, process_chunk: ChunkProcessor,
+                    chunk_size: int, pause: float = 0.0) -> dict:
+    # 청크 처리와 cursor 갱신을 한 트랜잭션으로 커밋 (중간에 실패해도 커밋된 청크는 다시 처리하지 않음)
+    chunk_size = max(1, int(chunk_size))
+    started = time.perf_counter()
+    rows = chunks = 0
+    already_completed = False
+    try:
+        while True:
+            run = lock_job_run(db, job_name, run_date)
+            if run.status == "completed":
+                already_completed = chunks == 0
+                db.commit()
+                break
+
+            count, cursor = process_chunk(db, run.cursor, chunk_size)
+            run.status = "running"
+            run.updatedAt = func.now()
+            if count == 0:
+                run.status = "completed"
+                run.finishedAt = func.now()
+                db.commit()
+                break
+
+            run.cursor = cursor
+            run.rowsProcessed = BatchJobRun.rowsProcessed + count
+            run.chunkCount = BatchJobRun.chunkCount + 1
+            db.commit()
+            rows += count
+            chunks += 1
+            if pause > 0:
+                time.sleep(pause)
+    except Exception:
+        db.rollback()
+        run = lock_job_run(db, job_name, run_date)
+        if run.status != "completed":
+            run.status = "failed"
+            run.updatedAt = func.now()
+        db.commit()
+        raise
+
+    seconds = time.perf_counter() - started
+    return {
+        "jobName": job_name,
+        "runDate": run_date.isoformat(),
+        "alreadyCompleted": already_completed,
+        "rowsProcessed": rows,
+        "chunks": chunks,
+        "seconds": round(seconds, 3),
+        "rowsPerSecond": round(rows / seconds, 1) if seconds > 0 else 0.0
+    }
+
+
+def job_run_status(run: Optional[BatchJobRun]) -> Optional[dict]:
+    # 진행 상황 (여러 번 나눠 실행된 경우 누적 값)
+    if run is None:
+        return None
+    return {
+        "jobName": run.jobName,
+        "runDate": run.runDate.isoformat(),
+        "status": run.status,
+        "cursor": run.cursor,
+        "rowsProcessed": run.rowsProcessed,
+        "chunks": run.chunkCount,
+        "startedAt": run.startedAt.isoformat() if run.startedAt else None,
+        "updatedAt": run.updatedAt.isoformat() if run.updatedAt else None,
+        "finishedAt": run.finishedAt.isoformat() if run.finishedAt else None
+    }
@@ -0,0 +1,119 @@
+# app/core/cache.py
+# 프로세스 메모리 캐시와 사용자별 캐시 무효화
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional
+from uuid import UUID
+
+# 읽기 전용 요청 (사용자 데이터를 바꾸지 않음)
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class TTLCache:
+    # 최대 개수와 만료 시간이 있는 LRU 캐시
+    # - delete/clear마다 키 버전이 올라감, 조회 전에 받아 둔 version과 다르면 set은 저장하지 않음
+    #   (조회하는 동안 무효화된 경우 이전 값이 다시 저장되지 않도록)
+    # - 버전은 증가하는 전역 번호로, 오래된 키 버전은 max_size개를 넘으면 삭제하고 그 값을 기본 버전으로 사용
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max(0, int(max_size))
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._versions: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._counter = 0
+        self._base_version = 0
+        self._lock = threading.Lock()
+
+    def version(self, key: Hashable) -> int:
+        # 현재 키 버전 (DB 조회 전에 받아서 set에 전달)
+        with self._lock:
+            return self._versions.get(key, self._base_version)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, version: Optional[int] = None) -> None:
+        if self.max_size == 0:
+            return
+        with self._lock:
+            if version is not None and version != self._versions.get(key, self._base_version):
+                return
+            self._items[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+            self._counter += 1
+            self._versions.pop(key, None)
+            self._versions[key] = self._counter
+            while len(self._versions) > self.max_size:
+                _, evicted = self._versions.popitem(last=False)
+                self._base_version = evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._counter += 1
+            self._versions.clear()
+            self._base_version = self._counter
+
+
+# 사용자 ID를 키로 쓰는 캐시 (해당 사용자의 쓰기 요청이 끝나면 무효화)
+USER_CACHES: List[TTLCache] = []
+
+
+def user_cache(max_size: int, ttl_seconds: float) -> TTLCache:
+    cache = TTLCache(max_size, ttl_seconds)
+    USER_CACHES.append(cache)
+    return cache
+
+
+def invalidate_user(user_id: UUID) -> None:
+    for cache in USER_CACHES:
+        cache.delete(user_id)
+
+
+def clear_user_caches() -> None:
+    for cache in USER_CACHES:
+        cache.clear()
+
+
+class UserCacheInvalidationMiddleware:
+    # user-id 헤더가 있는 쓰기 요청(POST/PATCH/PUT/DELETE)이 끝나면 그 사용자의 캐시 무효화
+    # (다른 워커의 캐시는 ttl_seconds가 지나면 만료)
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in READ_METHODS or not USER_CACHES:
+            await self.app(scope, receive, send)
+            return
+
+        user_id = None
+        for name, value in scope["headers"]:
+            if name.lower() == b"user-id":
+                try:
+                    user_id = UUID(value.decode("latin-1"))
+                except ValueError:
+                    pass
+                break
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if user_id is not None:
+                invalidate_user(user_id)
@@ -0,0 +1,165 @@
+# app/core/catalog.py
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import CATALOG_TTL_SECONDS
+from app.core.database import SessionLocal
+from app.models.action import Action
+from app.models.category import Category
+from app.models.emotionmessages import EmotionMessage
+from app.models.attendance import AttendanceReward
+from app.models.minigames import Minigame
+
+# 백그라운드 로드 실패 후 다시 시도하기까지 대기 시간(초)
+RETRY_SECONDS = 5
+
+
+class CatalogSnapshot:
+    # 한 시점의 기준 테이블 데이터 (세션에서 분리된 읽기 전용 객체)
+
+    def __init__(self, db: Session, version: int):
+        self.version = version
+        self.loaded_at = time.monotonic()
+
+        self.actions: Dict[int, Action] = {a.actionId: a for a in db.query(Action).order_by(Action.actionId).all()}
+
+        categories = db.query(Category).order_by(Category.categoryId).all()
+        self.categories_by_id: Dict[int, Category] = {c.categoryId: c for c in categories}
+        self.categories_by_name: Dict[str, Category] = {}
+        for category in categories:
+            self.categories_by_name.setdefault(category.name, category)
+
+        self.emotion_messages: Dict[Tuple[int, int], EmotionMessage] = {}
+        for message in db.query(EmotionMessage).order_by(EmotionMessage.emotionMessageId).all():
+            self.emotion_messages.setdefault((message.categoryId, message.emotionMessageLevel), message)
+
+        self.attendance_rewards: List[AttendanceReward] = db.query(AttendanceReward).order_by(
+            AttendanceReward.attendanceRewardId
+        ).all()
+        self.attendance_rewards_by_id: Dict[int, AttendanceReward] = {
+            r.attendanceRewardId: r for r in self.attendance_rewards
+        }
+
+        self.minigames: Dict[int, Minigame] = {g.minigameId: g for g in db.query(Minigame).all()}
+
+        # 세션 종료 후에도 속성을 읽을 수 있도록 분리
+        db.expunge_all()
+
+
+class CatalogCache:
+    # Actions, Categories, EmotionMessages, AttendanceRewards, Minigames 프로세스 캐시
+    # - 리포지토리는 캐시를 먼저 조회하고, 없으면 DB를 조회함
+    # - refresh()마다 version이 증가하고 등록된 리스너가 호출됨
+    # - ttl_seconds가 지나면 다음 조회 시 백그라운드에서 다시 로드 (워커 간 데이터 일치용)
+
+    def __init__(self, ttl_seconds: int = CATALOG_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Session], None]] = []
+        self._retry_at = 0.0
+
+    def add_refresh_listener(self, listener: Callable[[Session], None]) -> None:
+        # 캐시가 새로 로드될 때 함께 갱신해야 하는 파생 데이터 등록
+        self._listeners.append(listener)
+
+    def refresh(self) -> int:
+        # DB에서 전체 기준 테이블을 다시 로드하고 새 버전 번호 반환
+        with self._lock:
+            self._load()
+            return self.version
+
+    def _load(self) -> None:
+        db = SessionLocal()
+        try:
+            snapshot = CatalogSnapshot(db, self.version + 1)
+            self._snapshot = snapshot
+            self.version = snapshot.version
+            for listener in self._listeners:
+                listener(db)
+        finally:
+            db.close()
+
+    def invalidate(self) -> None:
+        # 다음 조회 시 다시 로드하도록 현재 캐시 무효화
+        self._snapshot = None
+
+    def snapshot(self) -> Optional[CatalogSnapshot]:
+        # 요청 처리 중에는 DB를 조회하지 않음 (async 라우트에서 이벤트 루프를 막지 않도록)
+        # 캐시가 없거나 만료됐으면 백그라운드 스레드에서 다시 로드하고, 그동안은 이전 캐시 사용 (없으면 None -> 리포지토리가 DB 조회)
+        snapshot = self._snapshot
+        if snapshot is None or self._is_expired(snapshot):
+            self._refresh_in_background()
+        return snapshot
+
+    def _refresh_in_background(self) -> None:
+        # 이미 다른 스레드가 로드 중이거나 최근 로드에 실패했으면 새로 시작하지 않음
+        if time.monotonic() < self._retry_at or not self._lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(target=self._background_load, name="catalog-refresh", daemon=True).start()
+        except Exception:
+            self._lock.release()
+            raise
+
+    def _background_load(self) -> None:
+        try:
+            self._load()
+        except Exception as e:
+            self._retry_at = time.monotonic() + RETRY_SECONDS
+            print(f"Error loading catalog cache: {str(e)}")
+        finally:
+            self._lock.release()
+
+    def _is_expired(self, snapshot: CatalogSnapshot) -> bool:
+        return self.ttl_seconds > 0 and time.monotonic() - snapshot.loaded_at > self.ttl_seconds
+
+    def get_action(self, action_id: int) -> Optional[Action]:
+        snapshot = self.snapshot()
+        return snapshot.actions.get(action_id) if snapshot else None
+
+    def get_actions_by_category_and_evolution(self, category_name: str, evolution_stage: int) -> List[Action]:
+        snapshot = self.snapshot()
+        if not snapshot:
+            return []
+        category = snapshot.categories_by_name.get(category_name)
+        if not category:
+            return []
+        return [
+            a for a in snapshot.actions.values()
+            if a.categoryId == category.categoryId and a.evolutionStage == evolution_stage
+        ]
+
+    def get_category(self, category_id: int) -> Optional[Category]:
+        snapshot = self.snapshot()
+        return snapshot.categories_by_id.get(category_id) if snapshot else None
+
+    def get_category_by_name(self, category_name: str) -> Optional[Category]:
+        snapshot = self.snapshot()
+        return snapshot.categories_by_name.get(category_name) if snapshot else None
+
+    def get_emotion_message(self, category_id: int, level: int) -> Optional[EmotionMessage]:
+        snapshot = self.snapshot()
+        return snapshot.emotion_messages.get((category_id, level)) if snapshot else None
+
+    def get_attendance_rewards(self) -> List[AttendanceReward]:
+        snapshot = self.snapshot()
+        return list(snapshot.attendance_rewards) if snapshot else []
+
+    def get_attendance_reward(self, reward_id: int) -> Optional[AttendanceReward]:
+        snapshot = self.snapshot()
+        return snapshot.attendance_rewards_by_id.get(reward_id) if snapshot else None
+
+    def get_minigame(self, game_id: int) -> Optional[Minigame]:
+        snapshot = self.snapshot()
+        return snapshot.minigames.get(game_id) if snapshot else None
+
+    def get_minigames(self) -> List[Minigame]:
+        snapshot = self.snapshot()
+        return [snapshot.minigames[game_id] for game_id in sorted(snapshot.minigames)] if snapshot else []
+
+
+# 프로세스 전역 기준 테이블 캐시
+catalog = CatalogCache()
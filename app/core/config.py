@@ -8,3 +8,74 @@ load_dotenv()
 
 TIMEZONE = os.getenv("TIMEZONE", "Asia/Seoul")
 KST = timezone(TIMEZONE)
+
+# 감정 예측 마이크로 배치 설정 (최대 배치 크기, 배치를 모으기 위한 최대 대기 시간(ms))
+PREDICT_MAX_BATCH_SIZE = int(os.getenv("PREDICT_MAX_BATCH_SIZE", "32"))
+PREDICT_MAX_WAIT_MS = float(os.getenv("PREDICT_MAX_WAIT_MS", "2"))
+
+# 관리자 API(/api/v1/admin) 토큰, X-Admin-Token 헤더가 일치하는 요청만 허용 (비어 있으면 관리자 API 전체 거절)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+# 기준 테이블 캐시 유효 시간(초), 0이면 관리자 새로고침 전까지 만료되지 않음
+CATALOG_TTL_SECONDS = int(os.getenv("CATALOG_TTL_SECONDS", "600"))
+
+# 비동기 DB 사용 여부 (true면 조회 API를 AsyncSession(asyncpg) 기반으로 처리)
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() == "true"
+
+# DB 커넥션 풀 / 엔진 설정
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"                  # 실행 SQL 로그 출력 (운영에서는 false)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))                          # 풀에 유지하는 커넥션 수
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))                   # 풀 크기를 넘어 추가로 여는 최대 커넥션 수
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))                 # 커넥션 대기 최대 시간(초)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"  # 체크아웃 시 커넥션 생존 확인
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))                 # 커넥션 재생성 주기(초), -1이면 재생성하지 않음
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))    # 쿼리 최대 실행 시간(ms), 0이면 제한 없음
+
+# PgBouncer(transaction pooling) 호환 모드 (prepared statement 캐시 비활성화, 세션 단위 설정 대신 트랜잭션 단위 설정 사용)
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+
+# 거래 ID(txId) 생성 방식 (snowflake: 시각+워커+시퀀스 64비트, timestamp: 기존 마이크로초 방식)
+TX_ID_GENERATOR = os.getenv("TX_ID_GENERATOR", "snowflake")
+# Snowflake 워커 ID (0~1023), 미지정 시 DB advisory lock으로 비어 있는 값을 임대 (DB_PGBOUNCER=true이면 필수)
+TX_ID_WORKER_ID = int(os.environ["TX_ID_WORKER_ID"]) if os.getenv("TX_ID_WORKER_ID") else None
+
+
+# 미니게임 일일 플레이 횟수 집계 방식
+# - db: 요청마다 UserMinigamePlays를 upsert (여러 워커/서버에서도 항상 정확)
+# - local: 워커 메모리 카운터로 한도를 확인하고 주기적으로 테이블에 일괄 반영 (단일 워커 전용, 공유 저장소 백엔드 등록 시 다중 워커 가능)
+MINIGAME_QUOTA_BACKEND = os.getenv("MINIGAME_QUOTA_BACKEND", "db")
+MINIGAME_QUOTA_FLUSH_INTERVAL_SECONDS = float(os.getenv("MINIGAME_QUOTA_FLUSH_INTERVAL_SECONDS", "5"))   # 테이블 반영 주기(초)
+MINIGAME_QUOTA_FLUSH_BATCH_SIZE = int(os.getenv("MINIGAME_QUOTA_FLUSH_BATCH_SIZE", "500"))               # 반영 대기 키가 이만큼 쌓이면 즉시 반영
+
+# 미니게임 리더보드 (메모리에 유지하는 상위 인원 수, 요약 테이블에서 다시 적재하는 주기(초), 0이면 다시 적재하지 않음)
+LEADERBOARD_TOP_K = int(os.getenv("LEADERBOARD_TOP_K", "100"))
+LEADERBOARD_REFRESH_SECONDS = int(os.getenv("LEADERBOARD_REFRESH_SECONDS", "60"))
+
+# Idempotency-Key 재시도 응답 저장 (보관 시간(초), 프로세스 캐시 최대 개수)
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_CACHE_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000"))
+
+# 오늘 생일인 사용자 목록 메모리 캐시 (최대 사용자 수를 넘으면 캐시하지 않고 DB 조회, 다시 적재하는 주기(초))
+BIRTHDAY_CALENDAR_MAX_USERS = int(os.getenv("BIRTHDAY_CALENDAR_MAX_USERS", "100000"))
+BIRTHDAY_CALENDAR_REFRESH_SECONDS = int(os.getenv("BIRTHDAY_CALENDAR_REFRESH_SECONDS", "300"))
+
+# 게임 초기화(/endings/reset) 방식
+# - sync: 요청 안에서 사용자 데이터를 모두 삭제
+# - deferred: 사용자를 삭제 대기(Users.deletedAt)로 표시하고 바로 응답, 기록은 백그라운드 워커가 나눠서 삭제
+GAME_RESET_MODE = os.getenv("GAME_RESET_MODE", "sync")
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "5000"))                        # 한 번에 삭제하는 최대 행 수 (청크마다 커밋)
+PURGE_BATCH_PAUSE_SECONDS = float(os.getenv("PURGE_BATCH_PAUSE_SECONDS", "0.05"))    # 청크 사이 대기 시간(초), WAL/복제 지연 완화
+PURGE_INTERVAL_SECONDS = float(os.getenv("PURGE_INTERVAL_SECONDS", "60"))            # 삭제 대기 사용자 확인 주기(초)
+
+# 게임 요약(/endings/summary) 캐시 (사용자의 쓰기 요청이 끝나면 무효화, 다른 워커 캐시는 이 시간(초)이 지나면 만료)
+ENDING_SUMMARY_CACHE_SECONDS = int(os.getenv("ENDING_SUMMARY_CACHE_SECONDS", "300"))
+ENDING_SUMMARY_CACHE_SIZE = int(os.getenv("ENDING_SUMMARY_CACHE_SIZE", "10000"))
+
+# 자정 배치(/cares/batch/daily-increment): PK 순서로 나눠서 처리 (청크마다 커밋, 같은 날짜는 한 번만 실행)
+DAILY_BATCH_CHUNK_SIZE = int(os.getenv("DAILY_BATCH_CHUNK_SIZE", "1000"))                 # 한 번에 갱신하는 최대 동물 수
+DAILY_BATCH_PAUSE_SECONDS = float(os.getenv("DAILY_BATCH_PAUSE_SECONDS", "0"))           # 청크 사이 대기 시간(초)
+
+# 프로세스 내 배치 스케줄러 (true면 서버 시작 시 실행, DB 전체 작업은 advisory lock을 얻은 워커 하나만 실행)
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "false").lower() == "true"
+SCHEDULER_DAILY_AT = os.getenv("SCHEDULER_DAILY_AT", "00:00")                                           # 날짜 경계 작업 실행 시각 (TIMEZONE 기준 HH:MM)
+IDEMPOTENCY_PURGE_INTERVAL_SECONDS = float(os.getenv("IDEMPOTENCY_PURGE_INTERVAL_SECONDS", "3600"))   # 만료된 Idempotency-Key 삭제 주기(초)
@@ -1,18 +1,60 @@
 # app/core/database.py
 import os
+from uuid import uuid4
+from typing import Callable
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import MetaData
 from dotenv import load_dotenv
+from app.core.config import (
+    DB_ASYNC, DB_ECHO, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE, DB_STATEMENT_TIMEOUT_MS, DB_PGBOUNCER
+)
+from app.core.pool import MeteredQueuePool, MeteredAsyncAdaptedQueuePool
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+
+def engine_options(is_async: bool = False) -> dict:
+    # 풀/엔진 설정 (app/core/config.py의 DB_* 환경 변수 기준)
+    connect_args = {}
+    if is_async and DB_PGBOUNCER:
+        # PgBouncer transaction pooling은 서버 커넥션이 트랜잭션마다 바뀌므로 prepared statement 캐시를 끄고 이름 충돌 방지
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    elif DB_STATEMENT_TIMEOUT_MS > 0 and not DB_PGBOUNCER:
+        # 커넥션 생성 시 세션 단위로 statement_timeout 지정 (PgBouncer 모드에서는 트랜잭션마다 SET LOCAL)
+        if is_async:
+            connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+
+    return {
+        "echo": DB_ECHO,
+        "poolclass": MeteredAsyncAdaptedQueuePool if is_async else MeteredQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "connect_args": connect_args
+    }
+
+
+def _set_local_statement_timeout(conn) -> None:
+    # PgBouncer 모드: 트랜잭션 시작 시 statement_timeout을 트랜잭션 범위로 지정
+    conn.exec_driver_sql(f"SET LOCAL statement_timeout = {DB_STATEMENT_TIMEOUT_MS}")
+
+
 # 동기용 엔진 생성
-engine = create_engine(DATABASE_URL, echo=True)
+engine = create_engine(DATABASE_URL, **engine_options())
 
 # 세션 생성기 (동기)
 SessionLocal = sessionmaker(
@@ -21,6 +63,27 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# 비동기용 엔진 (DB_ASYNC=true일 때만 생성, asyncpg 드라이버 사용)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or (
+    make_url(DATABASE_URL).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    if DATABASE_URL else None
+)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(is_async=True)) if DB_ASYNC else None
+
+if DB_PGBOUNCER and DB_STATEMENT_TIMEOUT_MS > 0:
+    event.listen(engine, "begin", _set_local_statement_timeout)
+    if async_engine is not None:
+        event.listen(async_engine.sync_engine, "begin", _set_local_statement_timeout)
+
+# 세션 생성기 (비동기)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+) if DB_ASYNC else None
+
 # SQLAlchemy 베이스 클래스
 Base = declarative_base()
 
@@ -33,3 +96,14 @@ def get_db():
         yield db                    # 세션을 외부에 "빌려줌"
     finally:
         db.close()                  # 사용이 끝나면 세션 닫음 (자원 해제)
+
+
+def get_stream_session_factory() -> Callable[[], Session]:
+    # 스트리밍 응답용 세션 생성 함수 (요청 세션은 응답 전송 전에 닫히므로 스트리밍 동안 쓸 세션을 따로 만듦)
+    # 테스트에서는 get_db와 함께 오버라이드해서 같은 커넥션에 묶음
+    return SessionLocal
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:   # 비동기 DB 세션 하나 생성
+        yield db                            # 요청이 끝나면 async with가 세션을 닫음
@@ -0,0 +1,79 @@
+# app/core/export.py
+# 대용량 조회 결과를 서버 사이드 커서로 읽어서 NDJSON/CSV로 스트리밍
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Iterator
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.core.exception import CustomException
+
+# 지원 형식 -> Content-Type
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8"
+}
+
+# 서버 사이드 커서에서 한 번에 가져오는 행 수 (응답 청크 단위)
+EXPORT_CHUNK_ROWS = 1000
+
+
+def validate_export_format(export_format: str) -> str:
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise CustomException(message="지원하지 않는 형식입니다. (ndjson, csv 중 선택 가능)", status=400)
+    return EXPORT_MEDIA_TYPES[export_format]
+
+
+def _to_json_value(value):
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _to_csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def stream_query(session_factory: Callable[[], Session], query, export_format: str,
+                 chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[str]:
+    # 컬럼 단위 select를 yield_per(서버 사이드 커서)로 읽어서 청크마다 직렬화 (ORM 객체/전체 목록 생성 없음)
+    # 요청 세션은 응답 전송 전에 닫히므로 스트리밍 동안 사용할 세션을 session_factory로 따로 생성 (get_stream_session_factory)
+    db = session_factory()
+    try:
+        result = db.execute(query.execution_options(yield_per=chunk_rows))
+        columns = list(result.keys())
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            for rows in result.partitions():
+                for row in rows:
+                    writer.writerow([_to_csv_value(value) for value in row])
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+        else:
+            for rows in result.partitions():
+                yield "".join(
+                    json.dumps(dict(zip(columns, map(_to_json_value, row))), ensure_ascii=False) + "\n"
+                    for row in rows
+                )
+    finally:
+        db.close()
@@ -0,0 +1,250 @@
+# app/core/idempotency.py
+# Idempotency-Key 헤더가 있는 재시도 요청에 첫 응답을 그대로 반환 (서비스 로직을 다시 실행하지 않음)
+import hashlib
+import json
+import re
+from datetime import timedelta
+from typing import Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from starlette.concurrency import run_in_threadpool
+from app.core.config import IDEMPOTENCY_TTL_SECONDS, IDEMPOTENCY_CACHE_SIZE
+from app.core.cache import TTLCache
+from app.core.database import SessionLocal
+from app.models.idempotency_key import IdempotencyKey
+
+# 재시도 시 중복 처리되면 안 되는 API (POST)
+IDEMPOTENT_PATHS = [
+    re.compile(r"^/api/v1/minigames/\d+/result$"),
+    re.compile(r"^/api/v1/events/attendance/checkin$"),
+    re.compile(r"^/api/v1/events/birthday/reward$"),
+    re.compile(r"^/api/v1/cares/action$"),
+]
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = "idempotent-replayed"
+MAX_KEY_LENGTH = 255
+
+
+class StoredResponse:
+    def __init__(self, request_hash: str, status: int, body: bytes, content_type: Optional[str]):
+        self.request_hash = request_hash
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+
+
+def claim_key(user_id: UUID, key: str, request_hash: str) -> Tuple[str, Optional[StoredResponse]]:
+    # 키 선점 후 상태 반환
+    # - ("new", None): 처음 요청이거나 만료된 키를 다시 선점함 → 처리 진행
+    # - ("done", 응답): 이미 처리 완료 → 저장된 응답 반환
+    # - ("in_progress", None): 같은 키의 첫 요청이 처리 중이거나 응답 저장 전에 중단됨
+    #   (서비스가 이미 커밋했을 수 있으므로 시간이 지나도 다시 선점하지 않음, 만료 전까지 409
+    #    서버 오류/예외로 끝난 요청만 release_key로 키를 지워 재시도 허용)
+    db = SessionLocal()
+    try:
+        stmt = pg_insert(IdempotencyKey).values(
+            userId=user_id,
+            idempotencyKey=key,
+            requestHash=request_hash,
+            createdAt=func.now(),
+            expiresAt=func.now() + timedelta(seconds=IDEMPOTENCY_TTL_SECONDS)
+        )
+        claimed = db.execute(
+            stmt.on_conflict_do_update(
+                constraint='pk_idempotency_key',
+                set_={
+                    "requestHash": stmt.excluded.requestHash,
+                    "responseStatus": None,
+                    "responseBody": None,
+                    "contentType": None,
+                    "createdAt": stmt.excluded.createdAt,
+                    "expiresAt": stmt.excluded.expiresAt
+                },
+                where=IdempotencyKey.expiresAt < func.now()
+            ).returning(IdempotencyKey.userId)
+        ).first()
+        db.commit()
+        if claimed is not None:
+            return "new", None
+
+        row = db.execute(
+            select(IdempotencyKey).where(IdempotencyKey.userId == user_id, IdempotencyKey.idempotencyKey == key)
+        ).scalar_one_or_none()
+        if row is None:
+            return "new", None
+        if row.responseStatus is None:
+            return "in_progress", None
+        return "done", StoredResponse(row.requestHash, row.responseStatus, row.responseBody, row.contentType)
+    finally:
+        db.close()
+
+
+def complete_key(user_id: UUID, key: str, response: StoredResponse) -> None:
+    # 첫 응답 저장
+    db = SessionLocal()
+    try:
+        db.query(IdempotencyKey).filter(
+            IdempotencyKey.userId == user_id,
+            IdempotencyKey.idempotencyKey == key
+        ).update({
+            "responseStatus": response.status,
+            "responseBody": response.body,
+            "contentType": response.content_type
+        }, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def release_key(user_id: UUID, key: str) -> None:
+    # 서버 오류로 끝난 요청은 키를 지워서 재시도 시 다시 처리되도록 함
+    db = SessionLocal()
+    try:
+        db.execute(delete(IdempotencyKey).where(
+            IdempotencyKey.userId == user_id,
+            IdempotencyKey.idempotencyKey == key,
+            IdempotencyKey.responseStatus.is_(None)
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def purge_expired_keys() -> int:
+    # 만료된 키 삭제 후 삭제 수 반환
+    db = SessionLocal()
+    try:
+        result = db.execute(delete(IdempotencyKey).where(IdempotencyKey.expiresAt < func.now()))
+        db.commit()
+        return result.rowcount
+    finally:
+        db.close()
+
+
+def _error_body(message: str, status: int) -> bytes:
+    # CustomException 응답과 같은 형식
+    return json.dumps({"message": message, "status": status}, ensure_ascii=False).encode("utf-8")
+
+
+class IdempotencyMiddleware:
+    # IDEMPOTENT_PATHS의 POST 요청 중 Idempotency-Key 헤더가 있는 요청만 처리
+    # - 처리 완료된 키: 프로세스 캐시 → 없으면 DB에서 저장된 응답을 찾아 그대로 반환 (Idempotent-Replayed: true)
+    # - 같은 키로 다른 요청(경로/본문)이 오면 422, 첫 요청이 처리 중이면 409
+    # - 5xx 응답이나 처리 중 예외는 저장하지 않음 (재시도 시 다시 처리)
+
+    def __init__(self, app, cache: Optional[TTLCache] = None):
+        self.app = app
+        # 완료된 응답만 저장
+        self.cache = cache if cache is not None else TTLCache(IDEMPOTENCY_CACHE_SIZE, IDEMPOTENCY_TTL_SECONDS)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not any(p.match(scope["path"]) for p in IDEMPOTENT_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope["headers"]}
+        key = headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            await self.app(scope, receive, send)
+            return
+        if len(key) > MAX_KEY_LENGTH:
+            await self._send(send, 400, _error_body(f"Idempotency-Key는 {MAX_KEY_LENGTH}자 이하여야 합니다.", 400), "application/json")
+            return
+        try:
+            user_id = UUID(headers.get("user-id", ""))
+        except ValueError:
+            # user-id 검증은 API에서 처리
+            await self.app(scope, receive, send)
+            return
+
+        body = await self._read_body(receive)
+        request_hash = hashlib.sha256(
+            b"\n".join([scope["path"].encode(), scope.get("query_string", b""), body])
+        ).hexdigest()
+        cache_key = (user_id, key)
+
+        stored = self.cache.get(cache_key)
+        if stored is None:
+            state, stored = await run_in_threadpool(claim_key, user_id, key, request_hash)
+            if state == "in_progress":
+                await self._send(send, 409, _error_body("같은 Idempotency-Key의 요청을 처리 중입니다.", 409), "application/json")
+                return
+            if state == "done":
+                self.cache.set(cache_key, stored)
+
+        if stored is not None:
+            if stored.request_hash != request_hash:
+                await self._send(send, 422, _error_body("Idempotency-Key가 다른 요청에 이미 사용되었습니다.", 422), "application/json")
+                return
+            await self._send(send, stored.status, stored.body, stored.content_type, replayed=True)
+            return
+
+        await self._process(scope, body, send, user_id, key, request_hash)
+
+    async def _process(self, scope, body: bytes, send, user_id: UUID, key: str, request_hash: str) -> None:
+        # 첫 요청 처리 (응답을 그대로 전달하면서 복사해 두었다가 저장)
+        body_sent = False
+
+        async def receive_body():
+            nonlocal body_sent
+            if body_sent:
+                return {"type": "http.disconnect"}
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        status = 500
+        content_type = None
+        chunks = []
+
+        async def send_and_capture(message):
+            nonlocal status, content_type
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for name, value in message.get("headers", []):
+                    if name.lower() == b"content-type":
+                        content_type = value.decode("latin-1")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_body, send_and_capture)
+        except Exception:
+            await run_in_threadpool(release_key, user_id, key)
+            raise
+
+        if status >= 500:
+            await run_in_threadpool(release_key, user_id, key)
+            return
+
+        stored = StoredResponse(request_hash, status, b"".join(chunks), content_type)
+        self.cache.set((user_id, key), stored)
+        try:
+            await run_in_threadpool(complete_key, user_id, key, stored)
+        except Exception as e:
+            # 응답은 이미 전송됨 (같은 워커 재시도는 캐시로 처리, 다른 워커는 키가 만료될 때까지 409)
+            print(f"Error saving idempotent response: {str(e)}")
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    async def _send(send, status: int, body: bytes, content_type: Optional[str], replayed: bool = False) -> None:
+        headers = [(b"content-length", str(len(body)).encode("latin-1"))]
+        if content_type:
+            headers.append((b"content-type", content_type.encode("latin-1")))
+        if replayed:
+            headers.append((REPLAYED_HEADER.encode("latin-1"), b"true"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,173 @@
+# app/core/idgen.py
+# MoneyTransactions.txId 생성기 (String(20) 컬럼에 맞는 고유 ID)
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import text
+from app.core.config import KST, TX_ID_GENERATOR, TX_ID_WORKER_ID, DB_PGBOUNCER
+
+# Snowflake 비트 구성: 타임스탬프(ms) 41비트 | 워커 ID 10비트 | 시퀀스 12비트 = 63비트 (최대 19자리)
+SNOWFLAKE_EPOCH_MS = 1735689600000  # 2025-01-01T00:00:00Z
+WORKER_ID_BITS = 10
+SEQUENCE_BITS = 12
+MAX_WORKER_ID = (1 << WORKER_ID_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+TX_ID_LENGTH = 19  # 0으로 채워 문자열 정렬 순서 = 생성 순서
+
+
+class SnowflakeIdGenerator:
+    # 워커(프로세스)별로 단조 증가하는 64비트 ID
+    # - 같은 ms 안에서는 시퀀스 증가, 시퀀스가 소진되면 다음 ms까지 대기
+    # - 시계가 뒤로 가면 마지막 타임스탬프를 계속 사용 (역순 ID 없음)
+    # 워커 ID가 프로세스마다 다르면 프로세스 간에도 충돌하지 않음 (default_worker_id 참고)
+
+    def __init__(self, worker_id: int):
+        if not 0 <= worker_id <= MAX_WORKER_ID:
+            raise ValueError(f"worker_id는 0~{MAX_WORKER_ID} 범위여야 합니다: {worker_id}")
+        self.worker_id = worker_id
+        self._lock = threading.Lock()
+        self._last_timestamp = -1
+        self._sequence = 0
+
+    def next_id(self) -> str:
+        return str(self.next_int()).zfill(TX_ID_LENGTH)
+
+    def next_int(self) -> int:
+        with self._lock:
+            timestamp = max(self._current_ms(), self._last_timestamp)
+
+            if timestamp == self._last_timestamp:
+                self._sequence = (self._sequence + 1) & MAX_SEQUENCE
+                if self._sequence == 0:
+                    # 같은 ms의 시퀀스 소진 -> 다음 ms까지 대기
+                    while timestamp <= self._last_timestamp:
+                        timestamp = self._current_ms()
+            else:
+                self._sequence = 0
+
+            self._last_timestamp = timestamp
+            return (
+                (timestamp << (WORKER_ID_BITS + SEQUENCE_BITS))
+                | (self.worker_id << SEQUENCE_BITS)
+                | self._sequence
+            )
+
+    @staticmethod
+    def _current_ms() -> int:
+        return time.time_ns() // 1_000_000 - SNOWFLAKE_EPOCH_MS
+
+
+class TimestampIdGenerator:
+    # 기존 방식 (KST 현재 시각의 마이크로초, 같은 마이크로초에 생성되면 충돌 가능)
+
+    def next_id(self) -> str:
+        return str(int(datetime.now(KST).timestamp() * 1000000))
+
+
+# 워커 ID 임대용 advisory lock 네임스페이스 (pg_try_advisory_lock(classid, objid)의 classid)
+WORKER_ID_LOCK_NAMESPACE = 0x5458
+
+
+class WorkerIdLease:
+    # DB 세션 advisory lock으로 0~MAX_WORKER_ID 중 다른 프로세스가 쓰지 않는 워커 ID를 임대
+    # - 잠금을 잡은 커넥션을 풀에서 분리해 프로세스가 끝날 때까지 유지 (프로세스가 끝나면 잠금도 해제)
+    # - 컨테이너마다 PID가 같아도, 서버가 여러 대여도 같은 DB를 쓰면 워커 ID가 겹치지 않음
+
+    def __init__(self):
+        self.worker_id = None
+        self._conn = None
+
+    def acquire(self) -> int:
+        from app.core.database import engine  # 생성기만 쓰는 경우(벤치마크 등) DB 설정 없이 import할 수 있도록
+
+        conn = engine.connect()
+        try:
+            start = os.getpid() % (MAX_WORKER_ID + 1)  # 동시에 시작한 프로세스가 같은 ID부터 시도하지 않도록
+            for offset in range(MAX_WORKER_ID + 1):
+                worker_id = (start + offset) % (MAX_WORKER_ID + 1)
+                acquired = conn.execute(
+                    text("SELECT pg_try_advisory_lock(:namespace, :worker_id)"),
+                    {"namespace": WORKER_ID_LOCK_NAMESPACE, "worker_id": worker_id}
+                ).scalar()
+                conn.commit()
+                if acquired:
+                    conn.detach()
+                    self._conn = conn
+                    self.worker_id = worker_id
+                    return worker_id
+        except Exception:
+            conn.invalidate()
+            raise
+        finally:
+            if self._conn is None:
+                conn.close()
+        raise RuntimeError(f"사용 가능한 거래 ID 워커 ID가 없습니다. (최대 {MAX_WORKER_ID + 1}개 프로세스)")
+
+    def release(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self.worker_id = None
+
+
+# 현재 프로세스의 워커 ID 임대 (TX_ID_WORKER_ID를 지정하면 사용하지 않음)
+_worker_id_lease: Optional[WorkerIdLease] = None
+
+
+def default_worker_id() -> int:
+    # TX_ID_WORKER_ID가 있으면 그 값, 없으면 DB에서 비어 있는 워커 ID를 임대
+    # PgBouncer(transaction pooling)에서는 세션 잠금을 유지할 수 없으므로 TX_ID_WORKER_ID 필수
+    global _worker_id_lease
+    if TX_ID_WORKER_ID is not None:
+        return TX_ID_WORKER_ID
+    if DB_PGBOUNCER:
+        raise RuntimeError("DB_PGBOUNCER=true이면 프로세스마다 다른 TX_ID_WORKER_ID(0~1023)를 지정해야 합니다.")
+    if _worker_id_lease is None:
+        lease = WorkerIdLease()
+        lease.acquire()
+        _worker_id_lease = lease
+    return _worker_id_lease.worker_id
+
+
+def create_tx_id_generator(kind: str = TX_ID_GENERATOR):
+    if kind == "snowflake":
+        return SnowflakeIdGenerator(default_worker_id())
+    if kind == "timestamp":
+        return TimestampIdGenerator()
+    raise ValueError(f"지원하지 않는 TX_ID_GENERATOR입니다: {kind}")
+
+
+# 프로세스 전역 생성기 (처음 사용할 때 생성, 서버 시작 시 get_tx_id_generator()로 미리 생성해서 설정 오류를 바로 확인)
+_tx_id_generator = None
+_generator_lock = threading.Lock()
+# fork 전 부모 프로세스가 임대한 워커 ID (자식에서 닫으면 부모 커넥션이 끊기므로 참조만 유지)
+_inherited_leases = []
+
+
+def get_tx_id_generator():
+    global _tx_id_generator
+    if _tx_id_generator is None:
+        with _generator_lock:
+            if _tx_id_generator is None:
+                _tx_id_generator = create_tx_id_generator()
+    return _tx_id_generator
+
+
+def _reset_after_fork() -> None:
+    # fork된 워커 프로세스는 부모와 다른 워커 ID/시퀀스 상태로 다시 생성
+    global _tx_id_generator, _worker_id_lease, _generator_lock
+    if _worker_id_lease is not None:
+        _inherited_leases.append(_worker_id_lease)
+    _tx_id_generator = None
+    _worker_id_lease = None
+    _generator_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def next_tx_id() -> str:
+    return get_tx_id_generator().next_id()
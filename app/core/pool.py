@@ -0,0 +1,87 @@
+# app/core/pool.py
+# 커넥션 풀 대기 시간 측정 및 풀 상태 조회
+import threading
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from app.core.config import DB_MAX_OVERFLOW
+
+
+class PoolWaitStats:
+    # 커넥션 체크아웃 대기 시간 누적 통계 (오버플로 커넥션 생성 시간 포함)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avgWaitMs": round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                "maxWaitMs": round(self.max_wait * 1000, 3)
+            }
+
+
+class _MeteredPoolMixin:
+    # QueuePool의 커넥션 획득(_do_get) 시간을 측정
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+class MeteredQueuePool(_MeteredPoolMixin, QueuePool):
+    pass
+
+
+class MeteredAsyncAdaptedQueuePool(_MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(engine) -> dict | None:
+    # 엔진 풀 상태 (사용 중 커넥션 수, 오버플로 수, 대기 시간)
+    if engine is None:
+        return None
+
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+
+    status = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checkedIn": pool.checkedin(),
+        "checkedOut": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "maxOverflow": DB_MAX_OVERFLOW,
+        "timeout": pool.timeout()
+    }
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        status.update(wait_stats.as_dict())
+    return status
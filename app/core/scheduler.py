@@ -0,0 +1,213 @@
+# app/core/scheduler.py
+# 프로세스 내 배치 작업 스케줄러 (TIMEZONE 기준 매일 정해진 시각 또는 일정 간격으로 실행)
+import asyncio
+import threading
+import time
+import traceback
+import zlib
+from datetime import datetime, timedelta, time as dt_time
+from typing import Callable, Dict, List, Optional
+from sqlalchemy import text
+from app.core.config import KST, DB_PGBOUNCER
+from app.core.database import engine
+
+# 스케줄러 작업 advisory lock 네임스페이스 (pg_try_advisory_lock(classid, objid)의 classid)
+ADVISORY_LOCK_NAMESPACE = 0x4E5347
+
+
+def advisory_lock_key(name: str) -> int:
+    # 작업 이름 -> 프로세스/서버가 달라도 같은 32비트 정수
+    key = zlib.crc32(name.encode("utf-8"))
+    return key - (1 << 32) if key >= (1 << 31) else key
+
+
+class LeaderLock:
+    # Postgres advisory lock으로 작업 실행 리더 선출 (잠금을 얻은 워커만 실행, 못 얻으면 건너뜀)
+    # - 기본: 세션 단위 잠금을 얻고 작업이 끝나면 해제
+    # - DB_PGBOUNCER: 트랜잭션 풀링에서는 세션 잠금이 다른 클라이언트 커넥션에 남을 수 있으므로
+    #   트랜잭션 단위 잠금을 얻고 작업이 끝날 때까지 트랜잭션을 열어 둠 (커밋하면 해제)
+
+    def __init__(self, name: str, transactional: bool = DB_PGBOUNCER):
+        self.params = {"namespace": ADVISORY_LOCK_NAMESPACE, "key": advisory_lock_key(name)}
+        self.transactional = transactional
+        self._conn = None
+
+    def acquire(self) -> bool:
+        self._conn = engine.connect()
+        try:
+            if self.transactional:
+                acquired = self._conn.execute(text("SELECT pg_try_advisory_xact_lock(:namespace, :key)"), self.params).scalar()
+            else:
+                acquired = self._conn.execute(text("SELECT pg_try_advisory_lock(:namespace, :key)"), self.params).scalar()
+                self._conn.commit()
+        except Exception:
+            self._discard()
+            raise
+        if not acquired:
+            self._conn.close()
+            self._conn = None
+        return bool(acquired)
+
+    def release(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            if not self.transactional:
+                self._conn.execute(text("SELECT pg_advisory_unlock(:namespace, :key)"), self.params)
+            self._conn.commit()
+        except Exception:
+            self._discard()
+            raise
+        self._conn.close()
+        self._conn = None
+
+    def _discard(self) -> None:
+        # 잠금 해제에 실패한 커넥션은 풀에 돌려보내지 않고 닫아서 잠금도 함께 해제
+        self._conn.invalidate()
+        self._conn.close()
+        self._conn = None
+
+
+class ScheduledJob:
+    # 스케줄러에 등록하는 작업
+    # - func: 인자 없이 실행, 처리한 행 수(없으면 None) 반환, 스레드에서 실행되므로 동기 DB 세션 사용 가능
+    # - daily_at: TIMEZONE 기준 매일 실행 시각 ("HH:MM"), interval_seconds: 실행 간격(초) 중 하나 지정
+    # - leader: True면 advisory lock을 얻은 워커 하나만 실행 (DB 전체 작업), False면 워커마다 실행 (프로세스 메모리 작업)
+    #   잠금은 동시 실행만 막으므로 조금 늦게 깨어난 워커가 같은 작업을 다시 실행해도 결과가 같아야 함
+
+    def __init__(self, name: str, func: Callable[[], Optional[int]], daily_at: Optional[str] = None,
+                 interval_seconds: Optional[float] = None, leader: bool = True):
+        if (daily_at is None) == (interval_seconds is None):
+            raise ValueError(f"{name}: daily_at과 interval_seconds 중 하나만 지정하세요.")
+        self.name = name
+        self.func = func
+        self.daily_at = dt_time.fromisoformat(daily_at) if daily_at is not None else None
+        self.interval_seconds = max(1.0, float(interval_seconds)) if interval_seconds is not None else None
+        self.leader = leader
+        self.next_run_at: Optional[datetime] = None
+        self.metrics = {
+            "runs": 0,
+            "failures": 0,
+            "skipped": 0,              # 다른 워커가 실행 중이라 건너뛴 횟수
+            "totalRows": 0,
+            "lastStartedAt": None,
+            "lastStatus": None,        # success / failed / skipped
+            "lastDurationSeconds": None,
+            "lastRows": None,
+            "lastError": None
+        }
+        self._lock = threading.Lock()
+
+    def next_run(self, now: datetime) -> datetime:
+        # now 이후 다음 실행 시각 (TIMEZONE 기준)
+        if self.interval_seconds is not None:
+            return now + timedelta(seconds=self.interval_seconds)
+        day = now.date()
+        while True:
+            run_at = KST.localize(datetime.combine(day, self.daily_at))
+            if run_at > now:
+                return run_at
+            day += timedelta(days=1)
+
+    def run(self) -> dict:
+        # 작업 1회 실행 (리더 작업은 잠금을 얻은 경우에만) 후 결과 기록
+        if not self._lock.acquire(blocking=False):
+            return self._record("skipped", 0.0)
+        try:
+            lock = LeaderLock(self.name) if self.leader else None
+            started = time.perf_counter()
+            self.metrics["lastStartedAt"] = datetime.now(KST).isoformat()
+            try:
+                if lock is not None and not lock.acquire():
+                    return self._record("skipped", 0.0)
+                try:
+                    rows = self.func()
+                finally:
+                    if lock is not None:
+                        lock.release()
+            except Exception as e:
+                traceback.print_exc()
+                return self._record("failed", time.perf_counter() - started, error=str(e))
+            return self._record("success", time.perf_counter() - started, rows)
+        finally:
+            self._lock.release()
+
+    def status(self) -> dict:
+        return {
+            "name": self.name,
+            "schedule": self.daily_at.strftime("%H:%M") if self.daily_at is not None else f"every {self.interval_seconds:g}s",
+            "leader": self.leader,
+            "nextRunAt": self.next_run_at.isoformat() if self.next_run_at else None,
+            **self.metrics
+        }
+
+    def _record(self, status: str, seconds: float, rows: Optional[int] = None, error: Optional[str] = None) -> dict:
+        metrics = self.metrics
+        metrics["lastStatus"] = status
+        if status == "skipped":
+            metrics["skipped"] += 1
+            return self.status()
+
+        metrics["runs"] += 1
+        metrics["lastDurationSeconds"] = round(seconds, 3)
+        metrics["lastRows"] = rows
+        metrics["lastError"] = error
+        if status == "failed":
+            metrics["failures"] += 1
+        elif rows:
+            metrics["totalRows"] += rows
+        print(f"Scheduled job {self.name}: {status} in {seconds:.3f}s (rows={rows})")
+        return self.status()
+
+
+class Scheduler:
+    # 등록된 작업마다 asyncio 태스크를 만들어 다음 실행 시각까지 대기 후 스레드에서 실행
+    # (작업이 길어도 이벤트 루프와 다른 작업을 막지 않음, 이전 실행이 끝나기 전에는 같은 작업을 다시 실행하지 않음)
+
+    def __init__(self):
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def add_job(self, job: ScheduledJob) -> ScheduledJob:
+        if job.name in self.jobs:
+            raise ValueError(f"이미 등록된 작업입니다: {job.name}")
+        self.jobs[job.name] = job
+        return job
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        # 실행 중인 이벤트 루프에서 호출 (FastAPI startup)
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._run(job), name=f"scheduler-{job.name}") for job in self.jobs.values()]
+
+    async def stop(self) -> None:
+        # 대기 중인 작업 취소 (실행 중인 작업 스레드는 끝까지 실행, 청크 작업은 다음 실행 때 이어서 처리)
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_now(self, name: str) -> dict:
+        job = self.jobs.get(name)
+        if job is None:
+            raise KeyError(name)
+        return await asyncio.to_thread(job.run)
+
+    def status(self) -> List[dict]:
+        return [job.status() for job in self.jobs.values()]
+
+    async def _run(self, job: ScheduledJob) -> None:
+        while True:
+            job.next_run_at = job.next_run(datetime.now(KST))
+            delay = (job.next_run_at - datetime.now(KST)).total_seconds()
+            await asyncio.sleep(max(0.0, delay))
+            await asyncio.to_thread(job.run)
+
+
+# 프로세스 전역 스케줄러 (SCHEDULER_ENABLED=true일 때 서버 시작 시 실행)
+scheduler = Scheduler()
@@ -5,16 +5,27 @@ from fastapi.exceptions import RequestValidationError
 import threading
 import time
 import requests
-from app.core.database import Base, engine
+from app.core.database import Base, engine, async_engine
 from create_tables import insert_initial_data
+from app.core.catalog import catalog
+from app.core.config import DB_ASYNC, GAME_RESET_MODE, SCHEDULER_ENABLED, SCHEDULER_DAILY_AT, IDEMPOTENCY_PURGE_INTERVAL_SECONDS
+from app.core.idempotency import IdempotencyMiddleware, purge_expired_keys
+from app.core.cache import UserCacheInvalidationMiddleware
+from app.core.idgen import get_tx_id_generator
+from app.core.scheduler import scheduler, ScheduledJob
+from app.api.minigame.quota import minigame_quota, rollover_minigame_quota
+from app.api.ending.purge import purge_worker
+from app.api.care.service import daily_increment_job, purge_care_daily_counts_job
+from app.api.event.service import load_birthday_calendar_job
 
 # 라우터
-from app.api.care.controller import router as care_router
-from app.api.pet.controller import router as pet_router
-from app.api.user.controller import router as user_router
-from app.api.ending.controller import router as ending_router
-from app.api.event.controller import router as event_router
-from app.api.minigame.controller import router as minigames_router
+from app.api.care.controller import router as care_router, async_router as care_async_router
+from app.api.pet.controller import router as pet_router, async_router as pet_async_router
+from app.api.user.controller import router as user_router, async_router as user_async_router
+from app.api.ending.controller import router as ending_router, async_router as ending_async_router
+from app.api.event.controller import router as event_router, async_router as event_async_router
+from app.api.minigame.controller import router as minigames_router, async_router as minigames_async_router
+from app.api.admin.controller import router as admin_router
 
 # 예외 핸들러
 from app.core.exception import (
@@ -26,6 +37,12 @@ from app.core.exception import (
 
 app = FastAPI()
 
+# 쓰기 요청이 끝나면 해당 사용자의 메모리 캐시(게임 요약 등) 무효화
+app.add_middleware(UserCacheInvalidationMiddleware)
+
+# Idempotency-Key 재시도 응답 재사용 (CORS보다 안쪽에 두어 재사용 응답에도 CORS 헤더 적용)
+app.add_middleware(IdempotencyMiddleware)
+
 # CORS 설정 (개발 중 전체 허용)
 app.add_middleware(
     CORSMiddleware,
@@ -40,6 +57,15 @@ app.add_exception_handler(CustomException, custom_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
+# 비동기 세션 라우터 등록 (DB_ASYNC=true일 때, 같은 경로의 동기 라우트보다 먼저 매칭되도록 먼저 등록)
+if DB_ASYNC:
+    app.include_router(care_async_router)
+    app.include_router(pet_async_router)
+    app.include_router(user_async_router)
+    app.include_router(event_async_router)
+    app.include_router(ending_async_router)
+    app.include_router(minigames_async_router)
+
 # 라우터 등록
 app.include_router(care_router)
 app.include_router(pet_router)
@@ -47,6 +73,16 @@ app.include_router(user_router)
 app.include_router(event_router)
 app.include_router(ending_router)
 app.include_router(minigames_router)
+app.include_router(admin_router)
+
+# 배치 작업 등록 (SCHEDULER_ENABLED=true면 서버 시작 시 실행, GET /api/v1/admin/scheduler/jobs에서 실행 결과 확인)
+# - DB 전체 작업(leader=True)은 advisory lock을 얻은 워커 하나만 실행
+# - 프로세스 메모리 작업(leader=False)은 워커마다 실행
+scheduler.add_job(ScheduledJob("daily_increment_days_since_care", daily_increment_job, daily_at=SCHEDULER_DAILY_AT))
+scheduler.add_job(ScheduledJob("care_daily_count_purge", purge_care_daily_counts_job, daily_at=SCHEDULER_DAILY_AT))
+scheduler.add_job(ScheduledJob("idempotency_key_purge", purge_expired_keys, interval_seconds=IDEMPOTENCY_PURGE_INTERVAL_SECONDS))
+scheduler.add_job(ScheduledJob("minigame_quota_rollover", rollover_minigame_quota, daily_at=SCHEDULER_DAILY_AT, leader=False))
+scheduler.add_job(ScheduledJob("birthday_calendar_load", load_birthday_calendar_job, daily_at=SCHEDULER_DAILY_AT, leader=False))
 
 # 서버가 실행되면 자동으로 "http://localhost:8000/api/v1/users/start"로 post를 보내서 유저 자동 생성
 # def call_start_api_after_server_ready():
@@ -62,4 +98,19 @@ app.include_router(minigames_router)
 def on_startup():
     Base.metadata.create_all(bind=engine)                               # 테이블 자동 생성(python create_tables.py 와 동일)
     insert_initial_data()                                               # 초기 데이터 삽입
-    # threading.Thread(target=call_start_api_after_server_ready).start()  # call_start_api_after_server_ready() 함수 호출을 통해 유저 생성
\ No newline at end of file
+    catalog.refresh()                                                   # 기준 테이블 캐시 및 케어 ML 입력 인코딩 테이블 로드
+    get_tx_id_generator()                                               # 거래 ID 워커 ID 임대 (설정 오류/임대 실패 시 서버 시작 중단)
+    if GAME_RESET_MODE == "deferred":
+        purge_worker.start()                                            # 게임 초기화로 삭제 대기 중인 사용자 데이터 삭제
+    if SCHEDULER_ENABLED:
+        scheduler.start()                                               # 자정 배치 등 등록된 작업을 정해진 시각에 실행
+    # threading.Thread(target=call_start_api_after_server_ready).start()  # call_start_api_after_server_ready() 함수 호출을 통해 유저 생성
+
+@app.on_event("shutdown") # 서버 종료시
+async def on_shutdown():
+    await scheduler.stop()                                              # 대기 중인 배치 작업 취소 (자정 배치는 다음 실행 때 이어서 처리)
+    purge_worker.stop()                                                 # 백그라운드 삭제 중지 (청크마다 커밋하므로 남은 데이터는 다음 실행 때 이어서 삭제)
+    if minigame_quota is not None:
+        minigame_quota.flush()                                          # 아직 반영되지 않은 미니게임 플레이 횟수 반영
+    if async_engine is not None:
+        await async_engine.dispose()                                    # 비동기 엔진 커넥션 풀 정리
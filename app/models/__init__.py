@@ -1,6 +1,6 @@
 from .user import User
 from .animal import Animal
-from .attendance import AttendanceReward, AttendanceLog
+from .attendance import AttendanceReward, AttendanceLog, AttendanceSummary
 from .action import Action
 from .category import Category
 from .action_log import ActionLog
@@ -8,4 +8,9 @@ from .emotionmessages import EmotionMessage
 from .minigames import Minigame
 from .userminigameplays import UserMinigamePlay
 from .minigameattempts import MinigameAttempt
+from .care_daily_count import CareDailyCount
+from .ledger_snapshot import LedgerSnapshot
+from .minigame_leaderboard import MinigameLeaderboard
+from .idempotency_key import IdempotencyKey
+from .batch_job_run import BatchJobRun
 # __init__.py로 인해 models 외부(create_table.py)에서 from models.animal.animalModel import Animal 가 아닌 from models import Animal와 같이 접근 가능
\ No newline at end of file
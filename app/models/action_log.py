@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
 
@@ -15,4 +15,8 @@ class ActionLog(Base):
     actualDelta = Column(Numeric(6, 2), nullable=False)
     userPatternBias = Column(Numeric(5, 4), nullable=False)
     daysSinceLastCare = Column(Integer, nullable=False)
-    performedAt = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
\ No newline at end of file
+    performedAt = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('ix_care_logs_user_animal_performed_at', 'userId', 'animalId', 'performedAt'),
+    )
\ No newline at end of file
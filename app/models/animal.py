@@ -1,7 +1,9 @@
-from sqlalchemy import Column, Integer, String, Boolean, Numeric, Date, ForeignKey, text, PrimaryKeyConstraint
+from sqlalchemy import Column, Integer, SmallInteger, String, Boolean, Numeric, Date, DateTime, ForeignKey, Computed, Index, text, PrimaryKeyConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
 
+BIRTHDAY_KEY_SQL = 'CAST(EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday) AS SMALLINT)'
+
 class Animal(Base):
     __tablename__ = "Animals"
 
@@ -14,9 +16,13 @@ class Animal(Base):
     evolutionStage = Column(Integer, nullable=False, server_default=text("1"))
     currentEmotion = Column(Numeric(5, 2), nullable=False, server_default=text("50.00"))
     birthday = Column(Date, nullable=False)
+    # 생일 월일 키 (MMDD, 예: 4월 19일 -> 419), 연도와 무관하게 오늘 생일인 동물을 인덱스로 조회
+    birthdayKey = Column(SmallInteger, Computed(BIRTHDAY_KEY_SQL, persisted=True), nullable=False)
     userPatternBias = Column(Numeric(3, 2), nullable=False, server_default=text("0.33"))
     daySinceLastCare = Column(Integer, nullable=False, server_default=text("0"))
+    lastCaredAt = Column(DateTime(timezone=True), nullable=True)  # 마지막 케어 시각 (케어 시 함께 갱신)
 
     __table_args__ = ( # 복합 PK 설정
         PrimaryKeyConstraint('animalId', 'userId', name='pk_animal_user'),
+        Index('ix_animals_birthday_key_user', 'birthdayKey', 'userId'),   # 사용자별 생일 조회 + 하루 한 번 오늘 생일 목록 적재
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Date, TIMESTAMP, ForeignKey, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
 
@@ -17,3 +17,20 @@ class AttendanceLog(Base):
     date = Column(Date, nullable=False)
     userId = Column(UUID(as_uuid=True), nullable=False, index=True)
     attendanceRewardId = Column(Integer, ForeignKey("AttendanceRewards.attendanceRewardId"), nullable=False)
+
+    __table_args__ = (
+        Index('ix_attendance_logs_user_date', 'userId', 'date'),
+    )
+
+
+# 사용자별 출석 요약 (출석 로그 전체 조회 대신 출석 체크 시 함께 갱신)
+class AttendanceSummary(Base):
+    __tablename__ = "AttendanceSummaries"
+
+    userId = Column(UUID(as_uuid=True), ForeignKey("Users.userId"), primary_key=True)
+    totalCount = Column(Integer, nullable=False, server_default=text("0"))          # 출석 로그 수 (출석판 순서 계산)
+    attendanceDays = Column(Integer, nullable=False, server_default=text("0"))      # 출석한 고유 날짜 수
+    lastDate = Column(Date, nullable=True)                                          # 마지막 출석 날짜
+    currentStreak = Column(Integer, nullable=False, server_default=text("0"))       # lastDate까지 연속 출석일
+    rewardMask = Column(BigInteger, nullable=False, server_default=text("0"))       # 받은 출석 보상 ID 비트마스크 (ID n -> 1 << (n - 1))
+    updatedAt = Column(TIMESTAMP, nullable=False, server_default=func.now())
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, Date, BigInteger, TIMESTAMP, PrimaryKeyConstraint, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.database import Base
+
+# 일 단위 배치 작업 실행 기록 (작업/날짜별 한 행, 중단되면 cursor부터 이어서 실행, 완료된 날짜는 다시 실행하지 않음)
+class BatchJobRun(Base):
+    __tablename__ = "BatchJobRuns"
+
+    jobName = Column(String(50), nullable=False)
+    runDate = Column(Date, nullable=False)                                         # 작업 기준 날짜 (TIMEZONE 기준)
+    status = Column(String(20), nullable=False, server_default=text("'running'"))  # running / completed / failed
+    cursor = Column(JSONB, nullable=True)                                          # 마지막으로 처리한 PK (다음 청크 시작점)
+    rowsProcessed = Column(BigInteger, nullable=False, server_default=text("0"))
+    chunkCount = Column(BigInteger, nullable=False, server_default=text("0"))
+    startedAt = Column(TIMESTAMP, nullable=False, server_default=func.now())
+    updatedAt = Column(TIMESTAMP, nullable=False, server_default=func.now())
+    finishedAt = Column(TIMESTAMP, nullable=True)
+
+    __table_args__ = (
+        PrimaryKeyConstraint('jobName', 'runDate', name='pk_batch_job_run'),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from app.core.database import Base
 
@@ -10,3 +10,7 @@ class BirthdayReward(Base):
     userId = Column(UUID(as_uuid=True), nullable=False)
     animalId = Column(Integer, nullable=False)
 
+    __table_args__ = (
+        Index('ix_birthday_rewards_user_animal_date', 'userId', 'animalId', 'date'),
+    )
+
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, Date, ForeignKey, PrimaryKeyConstraint, text
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+# 사용자/동물/카테고리별 일일 케어 횟수 (CareLogs 집계 대신 케어 시 함께 갱신)
+class CareDailyCount(Base):
+    __tablename__ = "CareDailyCounts"
+
+    userId = Column(UUID(as_uuid=True), ForeignKey("Users.userId"), nullable=False)
+    animalId = Column(Integer, nullable=False)
+    categoryId = Column(Integer, ForeignKey("Categories.categoryId"), nullable=False)
+    date = Column(Date, nullable=False)
+    count = Column(Integer, nullable=False, server_default=text("0"))
+
+    __table_args__ = ( # 복합 PK 설정
+        PrimaryKeyConstraint('userId', 'animalId', 'categoryId', 'date', name='pk_care_daily_count'),
+    )
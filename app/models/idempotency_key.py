@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, LargeBinary, TIMESTAMP, PrimaryKeyConstraint, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+# Idempotency-Key 헤더로 처리한 첫 응답 (같은 키로 재시도하면 저장된 응답을 그대로 반환)
+class IdempotencyKey(Base):
+    __tablename__ = "IdempotencyKeys"
+
+    userId = Column(UUID(as_uuid=True), nullable=False)         # 탈퇴/초기화 후에도 만료 전까지 유지되도록 FK 없음
+    idempotencyKey = Column(String(255), nullable=False)
+    requestHash = Column(String(64), nullable=False)            # 메서드/경로/본문 해시 (같은 키로 다른 요청을 보내면 거부)
+    responseStatus = Column(Integer, nullable=True)             # NULL이면 첫 요청 처리 중
+    responseBody = Column(LargeBinary, nullable=True)
+    contentType = Column(String(100), nullable=True)
+    createdAt = Column(TIMESTAMP, nullable=False, server_default=func.now())
+    expiresAt = Column(TIMESTAMP, nullable=False)
+
+    __table_args__ = ( # 복합 PK 설정
+        PrimaryKeyConstraint('userId', 'idempotencyKey', name='pk_idempotency_key'),
+        Index('ix_idempotency_keys_expires_at', 'expiresAt'),
+    )
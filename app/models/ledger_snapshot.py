@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, BigInteger, String, TIMESTAMP, Enum, ForeignKey, PrimaryKeyConstraint, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+from app.models.moneyTransaction import TransactionDirection
+
+# 사용자/출처/방향별 거래 누적 합계 (MoneyTransactions 집계 대신 거래 생성 시 함께 갱신)
+class LedgerSnapshot(Base):
+    __tablename__ = "LedgerSnapshots"
+
+    userId = Column(UUID(as_uuid=True), ForeignKey("Users.userId"), nullable=False)
+    source = Column(String(20), nullable=False)
+    direction = Column(Enum(TransactionDirection), nullable=False)
+    totalAmount = Column(BigInteger, nullable=False, server_default=text("0"))
+    txCount = Column(Integer, nullable=False, server_default=text("0"))
+    lastTxAt = Column(TIMESTAMP, nullable=True)
+    updatedAt = Column(TIMESTAMP, nullable=False, server_default=func.now())
+
+    __table_args__ = ( # 복합 PK 설정
+        PrimaryKeyConstraint('userId', 'source', 'direction', name='pk_ledger_snapshot'),
+    )
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, Date, TIMESTAMP, ForeignKey, PrimaryKeyConstraint, Index, func, text
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import date
+from app.core.database import Base
+
+# 리더보드 기간 종류와 전체 기간(all)의 periodStart 고정값
+LEADERBOARD_PERIODS = ("daily", "weekly", "all")
+ALL_TIME_PERIOD_START = date(1970, 1, 1)
+
+# 게임/기간(daily, weekly, all)별 사용자 최고 점수 (MinigameAttempts 정렬 대신 결과 저장 시 함께 갱신)
+class MinigameLeaderboard(Base):
+    __tablename__ = "MinigameLeaderboards"
+
+    minigameId = Column(Integer, ForeignKey("Minigames.minigameId"), nullable=False)
+    period = Column(String(10), nullable=False)
+    periodStart = Column(Date, nullable=False)      # daily: 해당 날짜, weekly: 주 시작(월요일), all: 1970-01-01
+    userId = Column(UUID(as_uuid=True), ForeignKey("Users.userId"), nullable=False)
+    bestScore = Column(Integer, nullable=False)
+    timeSpent = Column(Integer, nullable=True)      # 최고 점수 기록의 플레이 시간
+    achievedAt = Column(TIMESTAMP, nullable=False)  # 최고 점수 달성 시각 (동점이면 먼저 달성한 순)
+    attemptCount = Column(Integer, nullable=False, server_default=text("0"))
+    updatedAt = Column(TIMESTAMP, nullable=False, server_default=func.now())
+
+    __table_args__ = ( # 복합 PK 설정
+        PrimaryKeyConstraint('minigameId', 'period', 'periodStart', 'userId', name='pk_minigame_leaderboard'),
+        Index('ix_minigame_leaderboards_user', 'userId', 'minigameId', 'period', 'periodStart'),  # 게임 초기화 시 사용자 기록 삭제
+    )
+
+# 기간별 상위 K명 조회 (bestScore 내림차순, 동점이면 먼저 달성한 순) 및 점수별 인원 집계용
+Index(
+    'ix_minigame_leaderboards_board_score',
+    MinigameLeaderboard.minigameId,
+    MinigameLeaderboard.period,
+    MinigameLeaderboard.periodStart,
+    MinigameLeaderboard.bestScore.desc(),
+    MinigameLeaderboard.achievedAt
+)
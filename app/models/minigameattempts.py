@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, TIMESTAMP, Boolean, ForeignKey, func, text
+from sqlalchemy import Column, Integer, TIMESTAMP, Boolean, ForeignKey, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -13,4 +13,8 @@ class MinigameAttempt(Base):
     timeSpent = Column(Integer)
     money = Column(Integer)
     minigameId = Column(Integer, ForeignKey("Minigames.minigameId"), nullable=False)
-    userId = Column(UUID(as_uuid=True), ForeignKey("Users.userId"), nullable=False)
\ No newline at end of file
+    userId = Column(UUID(as_uuid=True), ForeignKey("Users.userId"), nullable=False)
+
+    __table_args__ = (
+        Index('ix_minigame_attempts_user_attempt', 'userId', 'minigameAttemptId'),  # 사용자별 기록 조회 / 초기화 시 나눠서 삭제
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, Enum, ForeignKey, func
+from sqlalchemy import Column, Integer, String, TIMESTAMP, Enum, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 import enum
 
@@ -18,3 +18,8 @@ class MoneyTransaction(Base):
     createdAt = Column(TIMESTAMP, nullable=False, server_default=func.now())
     currentMoney = Column(Integer, nullable=False)
     userId = Column(UUID(as_uuid=True), ForeignKey("Users.userId"), nullable=False)
+
+    __table_args__ = (
+        Index('ix_money_transactions_user_direction', 'userId', 'direction'),
+        Index('ix_money_transactions_user_created_tx', 'userId', 'createdAt', 'txId'),  # 거래 내역 keyset 페이지네이션
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, TIMESTAMP, func, text
+from sqlalchemy import Column, Integer, TIMESTAMP, Index, and_, func, text
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
@@ -10,3 +10,18 @@ class User(Base):
     userId = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False, index=True)
     createdAt = Column(TIMESTAMP, nullable=False, server_default=func.now())
     money = Column(Integer, nullable=False, server_default=text("0"))
+    deletedAt = Column(TIMESTAMP, nullable=True)  # 게임 초기화(지연 삭제) 요청 시각, 값이 있으면 삭제 대기 중인 사용자
+
+    __table_args__ = (
+        Index('ix_users_deleted_at', 'deletedAt', postgresql_where=text('"deletedAt" IS NOT NULL')),  # 삭제 대기 사용자 조회
+    )
+
+    @classmethod
+    def active(cls, user_id):
+        # 삭제 대기 중이 아닌 사용자 조건 (사용자 존재/잔액 조회와 잔액 갱신은 모두 이 조건 사용)
+        return and_(cls.userId == user_id, cls.deletedAt.is_(None))
+
+    @classmethod
+    def active_in(cls, user_ids):
+        # 여러 사용자 중 삭제 대기 중이 아닌 사용자 조건 (active의 일괄 조회용)
+        return and_(cls.userId.in_(list(user_ids)), cls.deletedAt.is_(None))
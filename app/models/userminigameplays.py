@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Date, ForeignKey, func, text, CheckConstraint
+from sqlalchemy import Column, Integer, Date, ForeignKey, func, text, CheckConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -14,4 +14,6 @@ class UserMinigamePlay(Base):
     
     __table_args__ = (
         CheckConstraint('"playCount" >= 0', name='check_play_count_non_negative'),
+        # 유저/게임/날짜당 한 행만 허용 (reserve_daily_play의 ON CONFLICT 대상)
+        Index('uq_user_minigame_plays_user_game_date', 'userId', 'minigameId', 'playDate', unique=True),
     )
\ No newline at end of file
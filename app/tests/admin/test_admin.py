@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from fastapi.testclient import TestClient
+from app.core.catalog import catalog
+from app.models.action import Action
+
+ADMIN_TOKEN = "test-admin-token"
+ADMIN_HEADERS = {"X-Admin-Token": ADMIN_TOKEN}
+
+# 관리자 API는 ADMIN_TOKEN이 없으면 거절되므로 테스트용 토큰 설정
+@pytest.fixture(autouse=True)
+def admin_token(monkeypatch):
+    monkeypatch.setattr("app.api.admin.controller.ADMIN_TOKEN", ADMIN_TOKEN)
+
+# 기준 테이블 캐시 새로고침 테스트(/admin/catalog/refresh)
+def test_refresh_catalog(client: TestClient, db_session):
+    before_version = catalog.version
+
+    response = client.post("/api/v1/admin/catalog/refresh", headers=ADMIN_HEADERS)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == 200
+    assert data["version"] == before_version + 1
+
+    # 캐시에 올라간 액션이 DB와 동일한지 확인
+    action = db_session.query(Action).order_by(Action.actionId).first()
+    cached = catalog.get_action(action.actionId)
+    assert cached is not None
+    assert cached.name == action.name
+    assert cached.price == action.price
+
+# X-Admin-Token 헤더가 일치하는 요청만 허용, ADMIN_TOKEN이 없으면 모두 거절
+def test_admin_token_required(client: TestClient, monkeypatch):
+    assert client.get("/api/v1/admin/db/pool").status_code == 401
+    assert client.get("/api/v1/admin/db/pool", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert client.get("/api/v1/admin/db/pool", headers=ADMIN_HEADERS).status_code == 200
+
+    monkeypatch.setattr("app.api.admin.controller.ADMIN_TOKEN", "")
+    assert client.get("/api/v1/admin/db/pool", headers=ADMIN_HEADERS).status_code == 403
+
+# DB 커넥션 풀 상태 조회 테스트(/admin/db/pool)
+def test_get_db_pool_status(client: TestClient):
+    response = client.get("/api/v1/admin/db/pool", headers=ADMIN_HEADERS)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == 200
+
+    sync_pool = data["sync"]
+    assert sync_pool["size"] >= 1
+    assert sync_pool["checkedOut"] >= 0
+    assert sync_pool["overflow"] >= 0
+    assert sync_pool["checkouts"] >= 1
+    assert sync_pool["avgWaitMs"] >= 0
+
+# 편애도 일괄 재분배 테스트(/admin/care/pattern-bias/rebalance)
+def test_rebalance_pattern_biases(client: TestClient, db_session):
+    from app.models.animal import Animal
+
+    user_id = client.post("/api/v1/users/start").json()["userId"]
+    client.post(
+        "/api/v1/pets/nickname",
+        json={"animals": [{"animalId": 1, "name": "시바"}, {"animalId": 2, "name": "병아리"}, {"animalId": 3, "name": "오리"}]},
+        headers={"user-id": user_id},
+    )
+    before = {a.animalId: float(a.userPatternBias) for a in db_session.query(Animal).filter(Animal.userId == user_id).all()}
+
+    response = client.post(
+        "/api/v1/admin/care/pattern-bias/rebalance",
+        json={"targets": [{"userId": user_id, "animalId": 2}], "transferRate": 0.3},
+        headers=ADMIN_HEADERS
+    )
+    assert response.status_code == 200
+
+    db_session.expire_all()
+    after = {a.animalId: float(a.userPatternBias) for a in db_session.query(Animal).filter(Animal.userId == user_id).all()}
+    transfer = sum(before[animal_id] * 0.3 for animal_id in (1, 3))
+    assert after[2] == round(before[2] + transfer, 2)
+    assert after[1] == round(before[1] * 0.7, 2)
+    assert after[3] == round(before[3] * 0.7, 2)
+
+    response = client.post("/api/v1/admin/care/pattern-bias/rebalance", json={"targets": [], "transferRate": 0.3}, headers=ADMIN_HEADERS)
+    assert response.status_code == 400
+
+# 배치 작업 실행 현황 조회 테스트(/admin/scheduler/jobs)
+def test_get_scheduler_jobs(client: TestClient):
+    response = client.get("/api/v1/admin/scheduler/jobs", headers=ADMIN_HEADERS)
+    assert response.status_code == 200
+    names = {job["name"] for job in response.json()["jobs"]}
+    assert {"daily_increment_days_since_care", "care_daily_count_purge", "idempotency_key_purge", "minigame_quota_rollover"} <= names
+
+    response = client.post("/api/v1/admin/scheduler/jobs/unknown/run", headers=ADMIN_HEADERS)
+    assert response.status_code == 404
+
+# 다른 워커가 advisory lock을 잡고 있으면 DB 작업을 건너뛰고, 잠금이 풀리면 실행 결과를 기록하는지 확인
+def test_scheduled_job_leader_lock():
+    from app.core.scheduler import ScheduledJob, LeaderLock
+
+    calls = []
+    job = ScheduledJob("test_leader_job", lambda: calls.append(1) or 5, interval_seconds=60)
+
+    other_worker = LeaderLock("test_leader_job")
+    assert other_worker.acquire()
+    try:
+        result = job.run()
+    finally:
+        other_worker.release()
+    assert result["lastStatus"] == "skipped"
+    assert calls == []
+
+    result = job.run()
+    assert result["lastStatus"] == "success"
+    assert result["runs"] == 1
+    assert result["skipped"] == 1
+    assert result["lastRows"] == 5
+    assert result["totalRows"] == 5
+    assert calls == [1]
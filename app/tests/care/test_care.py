@@ -791,3 +791,292 @@ def seed_emotion_messages(db_session):
         ]
         db_session.add_all(initial_messages)
         db_session.commit()
+
+# 테스트 20: 마이크로 배치 예측 결과가 단일 행 예측 결과와 동일한지 확인
+def test_emotion_predictor_batch_matches_single_row():
+    import threading
+    import numpy as np
+    from app.api.care.predictor import EmotionPredictor, FEATURE_COUNT
+
+    # 행 단위로 계산하는 가짜 모델 (배치 크기 기록)
+    batch_sizes = []
+
+    def score(data):
+        return data[:, 0] * 2 + data[:, 3]
+
+    class MockModel:
+        def predict(self, data, validate_features=False):
+            batch_sizes.append(len(data))
+            return score(data)
+
+    predictor = EmotionPredictor(MockModel(), max_batch_size=8, max_wait_ms=20)
+    rows = [np.random.rand(FEATURE_COUNT) for _ in range(20)]
+    results = [None] * len(rows)
+
+    def worker(index):
+        results[index] = predictor.predict_one(rows[index])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(rows))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for row, result in zip(rows, results):
+        assert result == float(score(row.reshape(1, -1))[0])
+    assert max(batch_sizes) <= 8
+    assert sum(batch_sizes) == len(rows)
+
+# 테스트 21: 미리 인코딩된 ML 입력 행이 MLInput 기반 인코딩과 동일한지 확인
+def test_feature_encoder_matches_ml_input(db_session):
+    from app.api.care.predictor import FeatureEncoder, features_from_ml_input
+    from app.api.care.schema import MLInput
+    from app.models.action import Action
+    from app.models.category import Category
+
+    encoder = FeatureEncoder()
+    encoder.load(db_session)
+
+    animal_types = {1: 'shiba', 2: 'duck', 3: 'chick'}
+    categories = {c.categoryId: c.name for c in db_session.query(Category).all()}
+
+    for action in db_session.query(Action).all():
+        action_ml_name = f"{categories[action.categoryId]}{action.actionLevel}"
+        assert encoder.get_action_ml_name(db_session, action.categoryId, action.actionLevel) == action_ml_name
+
+        for animal_id, animal_type in animal_types.items():
+            expected = MLInput(
+                current_emotion=55,
+                action_count=2,
+                user_pattern_bias=0.33,
+                days_since_last_care=1,
+                **{f"animal_type_{t}": int(t == animal_type) for t in ('chick', 'duck', 'shiba')},
+                **{f"action_{c}{l}": int(f"{c}{l}" == action_ml_name) for c in ('feed', 'play', 'gift') for l in (1, 2, 3)}
+            )
+            row = encoder.encode(db_session, animal_id, action.categoryId, action.actionLevel, 55, 2, 0.33, 1)
+            assert row.tolist() == features_from_ml_input(expected).tolist()
+
+# 테스트 22: 케어 액션 후 편애도 재분배 및 경과일 리셋이 한 번에 반영되는지 확인
+def test_care_action_updates_all_animals(client, db_session):
+    from app.api.care.service import calculate_pattern_biases
+
+    user_response = client.post("/api/v1/users/start")
+    assert user_response.status_code == 201
+    user_id = user_response.json()["userId"]
+
+    for animal_id in (1, 2, 3):
+        db_session.add(Animal(
+            animalId=animal_id,
+            userId=user_id,
+            name=f"동물{animal_id}",
+            isRunaway=False,
+            evolutionStage=1,
+            currentEmotion=50.0,
+            birthday=date.today(),
+            userPatternBias=0.33,
+            daySinceLastCare=2
+        ))
+    user = db_session.query(User).filter(User.userId == user_id).first()
+    user.money = 10000
+    db_session.commit()
+
+    response = client.post(
+        "/api/v1/cares/action",
+        json={"animal_id": 1, "action_id": 1},
+        headers={"user-id": str(user_id)}
+    )
+    assert response.status_code == 200
+
+    expected_biases = calculate_pattern_biases({1: 0.33, 2: 0.33, 3: 0.33}, 1, transfer_rate=0.3)
+    animals = {a.animalId: a for a in db_session.query(Animal).filter(Animal.userId == user_id).all()}
+    for animal_id, bias in expected_biases.items():
+        assert float(animals[animal_id].userPatternBias) == round(bias, 2)
+    assert animals[1].daySinceLastCare == 0
+    assert animals[2].daySinceLastCare == 2
+    assert float(animals[1].currentEmotion) == response.json()["newEmotion"]
+
+# 테스트 23: 여러 사용자의 편애도를 한 번에 재분배 (대상 동물이 없는 사용자는 변경 없음)
+def test_rebalance_user_pattern_biases_batch(db_session):
+    from uuid import uuid4
+    from app.api.care.repository import rebalance_user_pattern_biases
+    from app.api.care.service import calculate_pattern_biases
+
+    user_ids = [uuid4(), uuid4()]
+    for user_id in user_ids:
+        db_session.add(User(userId=user_id, createdAt=datetime.now(KST), money=0))
+    db_session.flush()
+
+    biases = {1: 0.50, 2: 0.30, 3: 0.20}
+    for user_id in user_ids:
+        for animal_id, bias in biases.items():
+            db_session.add(Animal(
+                animalId=animal_id,
+                userId=user_id,
+                name=f"동물{animal_id}",
+                birthday=date.today(),
+                userPatternBias=bias
+            ))
+    db_session.commit()
+
+    # 첫 번째 사용자는 2번 동물, 두 번째 사용자는 존재하지 않는 동물을 대상으로 지정
+    rebalance_user_pattern_biases(db_session, {user_ids[0]: 2, user_ids[1]: 9}, transfer_rate=0.3)
+    db_session.commit()
+
+    expected = calculate_pattern_biases(biases, 2, transfer_rate=0.3)
+    for animal in db_session.query(Animal).filter(Animal.userId == user_ids[0]).all():
+        assert float(animal.userPatternBias) == round(expected[animal.animalId], 2)
+    for animal in db_session.query(Animal).filter(Animal.userId == user_ids[1]).all():
+        assert float(animal.userPatternBias) == biases[animal.animalId]
+
+# 테스트 24: 케어 액션 수행 시 일일 카테고리별 케어 횟수가 함께 증가하는지 확인
+def test_care_action_increments_daily_count(client, db_session):
+    from app.models.action import Action
+    from app.models.care_daily_count import CareDailyCount
+
+    user_response = client.post("/api/v1/users/start")
+    assert user_response.status_code == 201
+    user_id = user_response.json()["userId"]
+
+    db_session.add(Animal(
+        animalId=1,
+        userId=user_id,
+        name="테스트동물",
+        isRunaway=False,
+        evolutionStage=1,
+        currentEmotion=10.0,
+        birthday=date.today(),
+        userPatternBias=0.33,
+        daySinceLastCare=0
+    ))
+    user = db_session.query(User).filter(User.userId == user_id).first()
+    user.money = 10000
+    db_session.commit()
+
+    action = db_session.query(Action).filter(Action.actionId == 1).first()
+
+    response = client.post(
+        "/api/v1/cares/action",
+        json={"animal_id": 1, "action_id": action.actionId},
+        headers={"user-id": str(user_id)}
+    )
+    assert response.status_code == 200
+
+    counter = db_session.query(CareDailyCount).filter(
+        CareDailyCount.userId == user_id,
+        CareDailyCount.animalId == 1,
+        CareDailyCount.categoryId == action.categoryId,
+        CareDailyCount.date == datetime.now(KST).date()
+    ).first()
+    assert counter is not None
+    assert counter.count == 1
+
+# 테스트 25: 케어 액션 수행 시 마지막 케어 시각이 로그 시각과 함께 기록되는지 확인
+def test_care_action_sets_last_cared_at(client, db_session):
+    from app.models.action_log import ActionLog
+
+    user_response = client.post("/api/v1/users/start")
+    assert user_response.status_code == 201
+    user_id = user_response.json()["userId"]
+
+    db_session.add(Animal(
+        animalId=2,
+        userId=user_id,
+        name="테스트동물",
+        isRunaway=False,
+        evolutionStage=1,
+        currentEmotion=10.0,
+        birthday=date.today(),
+        userPatternBias=0.33,
+        daySinceLastCare=3
+    ))
+    user = db_session.query(User).filter(User.userId == user_id).first()
+    user.money = 10000
+    db_session.commit()
+
+    response = client.post(
+        "/api/v1/cares/action",
+        json={"animal_id": 2, "action_id": 1},
+        headers={"user-id": str(user_id)}
+    )
+    assert response.status_code == 200
+
+    animal = db_session.query(Animal).filter(Animal.userId == user_id, Animal.animalId == 2).first()
+    log = db_session.query(ActionLog).filter(ActionLog.userId == user_id, ActionLog.animalId == 2).first()
+    assert animal.lastCaredAt is not None
+    assert animal.lastCaredAt == log.performedAt
+    assert animal.daySinceLastCare == 0
+
+# 테스트 26: 케어 로그 NDJSON/CSV 내보내기
+def test_export_care_logs(client, db_session):
+    import csv
+    import io
+    import json
+    from app.models.action_log import ActionLog
+
+    user_response = client.post("/api/v1/users/start")
+    user_id = user_response.json()["userId"]
+
+    db_session.add_all([
+        ActionLog(userId=user_id, animalId=animal_id, actionId=1, emotionBefore=50, emotionAfter=55,
+                  predictedDelta=5, actualDelta=5, userPatternBias=0.33, daysSinceLastCare=0)
+        for animal_id in (2, 1, 1)
+    ])
+    db_session.commit()
+
+    response = client.get("/api/v1/cares/logs/export", headers={"user-id": user_id})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["animalId"] for row in rows] == [1, 1, 2]
+    assert rows[0]["emotionAfter"] == 55
+
+    response = client.get("/api/v1/cares/logs/export", params={"format": "csv", "animalId": 1}, headers={"user-id": user_id})
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 2
+    assert {row["animalId"] for row in rows} == {"1"}
+
+    response = client.get("/api/v1/cares/logs/export", params={"format": "xml"}, headers={"user-id": user_id})
+    assert response.status_code == 400
+
+# 테스트 27: 자정 배치를 청크로 나눠 처리하고 같은 날짜에 다시 실행해도 한 번만 반영되는지 확인
+def test_daily_increment_chunked_once_per_day(db_session):
+    from uuid import uuid4
+    from app.api.care.service import daily_increment_days_since_care_service, daily_increment_status_service
+
+    user_id = uuid4()
+    db_session.add(User(userId=user_id, createdAt=datetime.now(KST), money=0))
+    db_session.flush()
+    for animal_id in (1, 2, 3):
+        db_session.add(Animal(
+            animalId=animal_id,
+            userId=user_id,
+            name=f"동물{animal_id}",
+            birthday=date.today(),
+            daySinceLastCare=animal_id
+        ))
+    db_session.commit()
+
+    run_date = date(2026, 1, 1)
+    result = daily_increment_days_since_care_service(db_session, run_date=run_date, chunk_size=2)
+    assert result["status"] == 200
+    assert result["data"]["alreadyCompleted"] is False
+    assert result["data"]["rowsProcessed"] >= 3
+    assert result["data"]["chunks"] >= 2
+
+    db_session.expire_all()
+    days = {a.animalId: a.daySinceLastCare for a in db_session.query(Animal).filter(Animal.userId == user_id)}
+    assert days == {1: 2, 2: 3, 3: 4}
+
+    # 같은 날짜로 다시 실행하면 변경 없음
+    result = daily_increment_days_since_care_service(db_session, run_date=run_date, chunk_size=2)
+    assert result["data"]["alreadyCompleted"] is True
+    assert result["data"]["rowsProcessed"] == 0
+
+    db_session.expire_all()
+    days = {a.animalId: a.daySinceLastCare for a in db_session.query(Animal).filter(Animal.userId == user_id)}
+    assert days == {1: 2, 2: 3, 3: 4}
+
+    status = daily_increment_status_service(db_session, run_date=run_date)["data"]
+    assert status["status"] == "completed"
+    assert status["finishedAt"] is not None
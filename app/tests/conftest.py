@@ -7,7 +7,7 @@ from app.core.database import engine, SessionLocal, Base
 from sqlalchemy.orm import Session
 from uuid import uuid4
 import sqlalchemy
-from app.core.database import get_db
+from app.core.database import get_db, get_stream_session_factory
 from app.core.config import KST
 # Import all models to ensure they are registered with Base
 from app.models.birthday import BirthdayReward
@@ -114,7 +114,12 @@ def client(db_session):
     def override_get_db():
         yield db_session
 
+    # 스트리밍 응답도 롤백되는 테스트 트랜잭션의 데이터를 읽도록 같은 커넥션에 묶음
+    def override_get_stream_session_factory():
+        return lambda: Session(bind=db_session.connection())
+
     app.dependency_overrides = {}
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_stream_session_factory] = override_get_stream_session_factory
 
     return TestClient(app)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from uuid import uuid4
+from uuid import uuid4, UUID
 from datetime import date, timedelta
 
 from app.models.user import User
@@ -6,6 +6,8 @@ from app.models.animal import Animal
 from app.models.moneyTransaction import MoneyTransaction, TransactionDirection
 from app.models.attendance import AttendanceLog, AttendanceReward
 from app.models.birthday import BirthdayReward
+from app.api.event.repository import rebuild_attendance_summaries
+from app.api.user.repository import rebuild_ledger_snapshots
 
 
 def test_reset_game_success(client, db_session):
@@ -94,6 +96,69 @@ def test_reset_game_user_not_found(client):
     assert res.status_code == 404 or res.json().get("status") == 404
 
 
+def test_reset_game_deferred_purge(client, db_session, monkeypatch):
+    # 지연 삭제 모드: 초기화 요청은 삭제 대기로 표시만 하고, 워커가 나눠서 삭제
+    from app.api.ending import service as ending_service
+    from app.api.ending.purge import purge_user
+
+    monkeypatch.setattr(ending_service, "GAME_RESET_MODE", "deferred")
+    monkeypatch.setattr(ending_service.purge_worker, "wake", lambda: None)
+
+    res = client.post("/api/v1/users/start")
+    assert res.status_code == 201
+    user_id = res.json()["userId"]
+    client.post(
+        "/api/v1/pets/nickname",
+        json={"animals": [{"animalId": 1, "name": "시바"}, {"animalId": 2, "name": "병아리"}, {"animalId": 3, "name": "오리"}]},
+        headers={"user-id": user_id},
+    )
+    for amount in (100, 50, 30):
+        assert client.post("/api/v1/users/transactions", json={"amount": amount, "source": "test"}, headers={"user-id": user_id}).status_code == 201
+
+    res_reset = client.post("/api/v1/endings/reset", headers={"user-id": user_id})
+    assert res_reset.status_code == 200
+
+    # 표시만 된 상태: 데이터는 남아 있지만 없는 사용자로 취급
+    user = db_session.query(User).filter(User.userId == user_id).first()
+    assert user is not None and user.deletedAt is not None
+    assert db_session.query(MoneyTransaction).filter(MoneyTransaction.userId == user_id).count() == 3
+    assert client.post("/api/v1/endings/reset", headers={"user-id": user_id}).status_code == 404
+
+    # 청크 크기 2로 삭제 (keyset 커서가 여러 번 이어지는지 확인)
+    deleted = purge_user(db_session, user.userId, batch_size=2, pause=0)
+    assert deleted["MoneyTransactions"] == 3
+    assert deleted["Animals"] == 3
+    assert deleted["Users"] == 1
+    db_session.expire_all()
+    assert db_session.query(User).filter(User.userId == user_id).first() is None
+    assert db_session.query(Animal).filter(Animal.userId == user_id).count() == 0
+    assert db_session.query(MoneyTransaction).filter(MoneyTransaction.userId == user_id).count() == 0
+
+
+def test_deleted_user_cannot_write(client, db_session, monkeypatch):
+    # 삭제 대기로 표시된 사용자는 삭제가 끝나기 전에도 쓰기 API에서 없는 사용자로 취급 (삭제 중 새 기록이 생기지 않도록)
+    from app.api.ending import service as ending_service
+
+    monkeypatch.setattr(ending_service, "GAME_RESET_MODE", "deferred")
+    monkeypatch.setattr(ending_service.purge_worker, "wake", lambda: None)
+
+    res = client.post("/api/v1/users/start")
+    assert res.status_code == 201
+    user_id = res.json()["userId"]
+    headers = {"user-id": user_id}
+    client.post(
+        "/api/v1/pets/nickname",
+        json={"animals": [{"animalId": 1, "name": "시바"}, {"animalId": 2, "name": "병아리"}, {"animalId": 3, "name": "오리"}]},
+        headers=headers,
+    )
+    assert client.post("/api/v1/endings/reset", headers=headers).status_code == 200
+
+    assert client.post("/api/v1/users/transactions", json={"amount": 100, "source": "test"}, headers=headers).status_code == 404
+    assert client.post("/api/v1/events/attendance/checkin", headers=headers).status_code == 404
+    assert client.post("/api/v1/cares/action", json={"animal_id": 1, "action_id": 1}, headers=headers).status_code == 404
+    assert db_session.query(MoneyTransaction).filter(MoneyTransaction.userId == user_id).count() == 0
+
+
 def test_get_ending_summary_success(client, db_session):
     """엔딩 요약 조회 성공 테스트"""
     # 1) 사용자 생성
@@ -133,6 +198,9 @@ def test_get_ending_summary_success(client, db_session):
             attendanceRewardId=reward.attendanceRewardId
         ))
     db_session.commit()
+    # 체크인 API를 거치지 않은 출석 로그는 출석 요약 재계산으로 반영
+    rebuild_attendance_summaries(db_session, [UUID(user_id)])
+    db_session.commit()
 
     # 5) MoneyTransaction 추가 (OUT 방향)
     db_session.add(MoneyTransaction(
@@ -152,6 +220,9 @@ def test_get_ending_summary_success(client, db_session):
         userId=user_id
     ))
     db_session.commit()
+    # 거래 API를 거치지 않은 거래는 누적 합계 재계산으로 반영
+    rebuild_ledger_snapshots(db_session, UUID(user_id))
+    db_session.commit()
 
     # 6) 동물 가출 횟수 증가
     animal1 = db_session.query(Animal).filter(
@@ -294,6 +365,9 @@ def test_get_ending_summary_consecutive_days_calculation(client, db_session):
         attendanceRewardId=reward.attendanceRewardId
     ))
     db_session.commit()
+    # 체크인 API를 거치지 않은 출석 로그는 출석 요약 재계산으로 반영
+    rebuild_attendance_summaries(db_session, [UUID(user_id)])
+    db_session.commit()
 
     # 5) 모든 동물의 감정도를 100으로 설정
     for animal_id in [1, 2, 3]:
@@ -371,6 +445,9 @@ def test_get_ending_summary_duplicate_attendance_dates(client, db_session):
         attendanceRewardId=reward.attendanceRewardId
     ))
     db_session.commit()
+    # 체크인 API를 거치지 않은 출석 로그는 출석 요약 재계산으로 반영
+    rebuild_attendance_summaries(db_session, [UUID(user_id)])
+    db_session.commit()
 
     # 5) 모든 동물의 감정도를 100으로 설정
     for animal_id in [1, 2, 3]:
@@ -394,3 +471,66 @@ def test_get_ending_summary_duplicate_attendance_dates(client, db_session):
     # 중복 제거 후 연속 출석일은 3일
     assert body["consecutiveAttendanceDays"] == 3
 
+
+
+def test_get_ending_summary_cached_until_user_write(client, db_session):
+    # 요약은 사용자별로 캐시되고, 그 사용자의 쓰기 요청이 끝나면 다시 조회
+    res = client.post("/api/v1/users/start")
+    assert res.status_code == 201
+    user_id = res.json()["userId"]
+    client.post(
+        "/api/v1/pets/nickname",
+        json={"animals": [{"animalId": 1, "name": "시바"}, {"animalId": 2, "name": "병아리"}, {"animalId": 3, "name": "오리"}]},
+        headers={"user-id": user_id},
+    )
+    for animal in db_session.query(Animal).filter(Animal.userId == user_id).all():
+        animal.currentEmotion = 100
+    db_session.commit()
+
+    res = client.get("/api/v1/endings/summary", headers={"user-id": user_id})
+    assert res.status_code == 200
+    assert res.json()["totalPlayDays"] == 0
+
+    # API를 거치지 않은 변경은 캐시된 요약에 반영되지 않음
+    reward = db_session.query(AttendanceReward).first()
+    db_session.add(AttendanceLog(date=date.today() - timedelta(days=1), userId=user_id, attendanceRewardId=reward.attendanceRewardId))
+    db_session.commit()
+    rebuild_attendance_summaries(db_session, [UUID(user_id)])
+    db_session.commit()
+    assert client.get("/api/v1/endings/summary", headers={"user-id": user_id}).json()["totalPlayDays"] == 0
+
+    # 같은 사용자의 쓰기 요청 후에는 다시 조회 (어제 + 오늘 연속 출석)
+    assert client.post("/api/v1/events/attendance/checkin", headers={"user-id": user_id}).status_code == 200
+    body = client.get("/api/v1/endings/summary", headers={"user-id": user_id}).json()
+    assert body["totalPlayDays"] == 2
+    assert body["consecutiveAttendanceDays"] == 2
+
+
+def test_ending_summary_not_cached_when_invalidated_during_read():
+    # 조회하는 동안 사용자 캐시가 무효화되면 조회 결과(이전 데이터)를 캐시에 저장하지 않음
+    from app.core.cache import TTLCache
+
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    user_id = uuid4()
+
+    version = cache.version(user_id)
+    cache.delete(user_id)   # 다른 요청의 쓰기 완료
+    cache.set(user_id, {"totalPlayDays": 0}, version)
+    assert cache.get(user_id) is None
+
+    version = cache.version(user_id)
+    cache.set(user_id, {"totalPlayDays": 1}, version)
+    assert cache.get(user_id) == {"totalPlayDays": 1}
+
+    # 키 버전이 max_size개를 넘어 삭제돼도 이전 버전으로는 저장되지 않음
+    stale = cache.version(user_id)
+    cache.delete(user_id)
+    for _ in range(3):
+        cache.delete(uuid4())
+    cache.set(user_id, {"totalPlayDays": 1}, stale)
+    assert cache.get(user_id) is None
+
+    version = cache.version(user_id)
+    cache.clear()
+    cache.set(user_id, {"totalPlayDays": 2}, version)
+    assert cache.get(user_id) is None
@@ -1,10 +1,20 @@
 # -*- coding: utf-8 -*-
 
 from fastapi.testclient import TestClient
-from datetime import date
+from datetime import date, datetime
+from uuid import UUID
 from app.models.animal import Animal
 from app.models.birthday import BirthdayReward
 from app.models.moneyTransaction import MoneyTransaction
+from app.models.attendance import AttendanceSummary
+from app.api.event.birthday import birthday_calendar
+from app.core.config import KST
+import pytest
+
+# 테스트 데이터는 동물 생성 API를 거치지 않고 추가되므로 테스트마다 생일 캘린더를 다시 적재
+@pytest.fixture(autouse=True)
+def reset_birthday_calendar():
+    birthday_calendar.invalidate()
 
 # 출석 체크 테스트(events/attendance/checkin)
 def test_attendance_checkin(client: TestClient, db_session):
@@ -66,6 +76,33 @@ def test_get_attendance_info(client: TestClient):
     assert "board" in data["data"]
 
 
+# 출석 요약 테스트 - 출석 체크 후 요약 갱신, 같은 날 재출석은 409
+def test_attendance_summary_after_checkin(client: TestClient, db_session):
+    user_response = client.post("/api/v1/users/start")
+    assert user_response.status_code == 201
+    user_id = user_response.json()["userId"]
+
+    response = client.post("/api/v1/events/attendance/checkin", headers={"user-id": user_id})
+    assert response.status_code == 200
+    assert response.json()["data"]["totalAttendance"] == 1
+
+    summary = db_session.get(AttendanceSummary, UUID(user_id))
+    assert summary.totalCount == 1
+    assert summary.attendanceDays == 1
+    assert summary.lastDate == datetime.now(KST).date()
+    assert summary.currentStreak == 1
+    assert summary.rewardMask == 1
+
+    response = client.post("/api/v1/events/attendance/checkin", headers={"user-id": user_id})
+    assert response.status_code == 409
+
+    response = client.get("/api/v1/events/attendance", headers={"user-id": user_id})
+    data = response.json()["data"]
+    assert data["alreadyCheckedIn"] is True
+    assert data["totalAttendance"] == 1
+    assert [item["checkedIn"] for item in data["board"] if item["day"] == 1] == [True]
+
+
 # 생일 동물 조회 테스트 - 생일인 동물이 없는 경우(/events/birthday)
 def test_get_birthday_animals_no_birthday(client: TestClient, db_session):
     # 유저 생성
@@ -108,7 +145,7 @@ def test_get_birthday_animals_with_birthday(client: TestClient, db_session):
     user_id = user_response.json()["userId"]
 
     # 오늘 생일인 동물 생성
-    today = date.today()
+    today = datetime.now(KST).date()  # 생일 API와 같은 TIMEZONE 기준 날짜
     animal = Animal(
         animalId=1,
         userId=user_id,
@@ -146,7 +183,7 @@ def test_birthday_reward_success(client: TestClient, db_session):
     user_id = user_response.json()["userId"]
 
     # 오늘 생일인 동물 생성
-    today = date.today()
+    today = datetime.now(KST).date()  # 생일 API와 같은 TIMEZONE 기준 날짜
     animal = Animal(
         animalId=1,
         userId=user_id,
@@ -229,7 +266,7 @@ def test_birthday_reward_already_rewarded(client: TestClient, db_session):
     user_id = user_response.json()["userId"]
 
     # 오늘 생일인 동물 생성
-    today = date.today()
+    today = datetime.now(KST).date()  # 생일 API와 같은 TIMEZONE 기준 날짜
     animal = Animal(
         animalId=1,
         userId=user_id,
@@ -259,4 +296,29 @@ def test_birthday_reward_already_rewarded(client: TestClient, db_session):
     )
     assert response.status_code == 409
     data = response.json()
-    assert data["message"] == "이미 선물 수령함"
\ No newline at end of file
+    assert data["message"] == "이미 선물 수령함"
+
+# 생일 동물 조회 테스트 - 보상 수령 여부가 동물별로 표시되는지 (/events/birthday)
+def test_get_birthday_animals_reward_status(client: TestClient, db_session):
+    user_response = client.post("/api/v1/users/start")
+    assert user_response.status_code == 201
+    user_id = user_response.json()["userId"]
+
+    # 캘린더를 먼저 적재한 뒤 동물 추가 (같은 프로세스에서 추가된 동물은 바로 반영되어야 함)
+    response = client.get("/api/v1/events/birthday", headers={"user-id": user_id})
+    assert response.status_code == 200
+    assert response.json()["data"] == []
+
+    from app.api.pet.repository import create_animal
+
+    today = datetime.now(KST).date()  # 생일 API와 같은 TIMEZONE 기준 날짜
+    for animal_id, name in ((1, "첫째"), (2, "둘째")):
+        create_animal(db_session, UUID(user_id), animal_id, name, today)
+
+    response = client.post("/api/v1/events/birthday/reward", headers={"user-id": user_id})
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/events/birthday", headers={"user-id": user_id})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [(a["animalId"], a["rewarded"]) for a in data] == [(1, True), (2, False)]
@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 
 from app.models import User, Minigame, UserMinigamePlay, MinigameAttempt
 from app.api.minigame.service import start_minigame
+from app.api.minigame.repository import kst_today
 from app.core.exception import CustomException
 from app.api.ending import repository
 
@@ -50,7 +51,7 @@ def test_start_minigame_exceed(db_session, test_user):
     play = UserMinigamePlay(
         userId=test_user.userId,
         minigameId=game.minigameId,
-        playDate=date.today(),
+        playDate=kst_today(),
         playCount=3
     )
     db_session.add(play)
@@ -117,7 +118,7 @@ def test_successful_game_completion(client, db_session):
     play_record = db_session.query(UserMinigamePlay).filter(
         UserMinigamePlay.userId == user_id,
         UserMinigamePlay.minigameId == test_game_id,
-        UserMinigamePlay.playDate == date.today()
+        UserMinigamePlay.playDate == kst_today()
     ).first()
     assert play_record is not None
     assert play_record.playCount == 1
@@ -177,7 +178,7 @@ def test_interrupted_game_with_null_values(client, db_session):
     play_record = db_session.query(UserMinigamePlay).filter(
         UserMinigamePlay.userId == user_id,
         UserMinigamePlay.minigameId == test_game_id,
-        UserMinigamePlay.playDate == date.today()
+        UserMinigamePlay.playDate == kst_today()
     ).first()
     assert play_record is not None
     assert play_record.playCount == 1
@@ -436,4 +437,200 @@ def test_zero_money_reward(client, db_session):
 
     # 사용자 재화는 변화 없음
     user = db_session.query(User).filter(User.userId == user_id).first()
-    assert user.money == 1000
\ No newline at end of file
+    assert user.money == 1000
+
+def test_reserve_daily_play_respects_max_play(db_session, test_user):
+    # 일일 플레이 예약 - 한도까지만 증가하고 유저/게임/날짜당 한 행만 유지
+    from app.api.minigame.repository import reserve_daily_play
+
+    create_test_minigames_for_result_tests(db_session)
+
+    counts = [reserve_daily_play(db_session, test_user.userId, 3, 3) for _ in range(5)]
+    db_session.commit()
+
+    assert counts == [1, 2, 3, None, None]
+    plays = db_session.query(UserMinigamePlay).filter(
+        UserMinigamePlay.userId == test_user.userId,
+        UserMinigamePlay.minigameId == 3
+    ).all()
+    assert len(plays) == 1
+    assert plays[0].playCount == 3
+
+
+def test_minigame_quota_write_behind_and_rollover(db_session, test_user):
+    # 메모리 카운터 한도 확인 → 일괄 반영 → 날짜 변경 시 이전 카운터 삭제
+    from datetime import timedelta
+    from app.api.minigame.quota import MinigameQuota, LocalQuotaBackend
+
+    create_test_minigames_for_result_tests(db_session)
+    day = {"today": date(2025, 9, 9)}
+    quota = MinigameQuota(LocalQuotaBackend(), flush_interval=60, flush_batch_size=100, today=lambda: day["today"])
+
+    counts = [quota.reserve(db_session, test_user.userId, 1, 3) for _ in range(4)]
+    assert counts == [1, 2, 3, None]
+
+    # 반영 전에는 테이블에 기록 없음
+    assert db_session.query(UserMinigamePlay).filter(UserMinigamePlay.userId == test_user.userId).count() == 0
+
+    assert quota.flush(db_session) == 1
+    db_session.expire_all()
+    play = db_session.query(UserMinigamePlay).filter(UserMinigamePlay.userId == test_user.userId).one()
+    assert play.playDate == date(2025, 9, 9)
+    assert play.playCount == 3
+
+    # 날짜가 바뀌면 이전 날짜 카운터는 삭제되고 새 날짜는 0부터 시작
+    day["today"] = date(2025, 9, 9) + timedelta(days=1)
+    assert quota.get_count(db_session, test_user.userId, 1) == 0
+    assert quota.backend.get((test_user.userId, 1, date(2025, 9, 9))) is None
+
+
+def test_minigame_quota_release_after_flush(db_session, test_user):
+    # 이미 반영된 예약을 취소하면 다음 반영 때 테이블 값에서 차감 (0 미만으로 내려가지 않음)
+    from app.api.minigame.quota import MinigameQuota, LocalQuotaBackend
+    from app.api.minigame.repository import add_daily_play_counts
+
+    create_test_minigames_for_result_tests(db_session)
+    quota = MinigameQuota(LocalQuotaBackend(), flush_interval=60, flush_batch_size=100, today=lambda: date(2025, 9, 9))
+
+    assert [quota.reserve(db_session, test_user.userId, 1, 3) for _ in range(2)] == [1, 2]
+    assert quota.flush(db_session) == 1
+
+    quota.release(test_user.userId, 1)
+    assert quota.get_count(db_session, test_user.userId, 1) == 1
+    assert quota.flush(db_session) == 1
+    db_session.expire_all()
+    play = db_session.query(UserMinigamePlay).filter(UserMinigamePlay.userId == test_user.userId).one()
+    assert play.playCount == 1
+
+    # 감소분이 테이블 값보다 커도 0에서 멈춤
+    add_daily_play_counts(db_session, {(test_user.userId, 1, date(2025, 9, 9)): -5})
+    db_session.expire_all()
+    assert db_session.query(UserMinigamePlay.playCount).filter(UserMinigamePlay.userId == test_user.userId).scalar() == 0
+
+
+def test_minigame_leaderboard(client, db_session):
+    # 결과 저장 시 리더보드 갱신 → 상위 기록/내 순위 조회
+    from app.api.minigame.leaderboard import leaderboard
+
+    create_test_minigames_for_result_tests(db_session)
+    leaderboard.invalidate()
+    first_user = create_test_user_for_result_tests(db_session)
+    second_user = create_test_user_for_result_tests(db_session)
+
+    def submit(user_id, score):
+        response = client.post(
+            "/api/v1/minigames/3/result",
+            json={
+                "score": score,
+                "money": 0,
+                "timeSpent": 60,
+                "startedAt": "2025-09-09T19:55:00Z",
+                "completedAt": "2025-09-09T19:56:00Z"
+            },
+            headers={"user-id": user_id}
+        )
+        assert response.status_code == 200
+
+    submit(first_user, 100)
+    # 보드가 메모리에 적재된 뒤의 결과도 바로 반영되는지 확인
+    response = client.get("/api/v1/minigames/3/leaderboard?period=daily")
+    assert response.status_code == 200
+    submit(second_user, 300)
+    submit(first_user, 50)   # 최고 점수보다 낮으면 순위 변화 없음
+
+    response = client.get("/api/v1/minigames/3/leaderboard?period=all&limit=5", headers={"user-id": first_user})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [(entry["rank"], entry["userId"], entry["score"]) for entry in data["entries"]] == [
+        (1, second_user, 300), (2, first_user, 100)
+    ]
+    assert data["me"] == {"rank": 2, "score": 100, "total": 2}
+
+    response = client.get("/api/v1/minigames/3/leaderboard?period=daily", headers={"user-id": first_user})
+    data = response.json()["data"]
+    assert [entry["score"] for entry in data["entries"]] == [300, 100]
+    assert data["me"] == {"rank": 2, "score": 100, "total": 2}
+
+    response = client.get("/api/v1/minigames/3/leaderboard?period=monthly")
+    assert response.status_code == 400
+
+
+def test_minigame_result_idempotency_key(client, db_session):
+    # 같은 Idempotency-Key로 재시도하면 첫 응답을 그대로 반환하고 다시 처리하지 않음
+    create_test_minigames_for_result_tests(db_session)
+    user_id = create_test_user_for_result_tests(db_session)
+    headers = {"user-id": user_id, "Idempotency-Key": str(uuid4())}
+    request_data = {
+        "score": 100,
+        "money": 10,
+        "timeSpent": 60,
+        "startedAt": "2025-09-09T19:55:00Z",
+        "completedAt": "2025-09-09T19:56:00Z"
+    }
+
+    first = client.post("/api/v1/minigames/1/result", json=request_data, headers=headers)
+    retry = client.post("/api/v1/minigames/1/result", json=request_data, headers=headers)
+
+    assert first.status_code == 200
+    assert retry.status_code == 200
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+
+    # 플레이 횟수와 보상은 한 번만 반영
+    db_session.expire_all()
+    play = db_session.query(UserMinigamePlay).filter(UserMinigamePlay.userId == user_id).one()
+    assert play.playCount == 1
+    assert db_session.query(User).filter(User.userId == user_id).one().money == 1010
+
+    # 같은 키로 다른 요청을 보내면 거부
+    changed = client.post("/api/v1/minigames/1/result", json={**request_data, "score": 200}, headers=headers)
+    assert changed.status_code == 422
+
+def test_idempotency_key_in_progress_not_reclaimed():
+    # 응답 저장 전에 중단된 키는 오래되어도 다시 선점하지 않음 (서비스가 이미 커밋했을 수 있음)
+    from datetime import timedelta
+    from app.core.database import SessionLocal
+    from app.core.idempotency import claim_key, release_key
+    from app.models.idempotency_key import IdempotencyKey
+
+    user_id, key = uuid4(), str(uuid4())
+    try:
+        assert claim_key(user_id, key, "hash")[0] == "new"
+
+        db = SessionLocal()
+        try:
+            db.query(IdempotencyKey).filter(IdempotencyKey.userId == user_id).update(
+                {"createdAt": IdempotencyKey.createdAt - timedelta(hours=1)}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+        assert claim_key(user_id, key, "hash")[0] == "in_progress"
+
+        # 서버 오류로 해제된 키만 다시 처리
+        release_key(user_id, key)
+        assert claim_key(user_id, key, "hash")[0] == "new"
+    finally:
+        release_key(user_id, key)
+
+
+def test_minigame_list_and_play_count(client, db_session):
+    # 미니게임 목록과 오늘 플레이 횟수(남은 횟수) 조회
+    create_test_minigames_for_result_tests(db_session)
+    user_id = create_test_user_for_result_tests(db_session)
+
+    response = client.get("/api/v1/minigames")
+    assert response.status_code == 200
+    assert [game["minigameId"] for game in response.json()["data"]][:3] == [1, 2, 3]
+
+    response = client.get("/api/v1/minigames/1/plays/today", headers={"user-id": user_id})
+    assert response.status_code == 200
+    assert response.json()["data"] == {"gameId": 1, "playCount": 0, "maxPlay": 3, "remainingPlays": 3}
+
+    assert client.post("/api/v1/minigames/1/start", headers={"user-id": user_id}).status_code == 200
+    response = client.get("/api/v1/minigames/1/plays/today", headers={"user-id": user_id})
+    assert response.json()["data"]["playCount"] == 1
+    assert response.json()["data"]["remainingPlays"] == 2
+
+    response = client.get("/api/v1/minigames/99/plays/today", headers={"user-id": user_id})
+    assert response.status_code == 404
@@ -7,6 +7,8 @@ from app.models.moneyTransaction import MoneyTransaction, TransactionDirection
 from uuid import uuid4
 from datetime import datetime
 from app.core.config import KST
+from app.core.idgen import SnowflakeIdGenerator, TX_ID_LENGTH
+from concurrent.futures import ThreadPoolExecutor
 
 # 사용자 생성 테스트(/users/start)
 def test_start_user_creation(client):
@@ -167,4 +169,193 @@ def test_transaction_server_error(client, db_session, monkeypatch):
     # 응답 본문 검증
     data = response.json()
     assert data["message"] == "데이터베이스 오류가 발생했습니다."
-    assert data["status"] == 500
\ No newline at end of file
+    assert data["status"] == 500
+
+
+# 잔액 부족 시 잔액과 거래 기록이 변경되지 않는지 테스트(/users/transactions)
+def test_transaction_insufficient_balance_no_side_effect(client, db_session):
+    user = User(
+        userId=uuid4(),
+        createdAt=datetime.now(KST),
+        money=100
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post(
+        "/api/v1/users/transactions",
+        json={"amount": -101, "source": "test_source"},
+        headers={"user-id": str(user.userId)}
+    )
+    assert response.status_code == 400
+    assert "현재 잔액: 100원" in response.json()["message"]
+
+    # 잔액 유지, 거래 기록 없음
+    db_session.expire_all()
+    assert db_session.query(User).filter(User.userId == user.userId).first().money == 100
+    assert db_session.query(MoneyTransaction).filter(MoneyTransaction.userId == user.userId).count() == 0
+
+    # 잔액 전액 출금은 가능 (money + amount >= 0)
+    response = client.post(
+        "/api/v1/users/transactions",
+        json={"amount": -100, "source": "test_source"},
+        headers={"user-id": str(user.userId)}
+    )
+    assert response.status_code == 201
+    assert response.json()["currentMoney"] == 0
+    assert response.json()["direction"] == "OUT"
+
+    db_session.expire_all()
+    assert db_session.query(User).filter(User.userId == user.userId).first().money == 0
+    tx = db_session.query(MoneyTransaction).filter(MoneyTransaction.userId == user.userId).one()
+    assert tx.currentMoney == 0
+    assert tx.direction == TransactionDirection.OUT
+
+
+# 거래 ID 생성기 테스트 - 스레드 동시 생성 시 고유성, 워커 간 충돌 없음, 컬럼 길이
+def test_snowflake_tx_id_unique_and_monotonic():
+    generator = SnowflakeIdGenerator(worker_id=1)
+    other = SnowflakeIdGenerator(worker_id=2)
+
+    sequential = [generator.next_id() for _ in range(10000)]
+    assert sequential == sorted(sequential)  # 문자열 정렬 순서 = 생성 순서
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        concurrent = list(executor.map(lambda _: generator.next_id(), range(20000)))
+
+    ids = sequential + concurrent + [other.next_id() for _ in range(10000)]
+    assert len(set(ids)) == len(ids)
+    assert all(len(tx_id) == TX_ID_LENGTH <= MoneyTransaction.__table__.c.txId.type.length for tx_id in ids)
+
+# 워커 ID 임대 테스트 - 동시에 실행 중인 프로세스끼리 같은 워커 ID를 받지 않음
+def test_worker_id_lease_unique():
+    from app.core.idgen import WorkerIdLease
+
+    first, second = WorkerIdLease(), WorkerIdLease()
+    try:
+        assert first.acquire() != second.acquire()
+    finally:
+        first.release()
+        second.release()
+
+# 일괄 거래 테스트(/users/transactions/batch) - 사용자별 누적 잔액, 항목별 결과
+def test_transaction_batch(client, db_session):
+    user = User(userId=uuid4(), createdAt=datetime.now(KST), money=100)
+    other = User(userId=uuid4(), createdAt=datetime.now(KST), money=0)
+    db_session.add_all([user, other])
+    db_session.commit()
+
+    response = client.post(
+        "/api/v1/users/transactions/batch",
+        json={"transactions": [
+            {"amount": 50, "source": "minigame"},                          # 헤더 사용자 100 -> 150
+            {"amount": -120, "source": "care"},                            # 150 -> 30
+            {"amount": -31, "source": "care"},                             # 잔액 부족 (30)
+            {"userId": str(other.userId), "amount": 70, "source": "attendance"},
+            {"userId": str(uuid4()), "amount": 10, "source": "attendance"}  # 없는 사용자
+        ]},
+        headers={"user-id": str(user.userId)}
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["applied"] == 3
+    assert data["rejected"] == 2
+    assert [r["status"] for r in data["results"]] == [201, 201, 400, 201, 404]
+    assert [r["currentMoney"] for r in data["results"]] == [150, 30, None, 70, None]
+    assert "현재 잔액: 30원" in data["results"][2]["message"]
+
+    db_session.expire_all()
+    assert db_session.query(User).filter(User.userId == user.userId).first().money == 30
+    assert db_session.query(User).filter(User.userId == other.userId).first().money == 70
+    assert db_session.query(MoneyTransaction).filter(MoneyTransaction.userId == user.userId).count() == 2
+    assert db_session.query(MoneyTransaction).filter(MoneyTransaction.userId == other.userId).count() == 1
+
+# 거래 내역 keyset 페이지네이션 및 누적 합계 테스트(/users/transactions, /users/ledger)
+def test_transaction_history_and_ledger(client, db_session):
+    user = User(userId=uuid4(), createdAt=datetime.now(KST), money=0)
+    db_session.add(user)
+    db_session.commit()
+    headers = {"user-id": str(user.userId)}
+
+    # 단건 거래 + 일괄 거래로 7건 생성
+    for amount in (100, 200, -50):
+        assert client.post("/api/v1/users/transactions", json={"amount": amount, "source": "test"}, headers=headers).status_code == 201
+    response = client.post(
+        "/api/v1/users/transactions/batch",
+        json={"transactions": [
+            {"amount": 10, "source": "minigame"},
+            {"amount": 20, "source": "minigame"},
+            {"amount": -30, "source": "care"},
+            {"amount": 5, "source": "test"}
+        ]},
+        headers=headers
+    )
+    assert response.json()["applied"] == 4
+
+    # 3건씩 페이지 조회 -> 3 + 3 + 1, 중복/누락 없음
+    tx_ids = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/users/transactions", params=params, headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        tx_ids.extend(item["txId"] for item in data["items"])
+        pages += 1
+        cursor = data["nextCursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len(tx_ids) == len(set(tx_ids)) == 7
+    stored = db_session.query(MoneyTransaction).filter(MoneyTransaction.userId == user.userId).all()
+    assert set(tx_ids) == {tx.txId for tx in stored}
+
+    assert client.get("/api/v1/users/transactions", params={"cursor": "invalid"}, headers=headers).status_code == 400
+
+    # 누적 합계 = 거래 내역 집계
+    response = client.get("/api/v1/users/ledger", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["money"] == 255
+    totals = {(t["source"], t["direction"]): (t["totalAmount"], t["txCount"]) for t in data["totals"]}
+    assert totals == {
+        ("test", "IN"): (305, 3),
+        ("test", "OUT"): (-50, 1),
+        ("minigame", "IN"): (30, 2),
+        ("care", "OUT"): (-30, 1)
+    }
+
+# 거래 내역 내보내기 테스트(/users/transactions/export)
+def test_export_transactions(client, db_session):
+    import csv
+    import io
+    import json
+
+    user = User(userId=uuid4(), createdAt=datetime.now(KST), money=0)
+    db_session.add(user)
+    db_session.commit()
+    headers = {"user-id": str(user.userId)}
+
+    for amount in (100, -40, 15):
+        client.post("/api/v1/users/transactions", json={"amount": amount, "source": "test"}, headers=headers)
+
+    response = client.get("/api/v1/users/transactions/export", headers=headers)
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["amount"] for row in rows] == [100, -40, 15]
+    assert [row["currentMoney"] for row in rows] == [100, 60, 75]
+    assert rows[1]["direction"] == "OUT"
+
+    response = client.get("/api/v1/users/transactions/export", params={"format": "csv"}, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["currentMoney"] for row in rows] == ["100", "60", "75"]
+
+    response = client.get("/api/v1/users/transactions/export", headers={"user-id": str(uuid4())})
+    assert response.status_code == 404
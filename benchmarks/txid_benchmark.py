@@ -0,0 +1,90 @@
+# benchmarks/txid_benchmark.py
+# txId 생성기 처리량 및 멀티 프로세스 충돌 검사
+#
+# 실행 예시 (DB 불필요)
+#   python -m benchmarks.txid_benchmark --processes 8 --ids-per-process 2000000
+import argparse
+import multiprocessing
+import time
+from array import array
+import numpy as np
+
+from app.core.idgen import SnowflakeIdGenerator, TimestampIdGenerator, MAX_WORKER_ID, TX_ID_LENGTH
+
+
+def generate(worker_id: int, count: int, as_string: bool):
+    # 워커 프로세스 하나에서 count개 생성 (생성 시간만 측정)
+    generator = SnowflakeIdGenerator(worker_id)
+    ids = array("Q", bytes(8 * count))
+
+    start = time.perf_counter()
+    if as_string:
+        next_id = generator.next_id
+        for i in range(count):
+            ids[i] = int(next_id())
+    else:
+        next_int = generator.next_int
+        for i in range(count):
+            ids[i] = next_int()
+    elapsed = time.perf_counter() - start
+
+    return worker_id, elapsed, ids.tobytes()
+
+
+def timestamp_collisions(count: int) -> int:
+    # 기존 마이크로초 방식의 단일 프로세스 충돌 수 (비교용)
+    generator = TimestampIdGenerator()
+    ids = [generator.next_id() for _ in range(count)]
+    return count - len(set(ids))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="txId 생성기 벤치마크")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--ids-per-process", type=int, default=1_000_000)
+    parser.add_argument("--string", action="store_true", help="문자열 txId(next_id) 생성 속도 측정")
+    args = parser.parse_args()
+
+    if args.processes > MAX_WORKER_ID + 1:
+        raise SystemExit(f"--processes는 최대 {MAX_WORKER_ID + 1}까지 가능합니다.")
+
+    ctx = multiprocessing.get_context("spawn")
+    wall_start = time.perf_counter()
+    with ctx.Pool(args.processes) as pool:
+        results = pool.starmap(
+            generate,
+            [(worker_id, args.ids_per_process, args.string) for worker_id in range(args.processes)]
+        )
+    wall_elapsed = time.perf_counter() - wall_start
+
+    per_worker = []
+    all_ids = []
+    for worker_id, elapsed, raw in sorted(results):
+        ids = np.frombuffer(raw, dtype=np.uint64)
+        monotonic = bool(np.all(np.diff(ids) > 0))
+        per_worker.append((worker_id, elapsed, monotonic))
+        all_ids.append(ids)
+
+    merged = np.concatenate(all_ids)
+    collisions = len(merged) - len(np.unique(merged))
+    max_length = len(str(int(merged.max())))
+
+    total = len(merged)
+    generation_time = max(elapsed for _, elapsed, _ in per_worker)
+    print(f"{'worker':>6} {'ids/sec':>14} {'monotonic':>10}")
+    for worker_id, elapsed, monotonic in per_worker:
+        print(f"{worker_id:>6} {args.ids_per_process / elapsed:>14,.0f} {str(monotonic):>10}")
+
+    print(f"\ntotal ids           : {total:,}")
+    print(f"aggregate ids/sec   : {total / generation_time:,.0f} (generation), {total / wall_elapsed:,.0f} (wall incl. spawn)")
+    print(f"collisions          : {collisions}")
+    print(f"max digits          : {max_length} (txId는 {TX_ID_LENGTH}자리로 0 채움, String(20))")
+    print(f"legacy collisions   : {timestamp_collisions(min(args.ids_per_process, 1_000_000))} "
+          f"(기존 마이크로초 방식, 단일 프로세스)")
+
+    if collisions or not all(monotonic for _, _, monotonic in per_worker):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()